@@ -0,0 +1,71 @@
+"""
+Measures many concurrent small-object reads with AsyncGCPStorage against a local fake GCS server.
+
+Usage:
+    python -m benchmarks.bench_async_reads --objects 1000 --concurrency 64
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.fake_gcs import FakeGCSServer
+from google_cloud_components.async_storage import AsyncGCPStorage
+from google_cloud_components.cloud_storage import GCPStorage
+
+
+async def read_all(gcs, names):
+    """Reads every object concurrently and returns the total number of bytes."""
+    payloads = await asyncio.gather(*(gcs.download_blob("bench", name) for name in names))
+    return sum(len(payload) for payload in payloads)
+
+
+def run(objects, size, concurrency):
+    """Returns wall time and throughput for async reads and for a sequential sync baseline."""
+    with FakeGCSServer() as server, tempfile.TemporaryDirectory() as workdir:
+        credentials = server.write_credentials(os.path.join(workdir, "credentials.json"))
+        server.create_bucket("bench")
+        names = [f"small/{index:06d}.json" for index in range(objects)]
+        for name in names:
+            server.put_object("bench", name, os.urandom(size))
+
+        async def timed():
+            async with AsyncGCPStorage(
+                credentials, api_endpoint=server.endpoint, max_concurrency=concurrency
+            ) as gcs:
+                await gcs.download_blob("bench", names[0])  # warm the token and the pool
+                started = time.perf_counter()
+                total = await read_all(gcs, names)
+                return time.perf_counter() - started, total
+
+        async_seconds, total = asyncio.run(timed())
+
+        storage = GCPStorage(credentials, api_endpoint=server.endpoint)
+        bucket = storage.storage_client.bucket("bench")
+        bucket.blob(names[0]).download_as_bytes()
+        started = time.perf_counter()
+        for name in names:
+            bucket.blob(name).download_as_bytes()
+        sync_seconds = time.perf_counter() - started
+
+    return {
+        "objects": objects,
+        "object_bytes": size,
+        "concurrency": concurrency,
+        "bytes_read": total,
+        "async_seconds": round(async_seconds, 4),
+        "async_objects_per_sec": round(objects / async_seconds, 1),
+        "sync_sequential_seconds": round(sync_seconds, 4),
+        "sync_objects_per_sec": round(objects / sync_seconds, 1),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=1000)
+    parser.add_argument("--size", type=int, default=1024, help="bytes per object")
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+    print(json.dumps(run(args.objects, args.size, args.concurrency), indent=2))
@@ -0,0 +1,95 @@
+"""
+Measures the per-call cost of GCPStorage's console and log output.
+
+Three comparisons, all against a local fake GCS server:
+
+* a log call whose level is disabled, written as an f-string (formatted anyway)
+  and as a lazy %-style call (never formatted);
+* the per-object body of ``list_blobs`` in its old form (f-string INFO log line
+  plus ``print``) versus the current one in quiet mode (lazy DEBUG line, no print);
+* end-to-end ``list_blobs`` calls with and without quiet mode.
+
+Usage:
+    python -m benchmarks.bench_call_overhead --objects 2000 --calls 200000
+"""
+import argparse
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from benchmarks.fake_gcs import FakeGCSServer
+from google_cloud_components.cloud_storage import GCPStorage
+
+
+def per_call_ns(func, calls, repeat=3):
+    """Returns the best per-call time of ``func`` in nanoseconds over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter_ns() - started) / calls)
+    return round(best, 1)
+
+
+def run(objects, calls):
+    """Runs the three comparisons and returns the timings."""
+    results = {"objects": objects, "calls": calls}
+    bucket_name, blob_name, size = "bench", "json/2019-04-28.json", 123456
+
+    logger = logging.getLogger("benchmarks.call_overhead")
+    logger.propagate = False
+    logger.setLevel(logging.WARNING)
+    results["disabled_log_call_ns"] = {
+        "fstring": per_call_ns(
+            lambda: logger.info(f"Downloaded '{blob_name}' ({size} bytes) from bucket '{bucket_name}'."), calls
+        ),
+        "lazy": per_call_ns(
+            lambda: logger.info("Downloaded '%s' (%s bytes) from bucket '%s'.", blob_name, size, bucket_name), calls
+        ),
+    }
+
+    with FakeGCSServer() as server, tempfile.TemporaryDirectory() as workdir, \
+            open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        credentials = server.write_credentials(os.path.join(workdir, "credentials.json"))
+        server.create_bucket(bucket_name)
+        for index in range(objects):
+            server.put_object(bucket_name, f"data/part-{index:06d}.json", b"{}\n")
+
+        verbose = GCPStorage(credentials, api_endpoint=server.endpoint)
+        quiet = GCPStorage(credentials, api_endpoint=server.endpoint, quiet=True)
+        names = [record["name"] for record in quiet.iter_blobs(bucket_name)]
+        storage_logger = quiet.logger
+        record_loops = max(1, calls // max(1, len(names)))
+
+        def legacy_body():
+            for name in names:
+                storage_logger.info(f"- {name}")
+                print(f"- {name}")
+
+        def quiet_body():
+            for name in names:
+                storage_logger.debug("- %s", name)
+                quiet._echo("- %s", name)
+
+        results["per_object_ns"] = {
+            "legacy_print_and_log": round(per_call_ns(legacy_body, record_loops) / len(names), 1),
+            "quiet_lazy_log": round(per_call_ns(quiet_body, record_loops) / len(names), 1),
+        }
+
+        results["list_blobs_ms"] = {
+            "verbose": round(per_call_ns(lambda: verbose.list_blobs(bucket_name), 1) / 1e6, 2),
+            "quiet": round(per_call_ns(lambda: quiet.list_blobs(bucket_name), 1) / 1e6, 2),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=2000)
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.objects, args.calls), indent=2))
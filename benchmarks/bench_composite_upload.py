@@ -0,0 +1,54 @@
+"""
+Compares single-stream and parallel composite uploads against a local fake GCS server.
+
+Usage:
+    python -m benchmarks.bench_composite_upload --size-mb 64 --parts 8
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.fake_gcs import FakeGCSServer
+from google_cloud_components.cloud_storage import GCPStorage
+
+
+def run(size_mb, parts, repeat):
+    """Runs both upload modes ``repeat`` times and returns the best wall time for each."""
+    with FakeGCSServer() as server, tempfile.TemporaryDirectory() as workdir:
+        credentials = server.write_credentials(os.path.join(workdir, "credentials.json"))
+        server.create_bucket("bench")
+        source = os.path.join(workdir, "payload.bin")
+        with open(source, "wb") as handle:
+            handle.write(os.urandom(size_mb * 1024 * 1024))
+
+        storage = GCPStorage(credentials, api_endpoint=server.endpoint)
+        bucket = storage.storage_client.bucket("bench")
+
+        results = {"size_mb": size_mb, "parts": parts}
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            bucket.blob("single.bin").upload_from_filename(source)
+            best = min(best, time.perf_counter() - started)
+        results["single_stream_seconds"] = round(best, 4)
+
+        best = float("inf")
+        for _ in range(repeat):
+            result = storage.upload_composite("bench", source, "composite.bin", parts=parts)
+            if result["status"] != "uploaded":
+                raise RuntimeError(result["error"])
+            best = min(best, result["elapsed_seconds"])
+        results["composite_seconds"] = round(best, 4)
+        results["speedup"] = round(results["single_stream_seconds"] / results["composite_seconds"], 2)
+        return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--parts", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(run(args.size_mb, args.parts, args.repeat), indent=2))
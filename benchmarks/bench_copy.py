@@ -0,0 +1,81 @@
+"""
+Compares copying a prefix between buckets by downloading and re-uploading every
+object versus ``copy_prefix`` (server-side rewrites), against a local fake GCS
+server with injected latency and bandwidth.
+
+Also reports how closely ``max_ops_per_sec`` holds the achieved call rate, and the
+cost of resuming a copy whose checkpoint says most objects are already done.
+
+Usage:
+    python -m benchmarks.bench_copy --objects 500 --size-kb 256 --workers 16 --latency-ms 20
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.fake_gcs import FakeGCSServer
+from google_cloud_components.cloud_storage import GCPStorage
+from google_cloud_components.transfer import run_bounded
+
+
+def run(objects, size_kb, workers, latency_ms, bandwidth_mbps, ops_per_sec):
+    """Copies ``objects`` objects of ``size_kb`` KiB each way and returns the timings."""
+    results = {"objects": objects, "size_kb": size_kb, "workers": workers, "latency_ms": latency_ms}
+    bandwidth = bandwidth_mbps * 1024 * 1024 / 8 if bandwidth_mbps else None
+    with FakeGCSServer(bandwidth=bandwidth) as server, tempfile.TemporaryDirectory() as workdir:
+        credentials = server.write_credentials(os.path.join(workdir, "credentials.json"))
+        server.create_bucket("source")
+        server.create_bucket("target")
+        server.put_objects("source", (f"json/{index:06d}.json" for index in range(objects)), os.urandom(size_kb * 1024))
+        storage = GCPStorage(
+            credentials, api_endpoint=server.endpoint, quiet=True, checkpoint_dir=os.path.join(workdir, "checkpoints")
+        )
+        server.latency = latency_ms / 1000
+        target = storage.storage_client.bucket("target")
+
+        def download_and_upload(name):
+            target.blob(f"client/{name}").upload_from_string(storage.read_blob("source", name))
+
+        started = time.perf_counter()
+        names = [record["name"] for record in storage.iter_blobs("source", prefix="json/") if record["kind"] == "blob"]
+        list(run_bounded(download_and_upload, names, max_workers=workers))
+        results["download_upload_seconds"] = round(time.perf_counter() - started, 3)
+
+        report = storage.copy_prefix("source", "json/", "target", "rewrite/", max_workers=workers)
+        results["copy_prefix_seconds"] = report["summary"]["elapsed_seconds"]
+        results["copy_prefix_failed"] = report["summary"]["failed"]
+        results["speedup"] = round(results["download_upload_seconds"] / results["copy_prefix_seconds"], 2)
+
+        report = storage.copy_prefix(
+            "source", "json/", "target", "limited/", max_workers=workers, max_ops_per_sec=ops_per_sec
+        )
+        results["ops_per_sec_limit"] = ops_per_sec
+        results["ops_per_sec_achieved"] = round(report["summary"]["rewrites"] / report["summary"]["elapsed_seconds"], 2)
+
+        # Fail one rewrite in ten, then rerun: the second run only redoes the failures.
+        server.inject_failure("POST storage", status=403, count=max(1, objects // 10), skip=objects // 2)
+        first = storage.copy_prefix("source", "json/", "target", "resumed/", max_workers=workers)
+        second = storage.copy_prefix("source", "json/", "target", "resumed/", max_workers=workers)
+        results["resume"] = {
+            "first_failed": first["summary"]["failed"],
+            "second_skipped": second["summary"]["skipped"],
+            "second_copied": second["summary"]["copied"],
+            "second_seconds": second["summary"]["elapsed_seconds"],
+        }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=500)
+    parser.add_argument("--size-kb", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--bandwidth-mbps", type=float, default=200.0)
+    parser.add_argument("--ops-per-sec", type=float, default=100.0)
+    args = parser.parse_args()
+    print(json.dumps(run(
+        args.objects, args.size_kb, args.workers, args.latency_ms, args.bandwidth_mbps, args.ops_per_sec
+    ), indent=2))
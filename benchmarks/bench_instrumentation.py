@@ -0,0 +1,71 @@
+"""
+Measures the cost of GCPStorage instrumentation.
+
+Two comparisons:
+
+* the bare overhead of the ``instrumented`` wrapper around a no-op method, without a
+  collector, with a :class:`StorageMetrics` collector and with a collector plus a
+  (no-op) span factory;
+* end-to-end ``get_blob_metadata`` calls against a local fake GCS server with and
+  without a collector.
+
+Usage:
+    python -m benchmarks.bench_instrumentation --calls 200000 --requests 500
+"""
+import argparse
+import contextlib
+import json
+import os
+import tempfile
+
+from benchmarks.bench_call_overhead import per_call_ns
+from benchmarks.fake_gcs import FakeGCSServer
+from google_cloud_components.cloud_storage import GCPStorage
+from google_cloud_components.metrics import StorageMetrics, instrumented
+
+
+class _Target:
+    """Stand-in for GCPStorage with one instrumented no-op method."""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    @instrumented("noop")
+    def noop(self, bucket_name):
+        return None
+
+
+@contextlib.contextmanager
+def _null_span(name, attributes):
+    yield None
+
+
+def run(calls, requests):
+    """Runs both comparisons and returns the timings."""
+    results = {"calls": calls, "requests": requests}
+    targets = {
+        "disabled": _Target(None),
+        "metrics": _Target(StorageMetrics()),
+        "metrics_and_spans": _Target(StorageMetrics(span_factory=_null_span)),
+    }
+    results["wrapper_ns"] = {name: per_call_ns(lambda: target.noop("bench"), calls) for name, target in targets.items()}
+
+    with FakeGCSServer() as server, tempfile.TemporaryDirectory() as workdir:
+        credentials = server.write_credentials(os.path.join(workdir, "credentials.json"))
+        server.create_bucket("bench")
+        server.put_object("bench", "data/object.json", b"{}\n")
+        plain = GCPStorage(credentials, api_endpoint=server.endpoint, quiet=True)
+        measured = GCPStorage(credentials, api_endpoint=server.endpoint, quiet=True, metrics=StorageMetrics())
+        results["get_blob_metadata_us"] = {
+            "disabled": round(per_call_ns(lambda: plain.get_blob_metadata("bench", "data/object.json"), requests) / 1e3, 1),
+            "metrics": round(per_call_ns(lambda: measured.get_blob_metadata("bench", "data/object.json"), requests) / 1e3, 1),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    print(json.dumps(run(args.calls, args.requests), indent=2))
@@ -0,0 +1,71 @@
+"""
+Compares answering "how many objects and bytes under a prefix" by listing versus
+from a BucketInventory, against a local fake GCS server.
+
+Reports the one-off build time, the per-query time of both approaches, the cost of
+an incremental refresh after new objects were appended and of reopening the file.
+
+Usage:
+    python -m benchmarks.bench_inventory --objects 100000 --queries 1000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.fake_gcs import FakeGCSServer
+from google_cloud_components.cloud_storage import GCPStorage
+from google_cloud_components.inventory import BucketInventory
+
+
+def run(objects, queries):
+    """Builds an inventory of ``objects`` names and times prefix queries both ways."""
+    results = {"objects": objects, "queries": queries}
+    folders = max(1, objects // 1000)
+    with FakeGCSServer() as server, tempfile.TemporaryDirectory() as workdir:
+        credentials = server.write_credentials(os.path.join(workdir, "credentials.json"))
+        server.create_bucket("bench")
+        server.put_objects(
+            "bench", (f"json/2019-{index // 1000:05d}/{index:08d}.json" for index in range(objects)), b"{}\n"
+        )
+        storage = GCPStorage(credentials, api_endpoint=server.endpoint, quiet=True)
+        path = os.path.join(workdir, "bench.inventory")
+
+        started = time.perf_counter()
+        inventory = BucketInventory.build(storage, "bench", path)
+        results["build_seconds"] = round(time.perf_counter() - started, 3)
+        results["file_bytes"] = os.path.getsize(path)
+
+        started = time.perf_counter()
+        listed = sum(record["size"] for record in storage.iter_blobs("bench", prefix="json/2019-00000/"))
+        results["listing_query_ms"] = round((time.perf_counter() - started) * 1000, 3)
+
+        started = time.perf_counter()
+        for index in range(queries):
+            totals = inventory.du(f"json/2019-{index % folders:05d}/")
+        results["inventory_query_us"] = round((time.perf_counter() - started) / queries * 1e6, 2)
+        if inventory.du("json/2019-00000/")["bytes"] != listed or totals["objects"] == 0:
+            raise RuntimeError("Inventory and listing disagree.")
+
+        started = time.perf_counter()
+        inventory.du("json/2019-*")
+        results["inventory_glob_all_us"] = round((time.perf_counter() - started) * 1e6, 2)
+
+        server.put_objects("bench", (f"json/2020-00000/{index:08d}.json" for index in range(1000)), b"{}\n")
+        refresh = inventory.refresh(storage)
+        results["refresh_1000_new_seconds"] = refresh["elapsed_seconds"]
+        inventory.close()
+
+        started = time.perf_counter()
+        BucketInventory(path).close()
+        results["open_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--objects", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.objects, args.queries), indent=2))
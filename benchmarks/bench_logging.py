@@ -0,0 +1,111 @@
+"""
+Measures logging throughput with many threads: synchronous file handler vs. queued writer.
+
+Each mode has ``--threads`` threads log ``--records`` INFO records apiece. ``caller_seconds``
+is how long the logging threads were busy; ``total_seconds`` also includes draining the
+queue to disk. ``written`` counts lines in the resulting file (including the drop
+warnings) and ``dropped`` the records discarded by the drop policy.
+
+``--flush-latency-us`` adds a sleep to every flush of the log file, modelling a slow or
+contended disk (or a network filesystem). The synchronous handler flushes after every
+record while holding its lock; the queued writer flushes once per drained burst.
+
+Usage:
+    python -m benchmarks.bench_logging --threads 16 --records 20000 --flush-latency-us 200
+"""
+import argparse
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from utils import logger as logger_module
+from utils.logger import Logger
+
+MODES = {
+    "sync": {},
+    "queued_block": {"queued": True, "overflow": "block"},
+    "queued_drop": {"queued": True, "overflow": "drop", "queue_size": 1000},
+    "queued_block_json": {"queued": True, "overflow": "block", "json_lines": True},
+}
+
+
+def slow_down(handler, method, latency):
+    """Makes ``handler.<method>`` sleep ``latency`` seconds after doing its work."""
+    original = getattr(handler, method)
+
+    def slow(*args):
+        original(*args)
+        time.sleep(latency)
+
+    setattr(handler, method, slow)
+
+
+def run_mode(mode, options, workdir, threads, records, flush_latency):
+    """Logs from ``threads`` threads in one mode and returns its timings."""
+    name = f"benchmarks.logging.{mode}.{flush_latency}"
+    path = os.path.join(workdir, f"{mode}-{flush_latency}.log")
+    wrapper = Logger(name, log_file=path, **options)
+    log = wrapper.get_logger()
+    log.propagate = False
+    if flush_latency:
+        if options.get("queued"):
+            slow_down(logger_module._LISTENERS[name][0].handlers[0], "flush_batch", flush_latency)
+        else:
+            slow_down(log.handlers[0], "flush", flush_latency)
+    barrier = threading.Barrier(threads + 1)
+
+    def work(index):
+        barrier.wait()
+        for number in range(records):
+            log.info("worker %d wrote record %d of bucket '%s'", index, number, "bench")
+
+    workers = [threading.Thread(target=work, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    caller_seconds = time.perf_counter() - started
+    stats = wrapper.stats() or {"dropped": 0}
+    logger_module.shutdown()
+    for handler in list(log.handlers):
+        handler.close()
+        log.removeHandler(handler)
+    total_seconds = time.perf_counter() - started
+
+    with open(path, "rb") as handle:
+        written = sum(1 for _ in handle)
+    total = threads * records
+    return {
+        "caller_seconds": round(caller_seconds, 4),
+        "total_seconds": round(total_seconds, 4),
+        "caller_records_per_sec": round(total / caller_seconds),
+        "written": written,
+        "dropped": stats["dropped"],
+    }
+
+
+def run(threads, records, flush_latency_us):
+    """Runs every mode on a fast disk and with the given flush latency, keyed by mode."""
+    results = {"threads": threads, "records_per_thread": records}
+    with tempfile.TemporaryDirectory() as workdir:
+        for latency in sorted({0, flush_latency_us}):
+            key = "local_disk" if not latency else f"flush_latency_{latency}us"
+            results[key] = {
+                mode: run_mode(mode, options, workdir, threads, records, latency / 1e6)
+                for mode, options in MODES.items()
+            }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--flush-latency-us", type=int, default=200)
+    args = parser.parse_args()
+    print(json.dumps(run(args.threads, args.records, args.flush_latency_us), indent=2))
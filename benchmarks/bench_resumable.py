@@ -0,0 +1,78 @@
+"""
+Measures how much work resumable transfers save when a transfer is cut off partway.
+
+A file is uploaded and then downloaded while the fake GCS server drops the
+connection (or answers 503) partway through. The first attempt is made with no
+retries so it fails like a killed process would; a fresh GCPStorage then resumes
+from the on-disk checkpoint. The report compares the bytes re-sent after the
+interruption with a full restart.
+
+Usage:
+    python -m benchmarks.bench_resumable --size-mb 64 --cut-at 0.9
+"""
+import argparse
+import json
+import os
+import tempfile
+
+from benchmarks.fake_gcs import FakeGCSServer
+from google_cloud_components.cloud_storage import GCPStorage
+
+CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def run(size_mb, cut_at):
+    """Interrupts an upload and a download at ``cut_at`` of the file and resumes both."""
+    size = size_mb * 1024 * 1024
+    cut = int(size * cut_at)
+    with FakeGCSServer() as server, tempfile.TemporaryDirectory() as workdir:
+        credentials = server.write_credentials(os.path.join(workdir, "credentials.json"))
+        server.create_bucket("bench")
+        source = os.path.join(workdir, "payload.bin")
+        with open(source, "wb") as handle:
+            handle.write(os.urandom(size))
+        checkpoints = os.path.join(workdir, "checkpoints")
+
+        # Chunks before the cut go through; the chunk containing it keeps the bytes
+        # up to the cut and then fails.
+        server.inject_failure("PUT upload", status=503, after_bytes=cut % CHUNK_SIZE, skip=cut // CHUNK_SIZE)
+        first = GCPStorage(credentials, api_endpoint=server.endpoint, checkpoint_dir=checkpoints)
+        interrupted = first.upload_resumable("bench", source, "payload.bin", chunk_size=CHUNK_SIZE, retries=0)
+        second = GCPStorage(credentials, api_endpoint=server.endpoint, checkpoint_dir=checkpoints,
+                            shared_client=False)
+        upload = second.upload_resumable("bench", source, "payload.bin", chunk_size=CHUNK_SIZE)
+
+        destination = os.path.join(workdir, "download.bin")
+        server.inject_failure("GET download", status=200, after_bytes=cut)
+        first.download_resumable("bench", "payload.bin", destination, retries=0)
+        download = second.download_resumable("bench", "payload.bin", destination)
+        for result in (upload, download):
+            if result["status"] not in ("uploaded", "downloaded"):
+                raise RuntimeError(result["error"])
+
+        return {
+            "size_mb": size_mb,
+            "cut_at_bytes": cut,
+            "upload": {
+                "interrupted_status": interrupted["status"],
+                "resumed_from": upload["resumed_from"],
+                "bytes_resent": size - upload["resumed_from"],
+                "saved_vs_restart": round(upload["resumed_from"] / size, 3),
+                "resume_seconds": round(upload["elapsed_seconds"], 4),
+            },
+            "download": {
+                "resumed_from": download["resumed_from"],
+                "bytes_refetched": size - download["resumed_from"],
+                "saved_vs_restart": round(download["resumed_from"] / size, 3),
+                "resume_seconds": round(download["elapsed_seconds"], 4),
+            },
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--cut-at", type=float, default=0.9,
+                        help="Fraction of the file transferred before the connection drops.")
+    args = parser.parse_args()
+    print(json.dumps(run(args.size_mb, args.cut_at), indent=2))
@@ -0,0 +1,91 @@
+"""
+Measures cold-start cost: importing GCPStorage, constructing it and making the first call.
+
+Every sample runs in a fresh interpreter (as a CLI invocation or a serverless cold
+start would), against a fake GCS server in this process. ``lazy`` is the default
+mode (SDK modules, credentials and client loaded on first use); ``eager`` passes
+``lazy=False`` and so pays for the credentials and client in the constructor.
+``interpreter_ms`` is the cost of starting Python itself, for reference.
+The reported values are medians over ``--runs`` interpreters.
+
+Usage:
+    python -m benchmarks.bench_startup --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.fake_gcs import FakeGCSServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+from google_cloud_components.cloud_storage import GCPStorage
+imported = time.perf_counter()
+gcs = GCPStorage(sys.argv[1], api_endpoint=sys.argv[2], quiet=True, lazy=sys.argv[3] == "lazy")
+constructed = time.perf_counter()
+gcs.get_bucket_metadata("bench")
+called = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "construct_ms": (constructed - imported) * 1000,
+    "first_call_ms": (called - constructed) * 1000,
+}))
+"""
+
+# Same as CHILD, but stops before the first call to check which SDK modules were imported.
+PROBE = """
+import json, sys
+from google_cloud_components.cloud_storage import GCPStorage
+GCPStorage(sys.argv[1], api_endpoint=sys.argv[2], quiet=True, lazy=sys.argv[3] == "lazy")
+heavy = ("google.cloud.storage", "google.api_core.exceptions", "google.oauth2.service_account", "requests")
+print(json.dumps(sorted(name for name in heavy if name in sys.modules)))
+"""
+
+
+def run_child(script, *args):
+    """Runs ``script`` in a fresh interpreter from the repository root and returns its JSON output."""
+    output = subprocess.run(
+        [sys.executable, "-c", script, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(runs):
+    """Samples every mode ``runs`` times and returns the medians."""
+    results = {"runs": runs}
+    interpreter = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        interpreter.append((time.perf_counter() - started) * 1000)
+    results["interpreter_ms"] = round(statistics.median(interpreter), 2)
+
+    with FakeGCSServer() as server, tempfile.TemporaryDirectory() as workdir:
+        credentials = server.write_credentials(os.path.join(workdir, "credentials.json"))
+        server.create_bucket("bench")
+        for mode in ("lazy", "eager"):
+            samples = [run_child(CHILD, credentials, server.endpoint, mode) for _ in range(runs)]
+            results[mode] = {
+                key: round(statistics.median(sample[key] for sample in samples), 2)
+                for key in ("import_ms", "construct_ms", "first_call_ms")
+            }
+            results[mode]["import_and_construct_ms"] = round(
+                results[mode]["import_ms"] + results[mode]["construct_ms"], 2
+            )
+            results[mode]["sdk_modules_before_first_call"] = run_child(PROBE, credentials, server.endpoint, mode)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    print(json.dumps(run(args.runs), indent=2))
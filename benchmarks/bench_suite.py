@@ -0,0 +1,242 @@
+"""
+Runs the GCPStorage regression benchmark suite and writes machine-readable results.
+
+Every scenario runs against an in-process fake GCS server (no network, no real
+credentials) with optional injected per-request latency and per-connection bandwidth:
+
+* ``small_upload`` / ``small_download``: many small objects, one call each;
+* ``large_upload`` / ``large_download``: one large object through ``create_blob``
+  and ``download_blob``;
+* ``listing``: iterating a bucket of ``--list-objects`` names (10^5 by default;
+  10^6 takes a few GB of memory for the fake server);
+* ``metadata``: single ``get_blob_metadata`` lookups and one batched
+  ``get_blobs_metadata`` call.
+
+Results carry the commit, interpreter and settings they were measured with. Write
+them with ``--output`` and compare two commits with ``--baseline``, which adds the
+throughput ratio (current / baseline) of every scenario.
+
+Usage:
+    python -m benchmarks.bench_suite --output results.json
+    python -m benchmarks.bench_suite --latency-ms 20 --bandwidth-mbps 200 --baseline previous.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from benchmarks.fake_gcs import FakeGCSServer
+from google_cloud_components.cloud_storage import GCPStorage
+from google_cloud_components.results import StorageError, StorageResult
+
+SCENARIOS = ("small_upload", "small_download", "large_upload", "large_download", "listing", "metadata")
+BUCKET = "bench"
+
+
+def percentiles(samples):
+    """Returns the p50/p95/p99/max of ``samples`` (seconds) in milliseconds."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+
+    def pick(fraction):
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000, 3)
+
+    return {"p50_ms": pick(0.50), "p95_ms": pick(0.95), "p99_ms": pick(0.99), "max_ms": round(ordered[-1] * 1000, 3)}
+
+
+def summary(operations, total_bytes, seconds, samples=None):
+    """Builds the common result record of a scenario."""
+    result = {
+        "operations": operations,
+        "bytes": total_bytes,
+        "seconds": round(seconds, 4),
+        "ops_per_sec": round(operations / seconds, 1) if seconds else None,
+        "mb_per_sec": round(total_bytes / 1024 / 1024 / seconds, 2) if seconds and total_bytes else None,
+    }
+    if samples:
+        result["latency"] = percentiles(samples)
+    return result
+
+
+def timed(calls):
+    """Runs every callable in ``calls`` and returns ``(total_seconds, per_call_seconds)``."""
+    samples = []
+    started = time.perf_counter()
+    for call in calls:
+        call_started = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - call_started)
+    return time.perf_counter() - started, samples
+
+
+def check(result):
+    """Raises if a GCPStorage call reported a failure, so a broken run cannot look fast."""
+    failed = isinstance(result, (StorageError, StorageResult)) and not result
+    if failed or (isinstance(result, dict) and result.get("status") == "failed"):
+        raise RuntimeError(f"Benchmark operation failed: {result!r}")
+    return result
+
+
+def bench_small_upload(storage, server, workdir, config):
+    count, size = config["small_objects"], config["small_size_kb"] * 1024
+    source = os.path.join(workdir, "small.bin")
+    with open(source, "wb") as handle:
+        handle.write(os.urandom(size))
+    seconds, samples = timed(
+        (lambda index=index: check(storage.create_blob(BUCKET, source, f"small/{index:06d}.bin")))
+        for index in range(count)
+    )
+    return summary(count, count * size, seconds, samples)
+
+
+def bench_small_download(storage, server, workdir, config):
+    count, size = config["small_objects"], config["small_size_kb"] * 1024
+    server.put_objects(BUCKET, (f"small/{index:06d}.bin" for index in range(count)), os.urandom(size))
+    seconds, samples = timed(
+        (lambda index=index: check(storage.read_blob(BUCKET, f"small/{index:06d}.bin")))
+        for index in range(count)
+    )
+    return summary(count, count * size, seconds, samples)
+
+
+def bench_large_upload(storage, server, workdir, config):
+    size = config["large_size_mb"] * 1024 * 1024
+    source = os.path.join(workdir, "large.bin")
+    with open(source, "wb") as handle:
+        handle.write(os.urandom(size))
+    best = float("inf")
+    for _ in range(config["repeat"]):
+        seconds, _ = timed([lambda: check(storage.create_blob(BUCKET, source, "large/object.bin"))])
+        best = min(best, seconds)
+    return summary(1, size, best)
+
+
+def bench_large_download(storage, server, workdir, config):
+    size = config["large_size_mb"] * 1024 * 1024
+    server.put_object(BUCKET, "large/download.bin", os.urandom(size))
+    destination = os.path.join(workdir, "large.out")
+    best = float("inf")
+    for _ in range(config["repeat"]):
+        seconds, _ = timed([lambda: check(storage.download_blob(BUCKET, "large/download.bin", destination))])
+        best = min(best, seconds)
+    return summary(1, size, best)
+
+
+def bench_listing(storage, server, workdir, config):
+    count = config["list_objects"]
+    server.create_bucket("listing")
+    server.put_objects("listing", (f"logs/{index // 1000:04d}/{index:07d}.json" for index in range(count)))
+    started = time.perf_counter()
+    listed = sum(1 for _ in storage.iter_blobs("listing", page_size=1000))
+    seconds = time.perf_counter() - started
+    if listed != count:
+        raise RuntimeError(f"Listed {listed} of {count} objects.")
+    result = summary(listed, 0, seconds)
+    result["pages"] = -(-count // 1000)
+    return result
+
+
+def bench_metadata(storage, server, workdir, config):
+    count = config["metadata_lookups"]
+    names = [f"meta/{index:06d}.json" for index in range(count)]
+    server.put_objects(BUCKET, names, b"{}\n")
+    seconds, samples = timed((lambda name=name: check(storage.get_blob_metadata(BUCKET, name))) for name in names)
+    result = {"single": summary(count, 0, seconds, samples)}
+    started = time.perf_counter()
+    report = storage.get_blobs_metadata(BUCKET, names)
+    if report["summary"]["failed"]:
+        raise RuntimeError(f"Batched metadata lookups failed: {report['summary']}")
+    result["batched"] = summary(count, 0, time.perf_counter() - started)
+    return result
+
+
+def environment():
+    """Returns where and on what the suite ran."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(results, baseline):
+    """Returns ``{scenario: current / baseline}`` throughput ratios (>1 means faster)."""
+    ratios = {}
+
+    def walk(path, current, previous):
+        if not isinstance(current, dict) or not isinstance(previous, dict):
+            return
+        for key in ("mb_per_sec", "ops_per_sec"):
+            if current.get(key) and previous.get(key):
+                ratios[path] = round(current[key] / previous[key], 3)
+                return
+        for key, value in current.items():
+            walk(f"{path}.{key}", value, previous.get(key))
+
+    for scenario, current in results["scenarios"].items():
+        walk(scenario, current, baseline.get("scenarios", {}).get(scenario))
+    return ratios
+
+
+def run(config, scenarios=SCENARIOS):
+    """Runs the selected scenarios with ``config`` and returns the result document."""
+    bandwidth = config["bandwidth_mbps"] * 1e6 / 8 if config["bandwidth_mbps"] else None
+    results = {"environment": environment(), "config": dict(config), "scenarios": {}}
+    with FakeGCSServer(latency=config["latency_ms"] / 1000, bandwidth=bandwidth) as server, \
+            tempfile.TemporaryDirectory() as workdir:
+        credentials = server.write_credentials(os.path.join(workdir, "credentials.json"))
+        server.create_bucket(BUCKET)
+        storage = GCPStorage(credentials, api_endpoint=server.endpoint, quiet=True)
+        for scenario in scenarios:
+            results["scenarios"][scenario] = globals()[f"bench_{scenario}"](storage, server, workdir, config)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated subset to run.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added to every request.")
+    parser.add_argument("--bandwidth-mbps", type=float, default=0.0, help="Per connection, in Mbit/s; 0 is unlimited.")
+    parser.add_argument("--small-objects", type=int, default=500)
+    parser.add_argument("--small-size-kb", type=int, default=16)
+    parser.add_argument("--large-size-mb", type=int, default=64)
+    parser.add_argument("--list-objects", type=int, default=100000)
+    parser.add_argument("--metadata-lookups", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3, help="Large transfers keep the best of this many runs.")
+    parser.add_argument("--output", help="Also write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Results file of an earlier run to compare against.")
+    args = parser.parse_args()
+
+    selected = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = sorted(set(selected) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"Unknown scenario(s): {', '.join(unknown)}. Choose from {', '.join(SCENARIOS)}.")
+    settings = {
+        key: getattr(args, key)
+        for key in ("latency_ms", "bandwidth_mbps", "small_objects", "small_size_kb", "large_size_mb",
+                    "list_objects", "metadata_lookups", "repeat")
+    }
+    document = run(settings, selected)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            document["vs_baseline"] = compare(document, json.load(handle))
+    text = json.dumps(document, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    print(text)
@@ -0,0 +1,644 @@
+"""
+In-process fake of the Google Cloud Storage JSON API.
+
+Implements just enough of the JSON/upload/download/batch endpoints and the
+OAuth2 token endpoint for GCPStorage to run end to end against it on a box
+with no network and no real credentials. Per-request latency and per-connection
+bandwidth can be injected to model a real network path.
+"""
+import base64
+import bisect
+import hashlib
+import json
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+import google_crc32c
+
+
+def _b64(raw: bytes) -> str:
+    return base64.b64encode(raw).decode("ascii")
+
+
+def _rfc3339(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class _Object:
+    """One stored object generation."""
+    __slots__ = ("bucket", "name", "data", "metadata", "generation", "metageneration", "created",
+                 "component_count", "md5", "crc32c")
+
+    def __init__(self, bucket, name, data, metadata=None, component_count=None, digests=None):
+        self.bucket = bucket
+        self.name = name
+        self.data = bytes(data)
+        self.metadata = dict(metadata or {})
+        self.generation = time.time_ns()
+        self.metageneration = 1
+        self.created = time.time()
+        self.component_count = component_count
+        if digests is None:
+            digests = _digests(self.data)
+        self.md5, self.crc32c = digests
+
+    def resource(self, endpoint):
+        quoted = quote(self.name, safe="")
+        res = {
+            "kind": "storage#object",
+            "id": f"{self.bucket}/{self.name}/{self.generation}",
+            "selfLink": f"{endpoint}/storage/v1/b/{self.bucket}/o/{quoted}",
+            "mediaLink": (
+                f"{endpoint}/download/storage/v1/b/{self.bucket}/o/{quoted}"
+                f"?generation={self.generation}&alt=media"
+            ),
+            "name": self.name,
+            "bucket": self.bucket,
+            "generation": str(self.generation),
+            "metageneration": str(self.metageneration),
+            "contentType": self.metadata.get("contentType", "application/octet-stream"),
+            "storageClass": self.metadata.get("storageClass", "STANDARD"),
+            "size": str(len(self.data)),
+            "crc32c": self.crc32c,
+            "etag": f"CL{self.generation}",
+            "timeCreated": _rfc3339(self.created),
+            "updated": _rfc3339(self.created),
+        }
+        if self.component_count is None:
+            res["md5Hash"] = self.md5
+        else:
+            res["componentCount"] = self.component_count
+        for key in ("contentEncoding", "cacheControl", "contentDisposition",
+                    "contentLanguage", "metadata"):
+            if key in self.metadata:
+                res[key] = self.metadata[key]
+        return res
+
+
+def _digests(data):
+    """Returns the base64 ``(md5, crc32c)`` of ``data``."""
+    return _b64(hashlib.md5(data).digest()), _b64(google_crc32c.value(data).to_bytes(4, "big"))
+
+
+_SIGNING_KEY = []
+
+
+def _signing_key():
+    """Returns a PEM RSA key for fake service accounts, generated once per process (it takes a while)."""
+    if not _SIGNING_KEY:
+        import rsa
+
+        _, private_key = rsa.newkeys(1024)
+        _SIGNING_KEY.append(private_key.save_pkcs1().decode("ascii"))
+    return _SIGNING_KEY[0]
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that does not print tracebacks when a client hangs up mid-request."""
+
+    def handle_error(self, request, client_address):
+        pass
+
+
+class FakeGCSServer:
+    """
+    Threaded HTTP server holding buckets and objects in memory.
+
+    Args:
+        host (str): Interface to bind. Defaults to loopback.
+        port (int): Port to bind; 0 picks a free one.
+        latency (float): Seconds added to every request, like a network round trip.
+        bandwidth (float, optional): Bytes per second each connection can move in
+            either direction; request and response bodies are delayed accordingly.
+            Defaults to None (unlimited).
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, bandwidth=None):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.buckets = {}
+        self.lock = threading.Lock()
+        self.uploads = {}
+        self.request_counts = {}
+        self.failures = {}
+        # Number of sub-requests in each batch request received, in arrival order.
+        self.batch_envelopes = []
+        # Requests being handled right now, and the most ever handled at once.
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.token_lifetime = 3600
+        self.token_delay = 0.0
+        # Bytes copied per rewrite call; larger objects need continuation tokens. None copies in one call.
+        self.rewrite_chunk = None
+        self._httpd = _QuietHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def endpoint(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def write_credentials(self, path, project_id="fake-project"):
+        """Write a service-account key file whose token_uri points at this server."""
+        info = {
+            "type": "service_account",
+            "project_id": project_id,
+            "private_key_id": "fake",
+            "private_key": _signing_key(),
+            "client_email": f"bench@{project_id}.iam.gserviceaccount.com",
+            "client_id": "0",
+            "token_uri": f"{self.endpoint}/token",
+        }
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(info, handle)
+        return path
+
+    def create_bucket(self, name):
+        with self.lock:
+            self.buckets.setdefault(
+                name, {"objects": {}, "created": time.time(), "metageneration": 1, "index": None}
+            )
+
+    def put_object(self, bucket, name, data, metadata=None, component_count=None):
+        obj = _Object(bucket, name, data, metadata, component_count)
+        with self.lock:
+            self.buckets[bucket]["objects"][name] = obj
+            self.buckets[bucket]["index"] = None
+        return obj
+
+    def put_objects(self, bucket, names, data=b"", metadata=None):
+        """
+        Stores one object per name, all with the same ``data``, hashing it only once.
+
+        Meant for populating buckets with 10^5-10^6 objects for listing benchmarks.
+        """
+        data = bytes(data)
+        digests = _digests(data)
+        objects = {name: _Object(bucket, name, data, metadata, digests=digests) for name in names}
+        with self.lock:
+            self.buckets[bucket]["objects"].update(objects)
+            self.buckets[bucket]["index"] = None
+        return len(objects)
+
+    def delete_object(self, bucket, name):
+        with self.lock:
+            if self.buckets[bucket]["objects"].pop(name, None) is not None:
+                self.buckets[bucket]["index"] = None
+
+    def sorted_names(self, bucket):
+        """Returns the object names of ``bucket`` in order, sorting only after a change."""
+        with self.lock:
+            entry = self.buckets[bucket]
+            if entry["index"] is None:
+                entry["index"] = sorted(entry["objects"])
+            return entry["index"]
+
+    def inject_failure(self, route, status=503, count=1, after_bytes=None, skip=0):
+        """
+        Make ``count`` requests on ``route`` fail, after letting ``skip`` more through.
+
+        ``route`` uses the ``request_counts`` keys, e.g. ``"PUT upload"`` for resumable
+        chunks or ``"GET download"`` for media downloads; ``"DELETE subrequest"`` and
+        ``"GET subrequest"`` target single sub-requests inside a batch. Without ``after_bytes`` the
+        request is answered with ``status``. With it, a download sends that many bytes
+        and then drops the connection, and a resumable chunk keeps that many bytes
+        before answering with ``status``, like a transfer cut off partway through.
+        """
+        with self.lock:
+            pending = self.failures.setdefault(route, [])
+            pending.extend([None] * skip)
+            pending.extend({"status": status, "after_bytes": after_bytes} for _ in range(count))
+
+    def _take_failure(self, route):
+        with self.lock:
+            pending = self.failures.get(route)
+            return pending.pop(0) if pending else None
+
+    def bucket_resource(self, name):
+        bucket = self.buckets[name]
+        return {
+            "kind": "storage#bucket",
+            "id": name,
+            "name": name,
+            "selfLink": f"{self.endpoint}/storage/v1/b/{name}",
+            "location": "ASIA-SOUTH1",
+            "locationType": "region",
+            "storageClass": "STANDARD",
+            "metageneration": str(bucket["metageneration"]),
+            "timeCreated": _rfc3339(bucket["created"]),
+            "iamConfiguration": {"publicAccessPrevention": "inherited"},
+        }
+
+
+def _make_handler(server):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately; without this, delayed ACKs add ~40 ms per call.
+        disable_nagle_algorithm = True
+        failure = None
+
+        def log_message(self, format, *args):  # noqa: A002 - silence stderr access log
+            pass
+
+        # -- plumbing -------------------------------------------------------
+
+        def _body(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            if not length:
+                return b""
+            body = self.rfile.read(length)
+            self._throttle(len(body))
+            return body
+
+        @staticmethod
+        def _throttle(size):
+            if server.bandwidth and size:
+                time.sleep(size / server.bandwidth)
+
+        def _send(self, status, body=b"", headers=None, content_type="application/json", truncate=None):
+            if isinstance(body, (dict, list)):
+                body = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            if self.command != "HEAD":
+                self._throttle(len(body) if truncate is None else min(truncate, len(body)))
+                if truncate is not None:
+                    # Promise the full body, deliver part of it and hang up.
+                    self.wfile.write(body[:truncate])
+                    self.wfile.flush()
+                    self.close_connection = True
+                    return
+                self.wfile.write(body)
+
+        def _error(self, status, message):
+            self._send(status, {"error": {"code": status, "message": message,
+                                          "errors": [{"message": message}]}})
+
+        def _route(self, method):
+            parts = urlsplit(self.path)
+            query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+            path = parts.path
+            key = f"{method} {path.split('/')[1] if path.count('/') else path}"
+            with server.lock:
+                server.request_counts[key] = server.request_counts.get(key, 0) + 1
+                server.in_flight += 1
+                server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            try:
+                if server.latency:
+                    time.sleep(server.latency)
+                self.failure = server._take_failure(key)
+                if self.failure and self.failure["after_bytes"] is None:
+                    self._body()
+                    return self._error(self.failure["status"], "injected failure")
+                try:
+                    self._dispatch(method, path, query)
+                except KeyError as exc:
+                    self._error(404, f"Not found: {exc}")
+            finally:
+                with server.lock:
+                    server.in_flight -= 1
+
+        def do_GET(self):
+            self._route("GET")
+
+        def do_POST(self):
+            self._route("POST")
+
+        def do_PUT(self):
+            self._route("PUT")
+
+        def do_DELETE(self):
+            self._route("DELETE")
+
+        def do_PATCH(self):
+            self._route("PATCH")
+
+        # -- dispatch -------------------------------------------------------
+
+        def _dispatch(self, method, path, query):
+            segs = [unquote(s) for s in path.strip("/").split("/")]
+            if path == "/token":
+                self._body()
+                if server.token_delay:
+                    time.sleep(server.token_delay)
+                return self._send(200, {"access_token": uuid.uuid4().hex,
+                                        "expires_in": server.token_lifetime, "token_type": "Bearer"})
+            if segs[:2] == ["upload", "storage"]:
+                return self._upload(method, segs[3:], query)
+            if segs[:2] == ["download", "storage"]:
+                return self._download(segs[4], segs[6])
+            if segs[:1] == ["batch"]:
+                return self._batch()
+            if segs[:2] != ["storage", "v1"]:
+                return self._error(404, path)
+            segs = segs[2:]
+            if segs == ["b"]:
+                if method == "GET":
+                    items = [server.bucket_resource(n) for n in sorted(server.buckets)]
+                    return self._send(200, {"kind": "storage#buckets", "items": items})
+                meta = json.loads(self._body() or b"{}")
+                if meta["name"] in server.buckets:
+                    return self._error(409, "bucket exists")
+                server.create_bucket(meta["name"])
+                return self._send(200, server.bucket_resource(meta["name"]))
+            bucket = segs[1]
+            if bucket not in server.buckets:
+                self._body()
+                return self._error(404, f"bucket {bucket}")
+            if len(segs) == 2:
+                if method == "DELETE":
+                    if server.buckets[bucket]["objects"]:
+                        return self._error(409, "bucket not empty")
+                    with server.lock:
+                        del server.buckets[bucket]
+                    return self._send(204, b"")
+                if query.get("ifMetagenerationNotMatch") == str(server.buckets[bucket]["metageneration"]):
+                    return self._send(304, b"")
+                return self._send(200, server.bucket_resource(bucket))
+            if len(segs) == 3:
+                return self._list(bucket, query)
+            name = segs[3]
+            if len(segs) == 5 and segs[4] == "compose":
+                return self._compose(bucket, name)
+            if len(segs) >= 5 and segs[4] in ("rewriteTo", "copyTo"):
+                return self._rewrite(bucket, name, segs[6], segs[8], query)
+            objects = server.buckets[bucket]["objects"]
+            if name not in objects:
+                self._body()
+                return self._error(404, f"object {bucket}/{name}")
+            obj = objects[name]
+            if method == "DELETE":
+                server.delete_object(bucket, name)
+                return self._send(204, b"")
+            if method == "PATCH":
+                patch = json.loads(self._body() or b"{}")
+                obj.metadata.update(patch)
+                obj.metageneration += 1
+                return self._send(200, obj.resource(server.endpoint))
+            if query.get("alt") == "media":
+                return self._download(bucket, name)
+            if query.get("ifGenerationMatch", str(obj.generation)) != str(obj.generation):
+                return self._error(412, "generation mismatch")
+            if query.get("ifMetagenerationNotMatch") == str(obj.metageneration):
+                return self._send(304, b"")
+            return self._send(200, obj.resource(server.endpoint))
+
+        def _list(self, bucket, query):
+            prefix = query.get("prefix", "")
+            delimiter = query.get("delimiter")
+            start = query.get("pageToken") or query.get("startOffset") or ""
+            end = query.get("endOffset")
+            limit = int(query.get("maxResults") or 1000)
+            names = server.sorted_names(bucket)
+            objects = server.buckets[bucket]["objects"]
+            items, prefixes, token = [], [], None
+            seen = set()
+            # Names are sorted, so the page starts at a bisection and ends at the first name
+            # outside the prefix: a page costs O(page size), not O(bucket size).
+            for index in range(bisect.bisect_left(names, max(prefix, start)), len(names)):
+                name = names[index]
+                if not name.startswith(prefix):
+                    break
+                if query.get("pageToken") and name == start:
+                    continue
+                if end and name >= end:
+                    break
+                if len(items) + len(prefixes) >= limit:
+                    token = last
+                    break
+                if delimiter:
+                    cut = name.find(delimiter, len(prefix))
+                    if cut != -1:
+                        folder = name[:cut + len(delimiter)]
+                        if folder not in seen:
+                            seen.add(folder)
+                            prefixes.append(folder)
+                        last = folder + "\U0010ffff"
+                        continue
+                obj = objects.get(name)
+                if obj is None:
+                    continue
+                items.append(obj.resource(server.endpoint))
+                last = name
+            body = {"kind": "storage#objects", "items": items}
+            if prefixes:
+                body["prefixes"] = prefixes
+            if token:
+                body["nextPageToken"] = token
+            return self._send(200, body)
+
+        def _download(self, bucket, name):
+            obj = server.buckets[bucket]["objects"][name]
+            data = obj.data
+            headers = {"x-goog-generation": str(obj.generation)}
+            rng = self.headers.get("Range")
+            if rng and rng.startswith("bytes="):
+                start_s, _, end_s = rng[6:].partition("-")
+                start = int(start_s)
+                end = int(end_s) if end_s else len(data) - 1
+                end = min(end, len(data) - 1)
+                if start >= len(data):
+                    return self._send(416, b"", content_type="application/octet-stream")
+                headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+                return self._send(206, data[start:end + 1], headers,
+                                  content_type="application/octet-stream", truncate=self._truncate())
+            headers["x-goog-hash"] = f"crc32c={obj.crc32c}" + (
+                f",md5={obj.md5}" if obj.component_count is None else "")
+            return self._send(200, data, headers, content_type="application/octet-stream",
+                              truncate=self._truncate())
+
+        def _truncate(self):
+            return self.failure["after_bytes"] if self.failure else None
+
+        def _upload(self, method, segs, query):
+            if method == "PUT":
+                return self._resumable_chunk(query["upload_id"])
+            bucket = segs[1]
+            if bucket not in server.buckets:
+                self._body()
+                return self._error(404, f"bucket {bucket}")
+            kind = query.get("uploadType")
+            body = self._body()
+            if kind == "media":
+                content_type = self.headers.get("Content-Type") or "application/octet-stream"
+                obj = server.put_object(bucket, query["name"], body, {"contentType": content_type})
+                return self._send(200, obj.resource(server.endpoint))
+            if kind == "multipart":
+                meta, data = self._split_multipart(body)
+                name = meta.get("name") or query.get("name")
+                obj = server.put_object(bucket, name, data, meta)
+                return self._send(200, obj.resource(server.endpoint))
+            if kind == "resumable":
+                meta = json.loads(body or b"{}")
+                meta.setdefault("name", query.get("name"))
+                upload_id = uuid.uuid4().hex
+                with server.lock:
+                    server.uploads[upload_id] = {"bucket": bucket, "meta": meta, "data": bytearray()}
+                location = (f"{server.endpoint}/upload/storage/v1/b/{quote(bucket, safe='')}"
+                            f"/o?uploadType=resumable&upload_id={upload_id}")
+                return self._send(200, b"", {"Location": location})
+            return self._error(400, f"uploadType {kind}")
+
+        def _resumable_chunk(self, upload_id):
+            session = server.uploads.get(upload_id)
+            body = self._body()
+            if session is None:
+                return self._error(404, "upload session")
+            content_range = self.headers.get("Content-Range", "")
+            spec = content_range.replace("bytes ", "")
+            span, _, total = spec.partition("/")
+            if span != "*":
+                start = int(span.split("-")[0])
+                if self.failure:
+                    body = body[:self.failure["after_bytes"]]
+                del session["data"][start:]
+                session["data"] += body
+            if self.failure:
+                return self._error(self.failure["status"], "injected failure")
+            if total != "*" and len(session["data"]) >= int(total):
+                obj = server.put_object(session["bucket"], session["meta"]["name"],
+                                        session["data"], session["meta"])
+                with server.lock:
+                    server.uploads.pop(upload_id, None)
+                return self._send(200, obj.resource(server.endpoint))
+            headers = {}
+            if session["data"]:
+                headers["Range"] = f"bytes=0-{len(session['data']) - 1}"
+            return self._send(308, b"", headers)
+
+        @staticmethod
+        def _split_multipart(body):
+            boundary = body.split(b"\r\n", 1)[0]
+            parts = [p for p in body.split(boundary) if p.strip(b"-\r\n")]
+            meta_part = parts[0].split(b"\r\n\r\n", 1)[1].rstrip(b"\r\n")
+            data_part = parts[1].split(b"\r\n\r\n", 1)[1]
+            if data_part.endswith(b"\r\n"):
+                data_part = data_part[:-2]
+            return json.loads(meta_part), data_part
+
+        def _compose(self, bucket, name):
+            request = json.loads(self._body())
+            objects = server.buckets[bucket]["objects"]
+            chunks, count = [], 0
+            for source in request["sourceObjects"]:
+                src = objects[source["name"]]
+                chunks.append(src.data)
+                count += src.component_count or 1
+            meta = request.get("destination", {})
+            obj = server.put_object(bucket, name, b"".join(chunks), meta, component_count=count)
+            return self._send(200, obj.resource(server.endpoint))
+
+        def _rewrite(self, src_bucket, src_name, dst_bucket, dst_name, query):
+            meta = json.loads(self._body() or b"{}")
+            src = server.buckets[src_bucket]["objects"][src_name]
+            if dst_bucket not in server.buckets:
+                return self._error(404, f"bucket {dst_bucket}")
+            expected = query.get("ifSourceGenerationMatch") or query.get("sourceGeneration")
+            if expected and expected != str(src.generation):
+                return self._error(412, "source generation mismatch")
+            size = len(src.data)
+            done = size
+            if server.rewrite_chunk:
+                start = 0
+                if query.get("rewriteToken"):
+                    token = json.loads(base64.b64decode(query["rewriteToken"]))
+                    if token["generation"] != src.generation:
+                        return self._error(400, "invalid rewrite token")
+                    start = token["offset"]
+                done = min(size, start + server.rewrite_chunk)
+            if done < size:
+                token = _b64(json.dumps({"generation": src.generation, "offset": done}).encode())
+                return self._send(200, {
+                    "kind": "storage#rewriteResponse",
+                    "totalBytesRewritten": str(done),
+                    "objectSize": str(size),
+                    "done": False,
+                    "rewriteToken": token,
+                })
+            merged = dict(src.metadata)
+            merged.update(meta)
+            obj = server.put_object(dst_bucket, dst_name, src.data, merged)
+            return self._send(200, {
+                "kind": "storage#rewriteResponse",
+                "totalBytesRewritten": str(size),
+                "objectSize": str(size),
+                "done": True,
+                "resource": obj.resource(server.endpoint),
+            })
+
+        def _batch(self):
+            body = self._body()
+            content_type = self.headers.get("Content-Type", "")
+            boundary = content_type.split("boundary=", 1)[1].strip('"')
+            responses = []
+            for part in body.split(f"--{boundary}".encode()):
+                part = part.strip(b"\r\n")
+                if not part or part == b"--":
+                    continue
+                _, _, http_req = part.replace(b"\r\n", b"\n").partition(b"\n\n")
+                request_line, _, rest = http_req.partition(b"\n")
+                method, url, _ = request_line.decode().split(" ", 2)
+                _, _, sub_body = rest.partition(b"\n\n")
+                responses.append(self._sub_request(method, url, sub_body.strip()))
+            with server.lock:
+                server.batch_envelopes.append(len(responses))
+            out_boundary = uuid.uuid4().hex
+            chunks = []
+            for index, (status, payload) in enumerate(responses):
+                chunks.append(
+                    f"--{out_boundary}\r\nContent-Type: application/http\r\n"
+                    f"Content-ID: <response-{index + 1}>\r\n\r\n"
+                    f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n\r\n{payload}\r\n"
+                )
+            chunks.append(f"--{out_boundary}--\r\n")
+            return self._send(200, "".join(chunks).encode("utf-8"),
+                              content_type=f"multipart/mixed; boundary={out_boundary}")
+
+        @staticmethod
+        def _sub_request(method, url, body):
+            path = urlsplit(url).path
+            segs = [unquote(s) for s in path.strip("/").split("/")]
+            segs = segs[segs.index("b"):]
+            bucket, name = segs[1], segs[3]
+            objects = server.buckets.get(bucket, {}).get("objects", {})
+            failure = server._take_failure(f"{method} subrequest")
+            if failure:
+                status = failure["status"]
+                return status, json.dumps({"error": {"code": status, "message": "injected failure"}})
+            obj = objects.get(name)
+            if obj is None:
+                return 404, json.dumps({"error": {"code": 404, "message": "Not Found"}})
+            if method == "DELETE":
+                server.delete_object(bucket, name)
+                return 204, ""
+            if method == "PATCH":
+                obj.metadata.update(json.loads(body or b"{}"))
+                obj.metageneration += 1
+            return 200, json.dumps(obj.resource(server.endpoint))
+
+    return Handler
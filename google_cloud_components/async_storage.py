@@ -0,0 +1,240 @@
+import asyncio
+import os
+from urllib.parse import quote
+
+import aiohttp
+from google.api_core import exceptions
+from google.auth.credentials import with_scopes_if_required
+from google.auth.transport.requests import Request
+from google.cloud import storage
+
+from google_cloud_components.auth import GCPAuth
+from google_cloud_components.cloud_storage import GCPStorage
+from utils.logger import Logger
+
+
+class AsyncGCPStorage(GCPAuth):
+    """
+    asyncio counterpart of GCPStorage, talking to the GCS JSON API over aiohttp.
+
+    It inherits GCPAuth to reuse the same service-account credentials. One pooled
+    ``aiohttp.ClientSession`` is shared by every call, a semaphore caps the number
+    of requests in flight, and access tokens are refreshed on an executor thread
+    (one refresh at a time) so the event loop never blocks on the token endpoint.
+
+    Use it as an async context manager so the session is closed cleanly::
+
+        async with AsyncGCPStorage() as gcs:
+            data = await gcs.download_blob("bucket", "json/2019-04-28.json")
+    """
+    DEFAULT_API_ENDPOINT = "https://storage.googleapis.com"
+
+    def __init__(
+        self,
+        credentials_path='credentials.json',
+        api_endpoint=None,
+        max_concurrency=64,
+        connection_limit=100,
+        quiet=False
+    ):
+        """
+        Initializes the async storage class. No network I/O happens until the first call.
+
+        Args:
+            credentials_path (str): The path to the service account credentials JSON file.
+            api_endpoint (str, optional): Base URL of the storage API. Defaults to the public endpoint.
+            max_concurrency (int, optional): Maximum requests in flight. Defaults to 64.
+            connection_limit (int, optional): Size of the HTTP connection pool. Defaults to 100.
+            quiet (bool, optional): Never print to stdout. Defaults to False.
+        """
+        # Records go through a background writer thread, so storage calls never block on file I/O.
+        self.logger = Logger(
+            "google_cloud_components.gcp_storage_async", log_file="gcp.log", queued=True
+        ).get_logger()
+
+        super().__init__(credentials_path, quiet=quiet)
+
+        self.api_endpoint = (api_endpoint or self.DEFAULT_API_ENDPOINT).rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.connection_limit = connection_limit
+        self._credentials = None
+        if self.get_credentials():
+            self._credentials = with_scopes_if_required(self.get_credentials(), storage.Client.SCOPE)
+        else:
+            self.logger.error("Failed to create async storage client due to authentication failure.")
+        self._session = None
+        self._semaphore = None
+        self._refresh_lock = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def open(self):
+        """Creates the pooled HTTP session; called automatically by ``async with``."""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit, limit_per_host=self.connection_limit)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._refresh_lock = asyncio.Lock()
+
+    async def close(self):
+        """Closes the HTTP session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def upload_blob(self, bucket_name, blob_name, data, content_type="application/octet-stream"):
+        """
+        Uploads bytes (or a local file) as a single-request media upload.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+            data (bytes or str): The object contents, or a local file path.
+            content_type (str, optional): Defaults to ``application/octet-stream``.
+
+        Returns:
+            dict: The blob details, as returned by :meth:`get_blob_metadata`.
+        """
+        if isinstance(data, (str, os.PathLike)):
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(None, _read_file, data)
+        url = f"{self.api_endpoint}/upload/storage/v1/b/{quote(bucket_name, safe='')}/o"
+        resource = await self._request(
+            "POST", url,
+            params={"uploadType": "media", "name": blob_name},
+            data=data,
+            headers={"Content-Type": content_type},
+        )
+        return self._to_details(bucket_name, resource)
+
+    async def download_blob(self, bucket_name, blob_name, start=None, end=None):
+        """
+        Downloads a blob, or an inclusive byte range of it, into memory.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+            start (int, optional): First byte to read.
+            end (int, optional): Last byte to read (inclusive).
+
+        Returns:
+            bytes: The object contents.
+        """
+        headers = {}
+        if start is not None or end is not None:
+            headers["Range"] = f"bytes={start or 0}-{'' if end is None else end}"
+        return await self._request("GET", self._object_url(bucket_name, blob_name),
+                                   params={"alt": "media"}, headers=headers, raw=True)
+
+    async def get_blob_metadata(self, bucket_name, blob_name):
+        """
+        Returns a formatted dictionary with all Blob properties, like GCPStorage.get_blob_metadata.
+
+        Raises:
+            google.api_core.exceptions.NotFound: If the bucket or blob does not exist.
+        """
+        resource = await self._request("GET", self._object_url(bucket_name, blob_name))
+        return self._to_details(bucket_name, resource)
+
+    async def delete_blob(self, bucket_name, blob_name):
+        """
+        Deletes a blob from the bucket.
+
+        Raises:
+            google.api_core.exceptions.NotFound: If the bucket or blob does not exist.
+        """
+        await self._request("DELETE", self._object_url(bucket_name, blob_name), raw=True)
+
+    async def iter_blobs(self, bucket_name, prefix=None, delimiter=None, page_size=None, start_offset=None):
+        """
+        Lazily lists the objects in a bucket, one API page at a time.
+
+        Yields the same blob and prefix records as GCPStorage.iter_blobs.
+        """
+        url = f"{self.api_endpoint}/storage/v1/b/{quote(bucket_name, safe='')}/o"
+        params = {
+            key: value for key, value in (
+                ("prefix", prefix),
+                ("delimiter", delimiter),
+                ("maxResults", page_size),
+                ("startOffset", start_offset),
+                ("projection", "noAcl"),
+            ) if value is not None
+        }
+        while True:
+            page = await self._request("GET", url, params=params)
+            for folder in page.get("prefixes", ()):
+                yield {"kind": "prefix", "name": folder}
+            for resource in page.get("items", ()):
+                yield self._format_blob_listing(self._to_blob(bucket_name, resource))
+            token = page.get("nextPageToken")
+            if not token:
+                return
+            params["pageToken"] = token
+
+    async def _request(self, method, url, params=None, data=None, headers=None, raw=False):
+        """
+        Helper method that sends one authorized request under the concurrency limit.
+
+        Raises the ``google.api_core`` exception matching any non-2xx status, so
+        callers can handle errors the same way as with the synchronous client.
+        """
+        if not self._credentials:
+            raise exceptions.Unauthenticated("Authentication failed.")
+        await self.open()
+        async with self._semaphore:
+            token = await self._access_token()
+            request_headers = {"Authorization": f"Bearer {token}"}
+            request_headers.update(headers or {})
+            async with self._session.request(
+                method, url, params=params, data=data, headers=request_headers
+            ) as response:
+                body = await response.read()
+                if response.status >= 400:
+                    message = body.decode("utf-8", "replace")
+                    self.logger.error("%s %s failed with %s: %s", method, url, response.status, message)
+                    raise exceptions.from_http_status(response.status, f"{method} {url}: {message}")
+                if raw or not body:
+                    return body
+                return await response.json(content_type=None)
+
+    async def _access_token(self):
+        """Helper method returning a valid access token, refreshing it off the event loop."""
+        if self._credentials.valid:
+            return self._credentials.token
+        async with self._refresh_lock:
+            # Another task may have refreshed while this one waited for the lock.
+            if not self._credentials.valid:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self._credentials.refresh, Request())
+        return self._credentials.token
+
+    def _object_url(self, bucket_name, blob_name):
+        """Helper method building the JSON API URL of one object."""
+        return (f"{self.api_endpoint}/storage/v1/b/{quote(bucket_name, safe='')}"
+                f"/o/{quote(blob_name, safe='')}")
+
+    def _to_blob(self, bucket_name, resource):
+        """Helper method wrapping a JSON object resource in a Blob so the shared formatters apply."""
+        blob = storage.Blob(resource["name"], storage.Bucket(None, bucket_name))
+        blob._set_properties(resource)
+        return blob
+
+    def _to_details(self, bucket_name, resource):
+        """Helper method formatting a JSON object resource like GCPStorage.get_blob_metadata."""
+        return self._format_blob_details(self._to_blob(bucket_name, resource))
+
+    # Reuse the synchronous client's formatters so both return identical records.
+    _format_blob_details = GCPStorage._format_blob_details
+    _format_blob_listing = GCPStorage._format_blob_listing
+
+
+def _read_file(path):
+    """Reads a whole local file; run on an executor thread."""
+    with open(path, "rb") as handle:
+        return handle.read()
@@ -1,54 +1,261 @@
 
+import datetime
 import os
+import threading
+import time
+
+from google_cloud_components.lazy import lazy_import
+
+# Imported on first use; parsing a key file pulls in the RSA and ASN.1 stacks.
+auth_exceptions = lazy_import("google.auth.exceptions")
+auth_requests = lazy_import("google.auth.transport.requests")
+service_account = lazy_import("google.oauth2.service_account")
+
+# Scope requested for every credential; it covers Cloud Storage and the other GCP APIs.
+DEFAULT_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
+
+# Parsed credentials shared by every GCPAuth in the process, keyed by absolute file path.
+# Each entry is (mtime_ns, credentials, TokenRefresher); editing the file invalidates it.
+_CREDENTIALS_CACHE = {}
+_CREDENTIALS_LOCK = threading.Lock()
+
+
+class TokenRefresher:
+    """
+    Keeps one credentials object's access token fresh and collapses concurrent refreshes.
+
+    The credentials' ``refresh`` method is wrapped so that threads finding an
+    expired token wait for a single in-flight refresh instead of each hitting the
+    token endpoint. When ``background`` is set, a daemon thread also refreshes the
+    token ``margin`` seconds before it expires, so callers never pay the refresh
+    latency inline. Refresh timings are kept for :meth:`stats`.
+    """
+    def __init__(self, credentials, background=True, margin=300.0):
+        """
+        Wraps the credentials and, optionally, starts the background refresh thread.
+
+        Args:
+            credentials (google.auth.credentials.Credentials): The credentials to manage.
+            background (bool): Refresh proactively before expiry. Defaults to True.
+            margin (float): Seconds before expiry at which to refresh. Defaults to 300.
+        """
+        self.credentials = credentials
+        self.margin = margin
+        self._refresh = credentials.refresh
+        self._lock = threading.Lock()
+        self._refreshed = threading.Event()
+        self._stopped = threading.Event()
+        self._generation = 0
+        self._counters = {
+            "refreshes": 0,
+            "background_refreshes": 0,
+            "coalesced": 0,
+            "failures": 0,
+            "last_refresh_seconds": None,
+            "max_refresh_seconds": 0.0,
+            "total_refresh_seconds": 0.0,
+        }
+        # Every caller (AuthorizedSession, storage client, background thread) goes through here.
+        credentials.refresh = self.refresh
+        self._thread = None
+        if background:
+            self._thread = threading.Thread(target=self._run, name="gcp-token-refresher", daemon=True)
+            self._thread.start()
+
+    def refresh(self, request, background=False):
+        """
+        Refreshes the token, or waits for a refresh that is already in flight.
+
+        Args:
+            request (google.auth.transport.Request): Transport for the token endpoint call.
+            background (bool): Whether the call comes from the background thread.
+        """
+        generation = self._generation
+        with self._lock:
+            if generation != self._generation and self.credentials.valid:
+                # Another thread refreshed while this one was waiting for the lock.
+                self._counters["coalesced"] += 1
+                return
+            started = time.perf_counter()
+            try:
+                self._refresh(request)
+            except Exception:
+                self._counters["failures"] += 1
+                raise
+            elapsed = time.perf_counter() - started
+            self._generation += 1
+            self._counters["refreshes"] += 1
+            self._counters["background_refreshes"] += int(background)
+            self._counters["last_refresh_seconds"] = elapsed
+            self._counters["total_refresh_seconds"] += elapsed
+            self._counters["max_refresh_seconds"] = max(self._counters["max_refresh_seconds"], elapsed)
+        self._refreshed.set()
+
+    def stats(self):
+        """
+        Returns refresh counters and latency.
+
+        Returns:
+            dict: ``refreshes``, ``background_refreshes``, ``coalesced`` waits, ``failures``,
+            ``last_refresh_seconds``, ``max_refresh_seconds``, ``mean_refresh_seconds``
+            and ``expires_in`` (seconds left on the current token, or None).
+        """
+        with self._lock:
+            counters = dict(self._counters)
+        refreshes = counters["refreshes"]
+        counters["mean_refresh_seconds"] = counters["total_refresh_seconds"] / refreshes if refreshes else None
+        expiry = self.credentials.expiry
+        counters["expires_in"] = (
+            (expiry - _utcnow()).total_seconds() if expiry and self.credentials.token else None
+        )
+        return counters
+
+    def stop(self):
+        """Stops the background thread; the wrapped refresh keeps working."""
+        self._stopped.set()
+        self._refreshed.set()
+
+    def _run(self):
+        """Background loop: sleep until ``margin`` seconds before expiry, then refresh."""
+        while not self._stopped.is_set():
+            expiry = self.credentials.expiry
+            if not self.credentials.token or expiry is None:
+                # No token yet; the first one is fetched lazily by the first request.
+                self._refreshed.wait()
+                self._refreshed.clear()
+                continue
+            remaining = (expiry - _utcnow()).total_seconds()
+            # Short-lived tokens are refreshed half way through instead of in a tight loop.
+            delay = max(remaining - self.margin, remaining / 2)
+            if delay > 0 and self._stopped.wait(delay):
+                return
+            try:
+                self.refresh(auth_requests.Request(), background=True)
+            except Exception:
+                # The next request will retry inline; back off so a dead endpoint is not hammered.
+                self._stopped.wait(min(30.0, max(1.0, self.margin / 10)))
+
+
+def _utcnow():
+    """Naive UTC now, matching ``google.auth`` credential expiry timestamps."""
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _load_credentials(credentials_path, background_refresh=True):
+    """
+    Returns the process-wide credentials and refresher for a key file, parsing it only when it changed.
+
+    Args:
+        credentials_path (str): The path to the service account credentials JSON file.
+        background_refresh (bool): Start a background refresh thread for new entries.
+
+    Returns:
+        tuple: ``(credentials, TokenRefresher)``.
+    """
+    path = os.path.abspath(credentials_path)
+    mtime_ns = os.stat(path).st_mtime_ns
+    with _CREDENTIALS_LOCK:
+        entry = _CREDENTIALS_CACHE.get(path)
+        if entry is not None and entry[0] == mtime_ns:
+            return entry[1], entry[2]
+        if entry is not None:
+            entry[2].stop()
+        credentials = service_account.Credentials.from_service_account_file(path, scopes=DEFAULT_SCOPES)
+        refresher = TokenRefresher(credentials, background=background_refresh)
+        _CREDENTIALS_CACHE[path] = (mtime_ns, credentials, refresher)
+        return credentials, refresher
 
-from google.oauth2 import service_account
-from google.auth.exceptions import DefaultCredentialsError
 
 class GCPAuth:
     """
     Base class for authenticating with Google Cloud Platform APIs.
     It uses a service account JSON file for authentication.
     """
-    def __init__(self, credentials_path='credentials.json'):
+    def __init__(self, credentials_path='credentials.json', background_refresh=True, quiet=False, lazy=False):
         """
         Initializes the credentials and project ID.
         
         This method attempts to load authentication credentials from the specified
         JSON file. It includes proper exception handling to catch common errors
         such as the file not being found or issues with the credential format.
+        The parsed credentials (and their access token) are cached per process and
+        reused until the file's modification time changes.
 
         Args:
             credentials_path (str): The path to the service account credentials JSON file.
+            background_refresh (bool): Refresh access tokens in a background thread shortly
+                before they expire. Defaults to True.
+            quiet (bool): Library mode: never print to stdout. Defaults to False.
+            lazy (bool): Defer reading the credentials file until they are first needed
+                (:meth:`get_credentials`, :meth:`get_project_id`). Defaults to False.
         """
+        self.quiet = quiet
+        self.__credentials_path = credentials_path
+        self.__background_refresh = background_refresh
         self.__credentials = None
         self.__project_id = None
+        self.__refresher = None
+        self.__authenticated = False
+        self.__auth_lock = threading.Lock()
+        if not lazy:
+            self._authenticate()
+
+    def _authenticate(self):
+        """
+        Loads the credentials and project ID, once; later calls return immediately.
+
+        Failures are reported (printed unless quiet) and leave the credentials unset.
+        """
+        if self.__authenticated:
+            return
+        with self.__auth_lock:
+            if self.__authenticated:
+                return
+            try:
+                self._read_credentials()
+            finally:
+                self.__authenticated = True
+
+    def _read_credentials(self):
+        """Helper method reading the credentials file, reporting what went wrong if it cannot."""
+        credentials_path = self.__credentials_path
+        background_refresh = self.__background_refresh
 
         # Attempt to load credentials from the specified JSON file
         try:
             if not os.path.exists(credentials_path):
                 raise FileNotFoundError(f"Credentials file not found at: {credentials_path}")
 
-            self.__credentials = service_account.Credentials.from_service_account_file(credentials_path)
+            self.__credentials, self.__refresher = _load_credentials(credentials_path, background_refresh)
 
             # Get the project ID from the credentials
             if self.__credentials.project_id:
                 self.__project_id = self.__credentials.project_id
-                print(f"Successfully authenticated with project ID: {self.__project_id}")
+                self._echo("Successfully authenticated with project ID: %s", self.__project_id)
             else:
                 # Handle cases where project_id might be missing from the credentials file
                 raise ValueError("Project ID not found in the credentials file.")
 
         except FileNotFoundError as e:
-            print(f"Authentication failed: {e}")
-            print("Please ensure 'credentials.json' is in the root directory.")
+            self._echo("Authentication failed: %s", e)
+            self._echo("Please ensure 'credentials.json' is in the root directory.")
         except ValueError as e:
-            print(f"Authentication failed: {e}")
-            print("The credentials file is invalid. Please check the file content.")
-        except DefaultCredentialsError as e:
-            print(f"Authentication failed: {e}")
-            print("Failed to get default credentials. Ensure that the credentials file is valid.")
+            self._echo("Authentication failed: %s", e)
+            self._echo("The credentials file is invalid. Please check the file content.")
+        except auth_exceptions.DefaultCredentialsError as e:
+            self._echo("Authentication failed: %s", e)
+            self._echo("Failed to get default credentials. Ensure that the credentials file is valid.")
         except Exception as e:
-            print(f"An unexpected error occurred during authentication: {e}")
+            self._echo("An unexpected error occurred during authentication: %s", e)
+
+    def _echo(self, message, *args):
+        """
+        Prints a %-style progress message unless the instance is in quiet (library) mode.
+
+        The message is only formatted when it is actually printed.
+        """
+        if not self.quiet:
+            print(message % args if args else message)
 
     def get_credentials(self):
         """
@@ -57,6 +264,7 @@ class GCPAuth:
         Returns:
             google.oauth2.credentials.Credentials: The credentials object or None if authentication failed.
         """
+        self._authenticate()
         return self.__credentials
 
     def get_project_id(self):
@@ -66,4 +274,17 @@ class GCPAuth:
         Returns:
             str: The project ID or None if not available.
         """
+        self._authenticate()
         return self.__project_id
+
+    def get_token_stats(self):
+        """
+        Returns access-token refresh counters and latency for the loaded credentials.
+
+        Returns:
+            dict: See :meth:`TokenRefresher.stats`, or None if authentication failed.
+        """
+        self._authenticate()
+        if self.__refresher is None:
+            return None
+        return self.__refresher.stats()
@@ -0,0 +1,279 @@
+import hashlib
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+
+class MetadataCache:
+    """
+    Thread-safe in-process cache for bucket and blob metadata.
+
+    Entries are evicted least-recently-used once ``max_entries`` is reached and
+    expire ``ttl`` seconds after they were stored or last revalidated. Expired
+    entries are not dropped straight away: :meth:`get` hands them back as stale
+    so the caller can revalidate them cheaply by generation/metageneration
+    instead of refetching.
+
+    Any object exposing the same ``get``/``set``/``touch``/``invalidate``/
+    ``invalidate_prefix``/``stats`` methods can be plugged into ``GCPStorage``
+    in its place.
+    """
+    def __init__(self, max_entries=10000, ttl=60.0, clock=time.monotonic):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of entries before LRU eviction. Defaults to 10000.
+            ttl (float): Seconds an entry is served without revalidation. Defaults to 60.
+            clock (callable): Monotonic time source, overridable for tests.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "revalidated": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    def get(self, key):
+        """
+        Looks up a cached value.
+
+        Args:
+            key (tuple): The cache key, e.g. ``("blob", bucket_name, blob_name)``.
+
+        Returns:
+            tuple: ``(value, fresh)``. ``value`` is None on a miss; ``fresh`` is False
+            when the entry has outlived its TTL and should be revalidated.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None, False
+            self._entries.move_to_end(key)
+            value, expires_at = entry
+            if self._clock() >= expires_at:
+                self._counters["stale"] += 1
+                return value, False
+            self._counters["hits"] += 1
+            return value, True
+
+    def set(self, key, value):
+        """Stores ``value`` under ``key`` with a fresh TTL, evicting the LRU entry if full."""
+        with self._lock:
+            self._entries[key] = (value, self._clock() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def touch(self, key):
+        """Restarts the TTL of an entry that was revalidated as unchanged."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (entry[0], self._clock() + self.ttl)
+                self._counters["revalidated"] += 1
+
+    def invalidate(self, key):
+        """Drops a single entry, if present."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._counters["invalidations"] += 1
+
+    def invalidate_prefix(self, prefix):
+        """Drops every entry whose key starts with the ``prefix`` tuple."""
+        size = len(prefix)
+        with self._lock:
+            stale_keys = [key for key in self._entries if key[:size] == prefix]
+            for key in stale_keys:
+                del self._entries[key]
+            self._counters["invalidations"] += len(stale_keys)
+
+    def clear(self):
+        """Drops every entry without resetting the counters."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: ``hits``, ``misses``, ``stale``, ``revalidated``, ``evictions``,
+            ``invalidations``, current ``size`` and ``hit_ratio``.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            counters["size"] = len(self._entries)
+        lookups = counters["hits"] + counters["misses"] + counters["stale"]
+        counters["hit_ratio"] = round(counters["hits"] / lookups, 4) if lookups else 0.0
+        return counters
+
+
+class BlobDiskCache:
+    """
+    Size-bounded, multi-process safe on-disk cache of blob contents.
+
+    Entries are keyed by bucket, blob name and generation, so a cached file can never
+    be served for a newer object generation. Files are written to a temporary name
+    and moved into place with ``os.replace``, which makes concurrent writers (threads
+    or processes sharing ``root``) safe: readers only ever see complete files. Every
+    hit refreshes the entry's mtime, and once the cache grows past ``max_bytes`` the
+    least recently used entries are deleted.
+    """
+    def __init__(self, root, max_bytes=10 * 1024 ** 3):
+        """
+        Opens (and creates if needed) a cache directory.
+
+        Args:
+            root (str): Directory holding the cached files. May be shared between processes.
+            max_bytes (int): Byte budget before LRU eviction kicks in. Defaults to 10 GiB.
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self._tmp_dir = os.path.join(root, "tmp")
+        os.makedirs(self._tmp_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "bytes_saved": 0,
+            "bytes_written": 0,
+            "evictions": 0,
+        }
+        self._size = sum(size for _, _, size in self._entries())
+
+    def get(self, bucket_name, blob_name, generation):
+        """
+        Returns the path of a cached generation, or None on a miss.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+            generation (int): The object generation that must be served.
+
+        Returns:
+            str or None: Path of the cached file.
+        """
+        path = self._path(bucket_name, blob_name, generation)
+        try:
+            os.utime(path)
+            size = os.path.getsize(path)
+        except OSError:
+            with self._lock:
+                self._counters["misses"] += 1
+            return None
+        with self._lock:
+            self._counters["hits"] += 1
+            self._counters["bytes_saved"] += size
+        return path
+
+    def temp_path(self):
+        """Returns a fresh temporary path inside the cache to download into."""
+        return os.path.join(self._tmp_dir, f"{uuid.uuid4().hex}.part")
+
+    def commit(self, temp_path, bucket_name, blob_name, generation):
+        """
+        Atomically moves a fully written temporary file into the cache.
+
+        Older cached generations of the same blob are removed.
+
+        Returns:
+            str: Path of the cached file.
+        """
+        path = self._path(bucket_name, blob_name, generation)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        size = os.path.getsize(temp_path)
+        os.replace(temp_path, path)
+        freed = 0
+        for name in os.listdir(directory):
+            # Only drop older generations: another process may have just committed a newer one.
+            if name.isdigit() and int(name) < int(generation):
+                freed += self._remove(os.path.join(directory, name))
+        with self._lock:
+            self._counters["bytes_written"] += size
+            self._size += size - freed
+            over_budget = self._size > self.max_bytes
+        if over_budget:
+            self.evict()
+        return path
+
+    def discard(self, temp_path):
+        """Removes a temporary file left by a failed download."""
+        self._remove(temp_path)
+
+    def evict(self):
+        """Deletes least recently used entries until the cache fits within ``max_bytes``."""
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        evicted = 0
+        for _, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                total -= size
+                evicted += 1
+        with self._lock:
+            self._size = total
+            self._counters["evictions"] += evicted
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: ``hits``, ``misses``, ``hit_ratio``, ``bytes_saved`` (bytes served from
+            disk instead of downloaded), ``bytes_written``, ``evictions`` and current ``size_bytes``.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            counters["size_bytes"] = self._size
+        lookups = counters["hits"] + counters["misses"]
+        counters["hit_ratio"] = round(counters["hits"] / lookups, 4) if lookups else 0.0
+        return counters
+
+    def _path(self, bucket_name, blob_name, generation):
+        """Helper mapping a blob generation to ``root/<2 hex>/<sha256 of bucket/name>/<generation>``."""
+        digest = hashlib.sha256(f"{bucket_name}/{blob_name}".encode("utf-8")).hexdigest()
+        return os.path.join(self.root, digest[:2], digest, str(generation))
+
+    def _entries(self):
+        """Helper yielding ``(mtime, path, size)`` for every committed entry."""
+        for shard in os.listdir(self.root):
+            shard_path = os.path.join(self.root, shard)
+            if shard == "tmp" or not os.path.isdir(shard_path):
+                continue
+            for digest in os.listdir(shard_path):
+                blob_dir = os.path.join(shard_path, digest)
+                try:
+                    generations = os.listdir(blob_dir)
+                except OSError:
+                    continue
+                for generation in generations:
+                    path = os.path.join(blob_dir, generation)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    yield stat.st_mtime, path, stat.st_size
+
+    @staticmethod
+    def _remove(path):
+        """Helper deleting a file that another process may already have removed; returns its size."""
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            return size
+        except OSError:
+            return 0
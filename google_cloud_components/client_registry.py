@@ -0,0 +1,155 @@
+import os
+import threading
+
+from google_cloud_components.lazy import lazy_import
+
+google_auth_credentials = lazy_import("google.auth.credentials")
+google_auth_requests = lazy_import("google.auth.transport.requests")
+requests_adapters = lazy_import("requests.adapters")
+storage = lazy_import("google.cloud.storage")
+
+
+class ClientRegistry:
+    """
+    Process-wide registry of ``storage.Client`` objects and their HTTP sessions.
+
+    Clients are keyed by credentials path, project, API endpoint and pool settings,
+    so every GCPStorage built with the same configuration shares one authorized
+    session: its pooled keep-alive connections and its cached access token survive
+    across short-lived GCPStorage instances. When the key file is reloaded (its
+    credentials object changes), the client built on the old credentials is replaced,
+    so rotating a key never accumulates clients. The superseded client is not closed:
+    instances created before the reload may still be using it, and its connections are
+    released once the last of them is garbage collected.
+    """
+    def __init__(self):
+        """Initializes an empty registry."""
+        self._clients = {}
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "replaced": 0}
+
+    def get_client(
+        self,
+        credentials,
+        project,
+        credentials_path=None,
+        api_endpoint=None,
+        pool_maxsize=32,
+        pool_connections=10,
+        keep_alive=True
+    ):
+        """
+        Returns the shared client for this configuration, creating it on first use.
+
+        Args:
+            credentials (google.auth.credentials.Credentials): Credentials used if the client is created.
+            project (str): The project ID.
+            credentials_path (str, optional): Path the credentials were loaded from; part of the key.
+            api_endpoint (str, optional): Base URL of the storage API; part of the key.
+            pool_maxsize (int, optional): Maximum pooled connections per host. Size this to the
+                largest bulk-operation thread pool so connections are not discarded. Defaults to 32.
+            pool_connections (int, optional): Number of per-host pools kept. Defaults to 10.
+            keep_alive (bool, optional): Reuse connections between requests. Defaults to True.
+
+        Returns:
+            google.cloud.storage.Client: The shared client.
+        """
+        key = (
+            # Without a path, the credentials object itself is all that identifies them.
+            os.path.abspath(credentials_path) if credentials_path else id(credentials),
+            project,
+            api_endpoint,
+            pool_maxsize,
+            pool_connections,
+            keep_alive,
+        )
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None and entry[0] is credentials:
+                self._counters["hits"] += 1
+                return entry[1]
+            self._counters["misses"] += 1
+            client = self._build_client(
+                credentials, project, api_endpoint, pool_maxsize, pool_connections, keep_alive
+            )
+            self._clients[key] = (credentials, client)
+            if entry is not None:
+                # The key file was reloaded. Older instances may still hold the superseded
+                # client, so it is only forgotten here, never closed under them.
+                self._counters["replaced"] += 1
+        return client
+
+    @staticmethod
+    def _build_client(credentials, project, api_endpoint, pool_maxsize, pool_connections, keep_alive):
+        """Helper method that creates a client on an authorized session with a sized connection pool."""
+        return storage.Client(
+            credentials = credentials,
+            project = project,
+            client_options = {"api_endpoint": api_endpoint} if api_endpoint else None,
+            _http = build_session(credentials, pool_maxsize, pool_connections, keep_alive)
+        )
+
+    def stats(self):
+        """
+        Returns registry and connection pool counters.
+
+        Returns:
+            dict: ``clients``, registry ``hits``/``misses``, ``replaced`` (clients superseded
+            by reloaded credentials), ``connections_opened``,
+            ``requests`` and ``connections_reused`` (requests served on an existing connection).
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            clients = [client for _, client in self._clients.values()]
+        counters["clients"] = len(clients)
+        opened = requests_sent = 0
+        for client in clients:
+            # The same adapter is mounted for both schemes; count each one once.
+            adapters = {id(adapter): adapter for adapter in client._http.adapters.values()}
+            for adapter in adapters.values():
+                pools = adapter.poolmanager.pools
+                for pool_key in pools.keys():
+                    pool = pools.get(pool_key)
+                    if pool is not None:
+                        opened += pool.num_connections
+                        requests_sent += pool.num_requests
+        counters["connections_opened"] = opened
+        counters["requests"] = requests_sent
+        counters["connections_reused"] = max(0, requests_sent - opened)
+        return counters
+
+    def clear(self):
+        """Closes and forgets every registered client."""
+        with self._lock:
+            clients = [client for _, client in self._clients.values()]
+            self._clients.clear()
+        for client in clients:
+            client._http.close()
+
+
+def build_session(credentials, pool_maxsize=32, pool_connections=10, keep_alive=True):
+    """
+    Builds an ``AuthorizedSession`` whose connection pools are sized for concurrent use.
+
+    Args:
+        credentials (google.auth.credentials.Credentials): The credentials to authorize with.
+        pool_maxsize (int, optional): Maximum pooled connections per host. Defaults to 32.
+        pool_connections (int, optional): Number of per-host pools kept. Defaults to 10.
+        keep_alive (bool, optional): Reuse connections between requests. Defaults to True.
+
+    Returns:
+        google.auth.transport.requests.AuthorizedSession: The session.
+    """
+    session = google_auth_requests.AuthorizedSession(
+        google_auth_credentials.with_scopes_if_required(credentials, storage.Client.SCOPE)
+    )
+    adapter = requests_adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+# Shared by every GCPStorage in the process unless told otherwise.
+default_registry = ClientRegistry()
@@ -1,55 +1,335 @@
 
-from google.cloud.exceptions import NotFound
-from google.cloud import storage
+import hashlib
+import mimetypes
+import mmap
+import os
+import tempfile
+import threading
+import time
+import uuid
+
 from google_cloud_components.auth import GCPAuth
+from google_cloud_components.client_registry import build_session, default_registry
+from google_cloud_components.compression import iter_decompressed
+from google_cloud_components.lazy import lazy_import
+from google_cloud_components.metrics import instrumented
+from google_cloud_components.ndjson import encode_ndjson, iter_batches, iter_ndjson, new_stats
+from google_cloud_components.results import StorageError, StorageResult
+from google_cloud_components.rewrite import RewriteCheckpoint
+from google_cloud_components.sync import DEFAULT_MANIFEST_NAME, SyncManifest, manifest_files, walk_files
+from google_cloud_components.transfer import (
+    RateLimiter, SliceWriter, TransferCheckpoint, backoff_delay, file_crc32c, is_retryable, run_bounded,
+    summarize, verify_checksums
+)
+from google_cloud_components.writer import BlobWriter
 
 from utils.logger import Logger
 
+# Imported on first use: they dominate import time and are not needed until a call is made.
+exceptions = lazy_import("google.api_core.exceptions")
+storage = lazy_import("google.cloud.storage")
+
+# Marks a client that has not been created yet (None means authentication failed).
+_UNSET = object()
+
+# Batch subclass, defined on first use so importing this module does not import the SDK.
+_RESPONSE_BATCH = None
+
+
+def _response_batch(client):
+    """Returns a batch that keeps the sub-responses its (public) ``finish`` returns in ``responses``."""
+    global _RESPONSE_BATCH
+    if _RESPONSE_BATCH is None:
+        class ResponseBatch(storage.Batch):
+            responses = ()
+
+            def finish(self, raise_exception=True):
+                self.responses = super().finish(raise_exception=raise_exception)
+                return self.responses
+
+        _RESPONSE_BATCH = ResponseBatch
+    return _RESPONSE_BATCH(client, raise_exception=False)
+
+
 class GCPStorage(GCPAuth):
     """
     Base class for Google CLoud Storage operations.
     It inherits GCPAuth to get authentication credentials
+
+    How each public method reports failures:
+
+    - ``get_bucket_metadata``, ``get_blob_metadata``, ``read_blob``, ``read_blob_content``
+      and ``get_cached_blob_path`` return the value or a falsy :class:`StorageError`.
+    - ``create_bucket``, ``list_buckets``, ``delete_bucket``, ``create_blob``,
+      ``list_blobs`` and ``delete_blob`` return a :class:`StorageResult`, truthy on success.
+    - The transfer and bulk calls ``upload_composite``, ``upload_resumable``,
+      ``upload_stream``, ``write_ndjson``, ``download_blob`` and ``download_resumable``
+      (one transfer), and ``upload_many``, ``upload_directory``, ``sync``,
+      ``delete_blobs``, ``copy_prefix``, ``move_prefix`` and ``get_blobs_metadata``
+      (many items) return plain report dicts, not typed results: a string ``status``
+      per transfer or item (documented on each method) plus timings or a ``summary``.
+      A failure of the call as a whole (not authenticated, missing bucket, invalid
+      arguments) returns a falsy :class:`StorageError` instead of a dict.
+    - The streams ``iter_blobs``, ``stream_ndjson`` and ``open_blob_writer`` raise:
+      the API exception, or RuntimeError if the client is not initialized.
     """
-    def __init__(self):
+    # GCS accepts at most this many source objects in a single compose request.
+    MAX_COMPOSE_COMPONENTS = 32
+
+    # Sliced downloads never use ranges smaller than this.
+    MIN_SLICE_SIZE = 8 * 1024 * 1024
+
+    # Resumable upload chunks must be a multiple of 256 KiB.
+    RESUMABLE_CHUNK_SIZE = 16 * 1024 * 1024
+
+    def __init__(
+        self,
+        credentials_path='credentials.json',
+        api_endpoint=None,
+        composite_upload_threshold=None,
+        composite_upload_parts=8,
+        resumable_upload_threshold=64 * 1024 * 1024,
+        checkpoint_dir=None,
+        metadata_cache=None,
+        blob_cache=None,
+        shared_client=True,
+        pool_maxsize=32,
+        quiet=False,
+        metrics=None,
+        lazy=True
+    ):
         """
         Initializes the storage class
+
+        Args:
+            credentials_path (str): The path to the service account credentials JSON file.
+            api_endpoint (str, optional): Base URL of the storage API. Point this at a
+                local fake GCS server for testing. Defaults to the public endpoint.
+            composite_upload_threshold (int, optional): File size in bytes from which
+                ``create_blob`` switches to a parallel composite upload. Defaults to None (never).
+            composite_upload_parts (int, optional): Number of parts used by composite uploads.
+                Defaults to 8.
+            resumable_upload_threshold (int, optional): File size in bytes from which
+                ``create_blob`` uses a checkpointed resumable upload. Defaults to 64 MiB;
+                None disables it.
+            checkpoint_dir (str, optional): Directory holding resumable transfer checkpoints.
+                Defaults to a directory under the system temp dir.
+            metadata_cache (MetadataCache, optional): Cache for bucket/blob metadata lookups.
+                Defaults to None (every lookup goes to the API).
+            blob_cache (BlobDiskCache, optional): Read-through disk cache used by ``read_blob``
+                and ``get_cached_blob_path``. Defaults to None (always download).
+            shared_client (bool, optional): Reuse the process-wide client (and its HTTP
+                connections and access token) registered for the same credentials, project
+                and endpoint. Defaults to True.
+            pool_maxsize (int, optional): Maximum pooled HTTP connections per host. Keep it at
+                least as large as the ``max_workers`` used for bulk operations. Defaults to 32.
+            quiet (bool, optional): Library mode: nothing is printed to stdout and results are
+                only reported through return values and the logger. Defaults to False.
+            metrics (StorageMetrics, optional): Collector for per-operation latency, bytes,
+                retries and errors. Defaults to None (no instrumentation).
+            lazy (bool, optional): Defer reading the credentials and creating the client
+                until the first operation needs them, so constructing an instance is nearly
+                free. Authentication problems are then reported on first use. Defaults to True.
         """
-        # Initialized logger
-        self.logger = Logger("google_cloud_components.gcp_storage", log_file="gcp.log").get_logger()
+        self.composite_upload_threshold = composite_upload_threshold
+        self.composite_upload_parts = composite_upload_parts
+        self.resumable_upload_threshold = resumable_upload_threshold
+        self.checkpoint_dir = checkpoint_dir or os.path.join(tempfile.gettempdir(), "gcp-transfer-checkpoints")
+        self.metadata_cache = metadata_cache
+        self.blob_cache = blob_cache
+        self.metrics = metrics
+
+        # Initialized logger (queued: a background thread does the file I/O)
+        self.logger = Logger(
+            "google_cloud_components.gcp_storage", log_file="gcp.log", queued=True
+        ).get_logger()
 
         # Call the parent class's constructor to handle authentication
-        super().__init__()
+        super().__init__(credentials_path, quiet=quiet, lazy=lazy)
 
-        if self.get_credentials():
-            self.storage_client = storage.Client(
-                credentials = self.get_credentials(),
-                project = self.get_project_id()
-            )
-            self.logger.info("Storage client created successfully.")
-        else:
-            self.storage_client = None
-            self.logger.error("Failed to create storage client due to authentication failure.")
+        self._client_options = {
+            "credentials_path": credentials_path,
+            "api_endpoint": api_endpoint,
+            "shared_client": shared_client,
+            "pool_maxsize": pool_maxsize,
+        }
+        self._storage_client = _UNSET
+        self._client_lock = threading.Lock()
+        if not lazy:
+            self._create_client()
 
-    def get_bucket_metadata(self, bucket_name=None) -> dict:
+    @property
+    def storage_client(self):
         """
-        Return a formatted string with all specified bucket properties.
+        The ``storage.Client`` used by every operation, created on first access.
+
+        None if authentication failed, so ``if not self.storage_client`` guards both
+        the client creation and the failure check.
+        """
+        client = self._storage_client
+        if client is _UNSET:
+            client = self._create_client()
+        return client
+
+    @storage_client.setter
+    def storage_client(self, client):
+        self._storage_client = client
+
+    def _create_client(self):
+        """Helper method creating (or fetching the shared) storage client, once."""
+        with self._client_lock:
+            if self._storage_client is not _UNSET:
+                return self._storage_client
+            options = self._client_options
+            if self.get_credentials() and options["shared_client"]:
+                client = default_registry.get_client(
+                    self.get_credentials(),
+                    self.get_project_id(),
+                    credentials_path = options["credentials_path"],
+                    api_endpoint = options["api_endpoint"],
+                    pool_maxsize = options["pool_maxsize"]
+                )
+                self.logger.info("Storage client ready (shared).")
+            elif self.get_credentials():
+                api_endpoint = options["api_endpoint"]
+                client_options = {"api_endpoint": api_endpoint} if api_endpoint else None
+                client = storage.Client(
+                    credentials = self.get_credentials(),
+                    project = self.get_project_id(),
+                    client_options = client_options,
+                    _http = build_session(self.get_credentials(), pool_maxsize=options["pool_maxsize"])
+                )
+                self.logger.info("Storage client created successfully.")
+            else:
+                client = None
+                self.logger.error("Failed to create storage client due to authentication failure.")
+            self._storage_client = client
+            return client
+
+    @instrumented("get_bucket_metadata")
+    def get_bucket_metadata(self, bucket_name=None):
+        """
+        Return a formatted dictionary with all specified bucket properties.
         Documentation: https://cloud.google.com/storage/docs/bucket-metadata
+
+        Args:
+            bucket_name (str): The name of the bucket.
+
+        Returns:
+            dict or StorageError: The bucket details, or a falsy StorageError whose
+            ``kind`` tells what went wrong.
         """
         if not self.storage_client:
-            self.logger.error("Authentication failed. Storage client is not initialized.")
-            return "Authentication failed."
+            return self._auth_error("get_bucket_metadata", bucket_name)
         if not bucket_name:
-            self.logger.error("Bucket name cannot be empty.")
-            return "Bucket Name cannnot be empty"
+            return self._argument_error("get_bucket_metadata", "Bucket name cannot be empty.")
         try:
-            bucket = self.storage_client.get_bucket(bucket_name)
-            return self._format_bucket_details(bucket)
-        except NotFound:
-            self.logger.error(f"Bucket '{bucket_name}' not found.")
-            return f"Bucket '{bucket_name}' not found."
+            return self._get_bucket_details(bucket_name)
+        except exceptions.NotFound as e:
+            return self._error("get_bucket_metadata", e, "Bucket '%s' not found.", bucket_name,
+                               bucket=bucket_name, echo=False)
         except Exception as e:
-            self.logger.error(f"An error occurred while getting the bucket: {e}")
-            return f"An error occurred while getting the bucket: {e}"
+            return self._error("get_bucket_metadata", e, "An error occurred while getting the bucket: %s", e,
+                               bucket=bucket_name, echo=False)
+
+    def _get_bucket_details(self, bucket_name):
+        """
+        Helper method to fetch bucket details through the metadata cache.
+
+        A stale entry is revalidated with ``ifMetagenerationNotMatch``, so an unchanged
+        bucket costs a bodiless 304 instead of a full fetch.
+        """
+        key = ("bucket", bucket_name)
+        cached, fresh = self._cache_get(key)
+        if fresh:
+            return dict(cached)
+        try:
+            if cached is not None:
+                bucket = self.storage_client.get_bucket(
+                    bucket_name, if_metageneration_not_match=cached["metageneration"]
+                )
+            else:
+                bucket = self.storage_client.get_bucket(bucket_name)
+        except exceptions.NotModified:
+            self.metadata_cache.touch(key)
+            return dict(cached)
+        except exceptions.NotFound:
+            self._invalidate_bucket(bucket_name)
+            raise
+        details = self._format_bucket_details(bucket)
+        self._cache_set(key, details)
+        return dict(details)
+
+    def _cache_get(self, key):
+        """Helper method returning ``(value, fresh)`` from the metadata cache, if one is configured."""
+        if self.metadata_cache is None:
+            return None, False
+        return self.metadata_cache.get(key)
+
+    def _cache_set(self, key, value):
+        """Helper method storing a value in the metadata cache, if one is configured."""
+        if self.metadata_cache is not None:
+            self.metadata_cache.set(key, value)
+
+    def _invalidate_blob(self, bucket_name, blob_name):
+        """Helper method dropping a blob's cached metadata after it was written or deleted."""
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(("blob", bucket_name, blob_name))
+
+    def _invalidate_bucket(self, bucket_name):
+        """Helper method dropping a bucket's cached metadata along with all of its blobs."""
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(("bucket", bucket_name))
+            self.metadata_cache.invalidate_prefix(("blob", bucket_name))
+
+    def get_cache_stats(self):
+        """
+        Returns the metadata cache counters.
+
+        Returns:
+            dict or None: Hit/miss/eviction counters, or None if no cache is configured.
+        """
+        if self.metadata_cache is None:
+            return None
+        return self.metadata_cache.stats()
+
+    def get_pool_stats(self):
+        """
+        Returns the shared client registry and HTTP connection pool counters.
+
+        Returns:
+            dict: Registry hits/misses plus connections opened vs. reused across all shared clients.
+        """
+        return default_registry.stats()
+
+    def _error(self, operation, error, message, *args, bucket=None, blob=None, warning=False, echo=True):
+        """
+        Helper method that logs (and, outside quiet mode, prints) a failure and returns it as a StorageError.
+
+        ``message`` is a %-style template so nothing is formatted for disabled log levels.
+        """
+        (self.logger.warning if warning else self.logger.error)(message, *args)
+        if echo:
+            self._echo(message, *args)
+        return StorageError.from_exception(
+            operation, error, message % args if args else message, bucket=bucket, blob=blob
+        )
+
+    def _auth_error(self, operation, bucket_name=None, blob_name=None):
+        """Helper method returning the error reported when the storage client is not initialized."""
+        self.logger.error("Authentication failed. Storage client is not initialized.")
+        self._echo("Authentication failed.")
+        return StorageError(operation, "unauthenticated", "Authentication failed.", bucket_name, blob_name)
+
+    def _not_found_error(self, operation, message, *args, bucket=None, blob=None):
+        """Helper method that logs a missing bucket or blob as a warning and returns it as a StorageError."""
+        self.logger.warning(message, *args)
+        return StorageError(operation, "not_found", message % args, bucket, blob, 404)
+
+    def _argument_error(self, operation, message, bucket_name=None):
+        """Helper method returning the error reported for a missing or invalid argument."""
+        self.logger.error(message)
+        return StorageError(operation, "invalid_argument", message, bucket_name)
 
     def _format_bucket_details(self, bucket):
         """Helper method to format bucket details into a single string."""
@@ -79,6 +359,7 @@ class GCPStorage(GCPAuth):
             "labels": bucket.labels
         }
 
+    @instrumented("create_bucket")
     def create_bucket(
         self,
         bucket_name: str,
@@ -92,13 +373,18 @@ class GCPStorage(GCPAuth):
             bucket_name (str): The name of the bucket.
             location (str, optional): The location for the bucket. Defaults to "ASIA-SOUTH1".
             storage_class (str, optional): The storage class for the bucket. Defaults to "STANDARD".
+
+        Returns:
+            StorageResult: ``value`` holds the new bucket's details.
         """
         if not self.storage_client:
-            self.logger.error("Storage client is not initialized.")
-            return
+            error = self._auth_error("create_bucket", bucket_name)
+            return StorageResult("create_bucket", bucket_name, error=error)
 
-        self.logger.info(f"\nCreating bucket: '{bucket_name} in Region: {location} with Storage class: {storage_class}'...")
-        print(f"\nCreating bucket '{bucket_name}'...")
+        self.logger.info(
+            "Creating bucket '%s' in region %s with storage class %s...", bucket_name, location, storage_class
+        )
+        self._echo("\nCreating bucket '%s'...", bucket_name)
         try:
             bucket = self.storage_client.bucket(bucket_name)
 
@@ -107,208 +393,2027 @@ class GCPStorage(GCPAuth):
             bucket.storage_class = storage_class
 
             bucket.create()
+            self._invalidate_bucket(bucket_name)
             self.logger.info(
-                f"Created bucket {bucket.name} in {bucket.location} with storage class {bucket.storage_class}"
+                "Created bucket %s in %s with storage class %s", bucket.name, bucket.location, bucket.storage_class
             )
-            print(
-                f"Created bucket {bucket.name} in {bucket.location} with storage class {bucket.storage_class}"
+            self._echo(
+                "Created bucket %s in %s with storage class %s", bucket.name, bucket.location, bucket.storage_class
             )
+            return StorageResult("create_bucket", bucket_name, value=self._format_bucket_details(bucket))
         except Exception as e:
-            self.logger.error(f"Failed to create bucket '{bucket_name}': {e}")
-            print(f"Failed to create bucket '{bucket_name}': {e}")
+            error = self._error("create_bucket", e, "Failed to create bucket '%s': %s", bucket_name, e,
+                                bucket=bucket_name)
+            return StorageResult("create_bucket", bucket_name, error=error)
 
+    @instrumented("list_buckets")
     def list_buckets(self):
         """
         Lists all buckets in the authenticated project.
         Documentation: https://cloud.google.com/storage/docs/listing-buckets
+
+        Returns:
+            StorageResult: ``value`` holds the bucket names.
         """
         if not self.storage_client:
-            self.logger.error("Authentication failed.")
-            return
+            return StorageResult("list_buckets", error=self._auth_error("list_buckets"))
 
-        self.logger.info("\nListing buckets in the project:")
+        self.logger.info("Listing buckets in the project...")
+        self._echo("\nListing buckets in the project:")
         try:
-            buckets = self.storage_client.list_buckets()
-            for bucket in buckets:
-                self.logger.info(f"- {bucket.name}")
-                print(f"- {bucket.name}")
+            names = []
+            for bucket in self.storage_client.list_buckets():
+                names.append(bucket.name)
+                self.logger.debug("- %s", bucket.name)
+                self._echo("- %s", bucket.name)
+            return StorageResult("list_buckets", value=names)
         except Exception as e:
-            print(f"An error occurred while listing buckets: {e}")
+            error = self._error("list_buckets", e, "An error occurred while listing buckets: %s", e)
+            return StorageResult("list_buckets", error=error)
 
+    @instrumented("delete_bucket")
     def delete_bucket(self, bucket_name):
-        """Deletes an empty bucket."""
+        """
+        Deletes an empty bucket.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+
+        Returns:
+            StorageResult: ``error.kind`` is ``"not_found"`` if the bucket did not exist.
+        """
         if not self.storage_client:
-            self.logger.error("Authentication failed.")
-            print("Authentication failed.")
-            return
+            error = self._auth_error("delete_bucket", bucket_name)
+            return StorageResult("delete_bucket", bucket_name, error=error)
 
-        self.logger.info(f"\nDeleting bucket '{bucket_name}'...")
-        print(f"\nDeleting bucket '{bucket_name}'...")
+        self.logger.info("Deleting bucket '%s'...", bucket_name)
+        self._echo("\nDeleting bucket '%s'...", bucket_name)
         try:
             bucket = self.storage_client.bucket(bucket_name)
             bucket.delete()
-            self.logger.info(f"Bucket '{bucket_name}' deleted successfully.")
-            print(f"Bucket '{bucket_name}' deleted successfully.")
-        except NotFound:
-            self.logger.warning(f"Bucket '{bucket_name}' not found.")
-            print(f"Bucket '{bucket_name}' not found.")
+            self._invalidate_bucket(bucket_name)
+            self.logger.info("Bucket '%s' deleted successfully.", bucket_name)
+            self._echo("Bucket '%s' deleted successfully.", bucket_name)
+            return StorageResult("delete_bucket", bucket_name)
+        except exceptions.NotFound as e:
+            error = self._error("delete_bucket", e, "Bucket '%s' not found.", bucket_name,
+                                bucket=bucket_name, warning=True)
         except Exception as e:
-            self.logger.error(f"Failed to delete bucket '{bucket_name}': {e}")
-            print(f"Failed to delete bucket '{bucket_name}': {e}")
+            error = self._error("delete_bucket", e, "Failed to delete bucket '%s': %s", bucket_name, e,
+                                bucket=bucket_name)
+        return StorageResult("delete_bucket", bucket_name, error=error)
 
+    @instrumented("create_blob", direction="sent")
     def create_blob(self, bucket_name, source_file_name, destination_blob_name):
-        """Uploads a file to the specified bucket."""
+        """
+        Uploads a file to the specified bucket.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            source_file_name (str): The local file to upload.
+            destination_blob_name (str): The name of the blob.
+
+        Returns:
+            StorageResult: ``value`` holds the number of bytes uploaded; ``error.kind`` is
+            ``"not_found"`` if the bucket does not exist.
+        """
+        if not self.storage_client:
+            error = self._auth_error("create_blob", bucket_name, destination_blob_name)
+            return StorageResult("create_blob", bucket_name, destination_blob_name, error=error)
+
+        self.logger.info(
+            "Uploading '%s' to '%s' in bucket '%s'...", source_file_name, destination_blob_name, bucket_name
+        )
+        self._echo(
+            "\nUploading '%s' to '%s' in bucket '%s'...", source_file_name, destination_blob_name, bucket_name
+        )
+        try:
+            bucket = self.storage_client.bucket(bucket_name)
+            if (
+                self.composite_upload_threshold
+                and os.path.getsize(source_file_name) >= self.composite_upload_threshold
+            ):
+                self._composite_upload(
+                    bucket, source_file_name, destination_blob_name, self.composite_upload_parts
+                )
+            elif (
+                self.resumable_upload_threshold
+                and os.path.getsize(source_file_name) >= self.resumable_upload_threshold
+            ):
+                # The helper raises the underlying API error, so it is classified like any other upload's.
+                progress = {}
+                try:
+                    self._upload_resumable(progress, bucket_name, source_file_name, destination_blob_name)
+                except Exception:
+                    self.logger.info(
+                        "Upload checkpoint kept; re-run to resume '%s' from byte %s.",
+                        source_file_name, progress.get("bytes", 0)
+                    )
+                    raise
+            else:
+                blob = bucket.blob(destination_blob_name)
+                blob.upload_from_filename(source_file_name)
+            self._invalidate_blob(bucket_name, destination_blob_name)
+            self.logger.info("File '%s' uploaded successfully.", source_file_name)
+            self._echo("File '%s' uploaded successfully.", source_file_name)
+            return StorageResult(
+                "create_blob", bucket_name, destination_blob_name, value=os.path.getsize(source_file_name)
+            )
+        except exceptions.NotFound as e:
+            error = self._error("create_blob", e, "Bucket '%s' not found.", bucket_name,
+                                bucket=bucket_name, blob=destination_blob_name)
+        except Exception as e:
+            error = self._error("create_blob", e, "An error occurred while uploading: %s", e,
+                                bucket=bucket_name, blob=destination_blob_name)
+        return StorageResult("create_blob", bucket_name, destination_blob_name, error=error)
+
+    @instrumented("upload_composite", direction="sent")
+    def upload_composite(self, bucket_name, source_file_name, destination_blob_name, parts=8):
+        """
+        Uploads a large file as parallel parts joined server-side with ``compose``.
+
+        The file is split into ``parts`` byte ranges that are uploaded concurrently as
+        temporary objects, composed into the destination (through intermediate compose
+        calls when there are more than 32 components), and then deleted.
+
+        Documentation: https://cloud.google.com/storage/docs/parallel-composite-uploads
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            source_file_name (str): The local file to upload.
+            destination_blob_name (str): The name of the resulting blob.
+            parts (int, optional): Number of parts uploaded concurrently. Defaults to 8.
+
+        Returns:
+            dict: ``status`` ("uploaded" or "failed"), ``error``, ``bytes``, ``parts``,
+            ``component_count``, ``elapsed_seconds`` and ``mb_per_sec``.
+            A falsy StorageError if the client is not initialized.
+        """
         if not self.storage_client:
-            self.logger.error("Authentication failed.")
-            print("Authentication failed.")
-            return
+            return self._auth_error("upload_composite", bucket_name, destination_blob_name)
 
-        self.logger.info(f"\nUploading '{source_file_name}' to '{destination_blob_name}' in bucket '{bucket_name}'...")
-        print(f"\nUploading '{source_file_name}' to '{destination_blob_name}' in bucket '{bucket_name}'...")
+        result = {"source": source_file_name, "destination": destination_blob_name,
+                  "status": "uploaded", "error": None}
+        started_at = time.perf_counter()
         try:
             bucket = self.storage_client.bucket(bucket_name)
-            blob = bucket.blob(destination_blob_name)
-            blob.upload_from_filename(source_file_name)
-            self.logger.info(f"File '{source_file_name}' uploaded successfully.")
-            print(f"File '{source_file_name}' uploaded successfully.")
-        except NotFound:
-            self.logger.error(f"Bucket '{bucket_name}' not found.")
-            print(f"Bucket '{bucket_name}' not found.")
+            result.update(self._composite_upload(bucket, source_file_name, destination_blob_name, parts))
+        except exceptions.NotFound as e:
+            result["status"] = "failed"
+            result["error"] = f"Bucket '{bucket_name}' not found."
+            result["error_type"] = type(e).__name__
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = str(e)
+            result["error_type"] = type(e).__name__
+        elapsed = time.perf_counter() - started_at
+        result["elapsed_seconds"] = elapsed
+        if result["status"] == "uploaded":
+            result["mb_per_sec"] = round(result["bytes"] / (1024 * 1024) / elapsed, 3) if elapsed else 0.0
+            self.logger.info(
+                "Composite upload of '%s' to '%s' finished "
+                "(%s parts, %s MB/sec).",
+                source_file_name, destination_blob_name, result["parts"], result["mb_per_sec"]
+            )
+        else:
+            self.logger.error("Composite upload of '%s' failed: %s", source_file_name, result["error"])
+        return result
+
+    def _composite_upload(self, bucket, source_file_name, destination_blob_name, parts):
+        """
+        Helper method that performs a parallel composite upload and raises on failure.
+
+        Temporary objects are always cleaned up, even when the upload fails part way.
+        """
+        size = os.path.getsize(source_file_name)
+        part_size = max(1, -(-size // max(1, parts)))
+        ranges = [(offset, min(part_size, size - offset)) for offset in range(0, size, part_size)] or [(0, 0)]
+        token = uuid.uuid4().hex[:12]
+        temp_name = f"{destination_blob_name}.__composite-{token}"
+        content_type = mimetypes.guess_type(source_file_name)[0] or "application/octet-stream"
+        temporaries = []
+
+        def upload_part(index_and_range):
+            index, (offset, length) = index_and_range
+            blob = bucket.blob(f"{temp_name}-{index:05d}")
+            # Registered before the request, so a part still in flight when another fails is cleaned up too.
+            temporaries.append(blob)
+            with open(source_file_name, "rb") as source:
+                source.seek(offset)
+                blob.upload_from_file(source, size=length, content_type=content_type)
+            return index, blob
+
+        def compose_group(index_and_group):
+            index, (name, group) = index_and_group
+            blob = bucket.blob(name)
+            blob.content_type = content_type
+            temporaries.append(blob)
+            blob.compose(group)
+            return index, blob
+
+        try:
+            uploaded = sorted(run_bounded(upload_part, enumerate(ranges), max_workers=min(len(ranges), 32)))
+            components = [blob for _, blob in uploaded]
+
+            # Compose in a tree: each level joins up to 32 objects per call.
+            level = 0
+            while len(components) > self.MAX_COMPOSE_COMPONENTS:
+                step = self.MAX_COMPOSE_COMPONENTS
+                groups = [
+                    (f"{temp_name}-L{level + 1}-{i // step:05d}", components[i:i + step])
+                    for i in range(0, len(components), step)
+                ]
+                composed = sorted(run_bounded(compose_group, enumerate(groups), max_workers=min(len(groups), 32)))
+                components = [blob for _, blob in composed]
+                level += 1
+
+            destination = bucket.blob(destination_blob_name)
+            destination.content_type = content_type
+            destination.compose(components)
+            self._invalidate_blob(bucket.name, destination_blob_name)
+        finally:
+            def delete(blob):
+                try:
+                    blob.delete()
+                except exceptions.NotFound:
+                    pass
+                except Exception as e:
+                    self.logger.warning("Failed to delete temporary object '%s': %s", blob.name, e)
+            list(run_bounded(delete, temporaries, max_workers=8))
+
+        return {
+            "bytes": size,
+            "parts": len(ranges),
+            "component_count": destination.component_count,
+        }
+
+    @instrumented("upload_resumable", direction="sent")
+    def upload_resumable(
+        self,
+        bucket_name: str,
+        source_file_name: str,
+        destination_blob_name: str,
+        chunk_size: int = None,
+        checkpoint_path: str = None,
+        retries: int = 5,
+        content_type: str = None,
+        verify: bool = True
+    ):
+        """
+        Uploads a file through a GCS resumable session, checkpointing every acknowledged chunk.
+
+        The session URI and the source file's size and mtime are saved to a checkpoint
+        file as soon as the session is created. A later call for the same file (in this
+        process or after a restart) asks GCS how many bytes it already holds and
+        continues from there, instead of uploading the file again. Transient failures
+        (429, 5xx, dropped connections) are retried with capped exponential backoff and
+        jitter; other errors fail immediately. The checkpoint is removed on success and
+        discarded if the source file changes or the session has expired.
+
+        Documentation: https://cloud.google.com/storage/docs/performing-resumable-uploads
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            source_file_name (str): The local file to upload.
+            destination_blob_name (str): The name of the blob.
+            chunk_size (int, optional): Bytes sent per request, a multiple of 256 KiB.
+                Defaults to ``RESUMABLE_CHUNK_SIZE`` (16 MiB).
+            checkpoint_path (str, optional): Checkpoint file. Defaults to a file in
+                ``checkpoint_dir`` named after the bucket, blob and source path.
+            retries (int, optional): Consecutive failed attempts allowed before giving up;
+                the count resets whenever a chunk is acknowledged. Defaults to 5.
+            content_type (str, optional): Defaults to a type guessed from the file name.
+            verify (bool, optional): Compare the stored crc32c with the local file. Defaults to True.
+
+        Returns:
+            dict: ``status`` ("uploaded" or "failed"), ``error``, ``bytes`` (acknowledged so
+            far), ``resumed_from`` (offset recovered from a previous run), ``retries``,
+            ``elapsed_seconds``, ``mb_per_sec``, ``generation`` and ``checkpoint``.
+            A falsy StorageError if the client is not initialized.
+        """
+        if not self.storage_client:
+            return self._auth_error("upload_resumable", bucket_name, destination_blob_name)
+
+        result = {}
+        started_at = time.perf_counter()
+        try:
+            self._upload_resumable(
+                result, bucket_name, source_file_name, destination_blob_name, chunk_size, checkpoint_path,
+                retries, content_type, verify
+            )
         except Exception as e:
-            self.logger.error(f"An error occurred while uploading: {e}")
-            print(f"An error occurred while uploading: {e}")
+            result["status"] = "failed"
+            result["error"] = f"Bucket '{bucket_name}' not found." if isinstance(e, exceptions.NotFound) else str(e)
+            result["error_type"] = type(e).__name__
+            result["elapsed_seconds"] = time.perf_counter() - started_at
+            self.logger.error("An error occurred while uploading '%s': %s", source_file_name, result["error"])
+        return result
+
+    def _upload_resumable(
+        self,
+        result,
+        bucket_name,
+        source_file_name,
+        destination_blob_name,
+        chunk_size=None,
+        checkpoint_path=None,
+        retries=5,
+        content_type=None,
+        verify=True
+    ):
+        """
+        Helper method running upload_resumable, filling ``result`` as it goes and raising on failure.
+
+        The checkpoint is kept on failure, so calling it again resumes the upload.
+        """
+        chunk_size = chunk_size or self.RESUMABLE_CHUNK_SIZE
+        checkpoint = TransferCheckpoint(
+            checkpoint_path
+            or self._checkpoint_path("upload", bucket_name, destination_blob_name, source_file_name)
+        )
+        result.update({
+            "bucket": bucket_name,
+            "name": destination_blob_name,
+            "source": source_file_name,
+            "status": "uploaded",
+            "error": None,
+            "bytes": 0,
+            "resumed_from": 0,
+            "retries": 0,
+            "elapsed_seconds": 0.0,
+            "mb_per_sec": 0.0,
+            "generation": None,
+            "checkpoint": checkpoint.path,
+        })
+        started_at = time.perf_counter()
+        stat = os.stat(source_file_name)
+        size = stat.st_size
+        identity = {
+            "bucket": bucket_name,
+            "name": destination_blob_name,
+            "source": os.path.abspath(source_file_name),
+            "size": size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        state = checkpoint.load()
+        if state is not None and any(state.get(key) != value for key, value in identity.items()):
+            self.logger.info("Discarding stale upload checkpoint '%s'.", checkpoint.path)
+            state = None
+
+        blob = self.storage_client.bucket(bucket_name).blob(destination_blob_name)
+        content_type = content_type or mimetypes.guess_type(source_file_name)[0] or "application/octet-stream"
+        resource = None
+        offset = 0
+        # A checkpointed session must first be asked how far it got.
+        needs_query = state is not None
+        first_query = needs_query
+        attempts = 0
+        with open(source_file_name, "rb") as handle:
+            while resource is None:
+                try:
+                    if state is None:
+                        session_url = blob.create_resumable_upload_session(
+                            content_type=content_type, size=size, client=self.storage_client
+                        )
+                        state = dict(identity, session_url=session_url, offset=0)
+                        checkpoint.save(state)
+                        offset = 0
+                    elif needs_query:
+                        try:
+                            offset, resource = self._send_upload_chunk(state["session_url"], b"", 0, size)
+                        except exceptions.ClientError as e:
+                            if e.code not in (404, 410):
+                                raise
+                            self.logger.warning(
+                                "Upload session for '%s' expired; restarting.", destination_blob_name
+                            )
+                            state = None
+                            continue
+                        needs_query = False
+                        if first_query:
+                            result["resumed_from"] = offset
+                            first_query = False
+                            self.logger.info("Resuming upload of '%s' at byte %s.", source_file_name, offset)
+                    else:
+                        handle.seek(offset)
+                        offset, resource = self._send_upload_chunk(
+                            state["session_url"], handle.read(chunk_size), offset, size
+                        )
+                        state["offset"] = offset
+                        checkpoint.save(state)
+                        attempts = 0
+                    result["bytes"] = offset
+                except Exception as e:
+                    attempts += 1
+                    if attempts > retries or not is_retryable(e):
+                        raise
+                    result["retries"] += 1
+                    self.logger.warning(
+                        "Retrying upload of '%s' at byte %s (attempt %s): %s",
+                        source_file_name, offset, attempts, e
+                    )
+                    time.sleep(backoff_delay(attempts))
+                    needs_query = state is not None
+
+        blob._set_properties(resource)
+        self._invalidate_blob(bucket_name, destination_blob_name)
+        if verify and blob.crc32c and blob.crc32c != file_crc32c(source_file_name):
+            checkpoint.clear()
+            raise ValueError(f"Checksum validation failed for '{destination_blob_name}': crc32c mismatch.")
+        checkpoint.clear()
+
+        result["bytes"] = size
+        result["generation"] = blob.generation
+        elapsed = time.perf_counter() - started_at
+        result["elapsed_seconds"] = elapsed
+        sent = size - result["resumed_from"]
+        result["mb_per_sec"] = round(sent / (1024 * 1024) / elapsed, 3) if elapsed else 0.0
+        self.logger.info(
+            "Uploaded '%s' to '%s' in bucket '%s' "
+            "(%s retries, resumed from byte %s).",
+            source_file_name, destination_blob_name, bucket_name, result["retries"], result["resumed_from"]
+        )
+
+    def _send_upload_chunk(self, session_url, data, offset, size):
+        """
+        Helper method that PUTs one chunk to a resumable session.
+
+        An empty ``data`` sends a status query instead. Returns ``(offset, resource)``:
+        the next byte GCS expects and, once the upload is complete, the object resource.
+        Non-2xx/308 responses raise the matching ``google.api_core`` exception.
+        """
+        if data:
+            content_range = f"bytes {offset}-{offset + len(data) - 1}/{size}"
+        else:
+            content_range = f"bytes */{size}"
+        response = self.storage_client._http.put(
+            session_url, data=data, headers={"Content-Range": content_range}, timeout=300
+        )
+        if response.status_code in (200, 201):
+            return size, response.json()
+        if response.status_code == 308:
+            received = response.headers.get("Range")
+            return (int(received.rsplit("-", 1)[1]) + 1 if received else 0), None
+        raise exceptions.from_http_status(response.status_code, response.text)
+
+    def _checkpoint_path(self, kind, bucket_name, blob_name, local_path):
+        """Helper method naming the default checkpoint file of a transfer."""
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        key = f"{kind}\n{bucket_name}\n{blob_name}\n{os.path.abspath(local_path)}"
+        return os.path.join(self.checkpoint_dir, f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json")
+
+    def open_blob_writer(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        compression: str = None,
+        content_type: str = None,
+        chunk_size: int = None,
+        compression_level: int = None,
+        metadata: dict = None,
+        retries: int = 5
+    ):
+        """
+        Opens a writable file-like object that streams into a blob.
+
+        Data is compressed on the fly when ``compression`` is set (and the blob's
+        ``content_encoding`` set to match) and sent through a resumable upload in
+        ``chunk_size`` pieces, so memory is bounded by one chunk whatever the object
+        size. The object appears when the writer is closed; leaving a ``with`` block
+        with an exception cancels the upload instead. See :class:`BlobWriter`.
+
+        Documentation: https://cloud.google.com/storage/docs/performing-resumable-uploads#chunked-upload
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+            compression (str, optional): ``"gzip"`` or ``"zstd"`` (needs the ``zstandard``
+                package). Defaults to None (stored as written).
+            content_type (str, optional): Defaults to a type guessed from the blob name.
+            chunk_size (int, optional): Bytes sent per request, a multiple of 256 KiB.
+                Defaults to ``RESUMABLE_CHUNK_SIZE`` (16 MiB).
+            compression_level (int, optional): Compressor level.
+            metadata (dict, optional): Custom object metadata.
+            retries (int, optional): Consecutive failed attempts allowed per chunk. Defaults to 5.
+
+        Returns:
+            BlobWriter: The writer; its ``result`` holds the upload report once closed.
+
+        Raises:
+            RuntimeError: If the client is not initialized.
+            ValueError: If ``chunk_size`` or ``compression`` is invalid.
+        """
+        if not self.storage_client:
+            self._auth_error("open_blob_writer", bucket_name, blob_name).raise_error()
+        return BlobWriter(
+            self, bucket_name, blob_name, chunk_size or self.RESUMABLE_CHUNK_SIZE,
+            content_type=content_type, compression=compression, compression_level=compression_level,
+            metadata=metadata, retries=retries
+        )
+
+    @instrumented("upload_stream", direction="sent")
+    def upload_stream(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        source,
+        compression: str = None,
+        content_type: str = None,
+        chunk_size: int = None
+    ):
+        """
+        Uploads everything read from a file-like object or iterator, without a temporary file.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+            source: A file-like object (anything with ``read(size)``) or an iterable of
+                ``bytes``/``str`` chunks. Text (from text-mode files or ``str`` chunks) is
+                encoded as UTF-8.
+            compression (str, optional): ``"gzip"`` or ``"zstd"``. Defaults to None.
+            content_type (str, optional): Defaults to a type guessed from the blob name.
+            chunk_size (int, optional): Bytes sent per request. Defaults to ``RESUMABLE_CHUNK_SIZE``.
+
+        Returns:
+            dict: The writer report: ``status`` ("uploaded" or "failed"), ``error``,
+            ``error_type`` on failure, ``bytes`` (stored), ``raw_bytes`` (read from
+            ``source``), ``content_encoding``, ``chunks``, ``retries``, ``elapsed_seconds``,
+            ``mb_per_sec`` and ``generation``. A falsy StorageError if the client is not initialized.
+        """
+        if not self.storage_client:
+            return self._auth_error("upload_stream", bucket_name, blob_name)
+
+        chunk_size = chunk_size or self.RESUMABLE_CHUNK_SIZE
+
+        def read_pieces():
+            # Text-mode sources return "" rather than b"" at EOF, so stop on any empty read.
+            while True:
+                piece = source.read(chunk_size)
+                if not piece:
+                    return
+                yield piece
+
+        pieces = read_pieces() if hasattr(source, "read") else source
+        pieces = (piece.encode("utf-8") if isinstance(piece, str) else piece for piece in pieces)
+        writer = None
+        try:
+            writer = self.open_blob_writer(
+                bucket_name, blob_name, compression=compression, content_type=content_type, chunk_size=chunk_size
+            )
+            with writer:
+                for piece in pieces:
+                    if piece:
+                        writer.write(piece)
+            return writer.result
+        except Exception as e:
+            if writer is not None and writer.result["status"] == "failed":
+                return writer.result
+            result = writer.result if writer is not None else {"bucket": bucket_name, "name": blob_name}
+            result.update(status="failed", error=str(e), error_type=type(e).__name__)
+            self.logger.error("An error occurred while streaming '%s': %s", blob_name, e)
+            return result
+
+    @instrumented("write_ndjson", direction="sent")
+    def write_ndjson(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        records,
+        compression: str = None,
+        content_type: str = "application/x-ndjson",
+        chunk_size: int = None
+    ):
+        """
+        Streams records into a newline-delimited JSON blob, the format ``stream_ndjson`` reads.
+
+        Records are serialized lazily, so a generator of any length is uploaded with
+        memory bounded by one upload chunk.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+            records (iterable): JSON-serializable values, one per line.
+            compression (str, optional): ``"gzip"`` or ``"zstd"``. Defaults to None.
+            content_type (str, optional): Defaults to ``application/x-ndjson``.
+            chunk_size (int, optional): Bytes sent per request. Defaults to ``RESUMABLE_CHUNK_SIZE``.
+
+        Returns:
+            dict: The :meth:`upload_stream` report plus ``records``, the number of lines written,
+            or a falsy StorageError if the client is not initialized.
+        """
+        stats = {}
+        result = self.upload_stream(
+            bucket_name, blob_name, encode_ndjson(records, stats=stats), compression=compression,
+            content_type=content_type, chunk_size=chunk_size
+        )
+        if not isinstance(result, StorageError):
+            result["records"] = stats.get("records", 0)
+        return result
+
+    @instrumented("upload_many", direction="sent")
+    def upload_many(self, bucket_name, files, max_workers=8, base_dir=None):
+        """
+        Uploads many files to the specified bucket over a bounded thread pool.
+
+        All workers share the single ``storage_client`` (and so its HTTP session).
+        Nothing is printed per file; each upload is reported in the returned results.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            files (iterable): Local file paths, or ``(source_file_name, destination_blob_name)``
+                pairs. A bare path is uploaded under its path relative to ``base_dir``.
+            max_workers (int, optional): Number of concurrent uploads. Defaults to 8.
+            base_dir (str, optional): Directory bare paths are named relative to; a path
+                outside it is reported as failed. Defaults to None: a relative path keeps its
+                own name and an absolute path is uploaded under its file name.
+
+        Returns:
+            dict: ``results`` (one dict per file with ``source``, ``destination``, ``status``,
+            ``bytes``, ``elapsed_seconds`` and ``error``) and ``summary`` (aggregate counts,
+            files/sec and MB/sec). A falsy StorageError if the client is not initialized.
+        """
+        if not self.storage_client:
+            return self._auth_error("upload_many", bucket_name)
+
+        bucket = self.storage_client.bucket(bucket_name)
+
+        def upload(item):
+            if isinstance(item, (str, os.PathLike)):
+                source, destination = os.fspath(item), self._bare_path_name(item, base_dir)
+            else:
+                source, destination = item
+            result = {
+                "source": source,
+                "destination": destination,
+                "status": "uploaded",
+                "bytes": 0,
+                "elapsed_seconds": 0.0,
+                "error": None,
+            }
+            started = time.perf_counter()
+            if destination is None:
+                result["status"] = "failed"
+                result["error"] = f"'{source}' is not under '{base_dir}'."
+                return result
+            try:
+                bucket.blob(destination).upload_from_filename(source)
+                self._invalidate_blob(bucket_name, destination)
+                result["bytes"] = os.path.getsize(source)
+            except exceptions.NotFound:
+                result["status"] = "failed"
+                result["error"] = f"Bucket '{bucket_name}' not found."
+            except Exception as e:
+                result["status"] = "failed"
+                result["error"] = str(e)
+            result["elapsed_seconds"] = time.perf_counter() - started
+            return result
+
+        self.logger.info("Uploading files to bucket '%s' with %s workers...", bucket_name, max_workers)
+        started_at = time.perf_counter()
+        results = list(run_bounded(upload, files, max_workers=max_workers))
+        summary = summarize(results, started_at, ok_status="uploaded")
+        self.logger.info(
+            "Uploaded %s/%s files to '%s' "
+            "(%s files/sec, %s MB/sec).",
+            summary["succeeded"], summary["files"], bucket_name, summary["files_per_sec"], summary["mb_per_sec"]
+        )
+        for result in results:
+            if result["status"] == "failed":
+                self.logger.error("Failed to upload '%s': %s", result["source"], result["error"])
+        return {"results": results, "summary": summary}
+
+    @staticmethod
+    def _bare_path_name(path, base_dir):
+        """Helper method naming the blob for a bare local path; None if it lies outside ``base_dir``."""
+        path = os.fspath(path)
+        if base_dir is not None:
+            path = os.path.relpath(os.path.abspath(path), os.path.abspath(base_dir))
+            if path == os.pardir or path.startswith(os.pardir + os.sep):
+                return None
+        elif os.path.isabs(path):
+            path = os.path.basename(path)
+        return os.path.normpath(path).replace(os.sep, "/").lstrip("/")
+
+    def upload_directory(self, bucket_name, source_dir, prefix="", max_workers=8):
+        """
+        Uploads a local directory tree to the bucket, mirroring its layout under ``prefix``.
+
+        The tree is walked lazily, so very large directories are never listed up front.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            source_dir (str): The local directory to upload.
+            prefix (str, optional): Blob name prefix, e.g. ``"json/"``. Defaults to the bucket root.
+            max_workers (int, optional): Number of concurrent uploads. Defaults to 8.
+
+        Returns:
+            dict: Same structure as :meth:`upload_many`.
+        """
+        def walk():
+            for root, _dirs, file_names in os.walk(source_dir):
+                for file_name in file_names:
+                    source = os.path.join(root, file_name)
+                    relative = os.path.relpath(source, source_dir).replace(os.sep, "/")
+                    yield source, f"{prefix}{relative}"
+
+        return self.upload_many(bucket_name, walk(), max_workers=max_workers)
+
+    @instrumented("sync", direction="sent")
+    def sync(
+        self,
+        local_dir: str,
+        bucket_name: str,
+        prefix: str = "",
+        manifest_path: str = None,
+        delete: bool = False,
+        full_scan: bool = False,
+        dry_run: bool = False,
+        max_workers: int = 8
+    ):
+        """
+        Incrementally mirrors a local directory tree to ``prefix`` in a bucket.
+
+        A SQLite manifest remembers the size, mtime and crc32c of every file synced.
+        Files whose size and mtime match the manifest are skipped outright; the rest
+        are hashed and compared (crc32c) in parallel, and only real changes are uploaded.
+        The remote prefix is listed only on the first run (or with ``full_scan``), so
+        objects that already match are adopted instead of re-uploaded.
+
+        Args:
+            local_dir (str): The local directory to sync from.
+            bucket_name (str): The name of the bucket.
+            prefix (str, optional): Blob name prefix, e.g. ``"json/"``. Defaults to the bucket root.
+            manifest_path (str, optional): SQLite manifest location. Defaults to
+                ``.gcs_sync_manifest.sqlite`` inside ``local_dir``. Neither it nor a file of
+                that name anywhere in the tree is ever uploaded.
+            delete (bool, optional): Delete remote objects whose local file was removed. Defaults to False.
+            full_scan (bool, optional): List the remote prefix even if the manifest is populated,
+                catching objects changed outside of sync. Defaults to False.
+            dry_run (bool, optional): Report what would change without uploading or deleting.
+            max_workers (int, optional): Number of concurrent hash/upload workers. Defaults to 8.
+
+        Returns:
+            dict: ``results`` (one dict per changed file with ``path``, ``destination``,
+            ``status`` and ``error``) and ``summary`` (scanned, skipped, uploaded, deleted,
+            failed, bytes and timings). A falsy StorageError if the run
+            could not complete (client not initialized, bucket not found, listing failed).
+        """
+        if not self.storage_client:
+            return self._auth_error("sync", bucket_name)
+
+        manifest_path = manifest_path or os.path.join(local_dir, DEFAULT_MANIFEST_NAME)
+        manifest = SyncManifest(manifest_path)
+        bucket = self.storage_client.bucket(bucket_name)
+        started_at = time.perf_counter()
+        counters = {
+            "scanned": 0, "skipped": 0, "uploaded": 0, "adopted": 0, "deleted": 0, "failed": 0, "bytes": 0
+        }
+        results = []
+
+        try:
+            # Entries are popped as files are found, so whatever is left was deleted locally.
+            known = manifest.load(bucket_name, prefix)
+            remote = {}
+            if full_scan or not known:
+                for record in self.iter_blobs(bucket_name, prefix=prefix or None):
+                    remote[record["name"][len(prefix):]] = (record["size"], record["crc32c"], record["generation"])
+            remote_unseen = set(remote)
+
+            def candidates():
+                # A default manifest is never data, even one left by a run with another manifest_path.
+                exclude_names = manifest_files(DEFAULT_MANIFEST_NAME)
+                files = walk_files(local_dir, exclude=manifest_files(manifest_path), exclude_names=exclude_names)
+                for relative, full_path, size, mtime_ns in files:
+                    counters["scanned"] += 1
+                    row = known.pop(relative, None)
+                    remote_unseen.discard(relative)
+                    if row is not None and row[0] == size and row[1] == mtime_ns and not full_scan:
+                        counters["skipped"] += 1
+                        continue
+                    known_crc32c = row[2] if row is not None else None
+                    if relative in remote and remote[relative][0] == size:
+                        known_crc32c = remote[relative][1]
+                    yield relative, full_path, size, mtime_ns, known_crc32c
+
+            def upload(item):
+                relative, full_path, size, mtime_ns, known_crc32c = item
+                result = {
+                    "path": relative,
+                    "destination": f"{prefix}{relative}",
+                    "status": "uploaded",
+                    "bytes": 0,
+                    "error": None,
+                    "row": None,
+                }
+                try:
+                    crc32c = file_crc32c(full_path)
+                    generation = remote.get(relative, (None, None, None))[2]
+                    if crc32c == known_crc32c:
+                        result["status"] = "unchanged"
+                    elif dry_run:
+                        result["status"] = "would_upload"
+                    else:
+                        blob = bucket.blob(result["destination"])
+                        blob.upload_from_filename(full_path)
+                        self._invalidate_blob(bucket_name, result["destination"])
+                        if blob.crc32c and blob.crc32c != crc32c:
+                            raise ValueError("File changed while it was being uploaded.")
+                        generation = blob.generation
+                        result["bytes"] = size
+                    result["row"] = (relative, size, mtime_ns, crc32c, generation)
+                except Exception as e:
+                    result["status"] = "failed"
+                    result["error"] = str(e)
+                return result
+
+            pending_rows = []
+            for result in run_bounded(upload, candidates(), max_workers=max_workers):
+                row = result.pop("row")
+                if result["status"] == "unchanged":
+                    counters["adopted"] += 1
+                elif result["status"] == "failed":
+                    counters["failed"] += 1
+                    results.append(result)
+                else:
+                    counters["uploaded"] += result["status"] == "uploaded"
+                    counters["bytes"] += result["bytes"]
+                    results.append(result)
+                if row is not None and not dry_run:
+                    pending_rows.append(row)
+                    if len(pending_rows) >= 1000:
+                        manifest.record(bucket_name, prefix, pending_rows)
+                        manifest.commit()
+                        pending_rows = []
+            manifest.record(bucket_name, prefix, pending_rows)
+            manifest.commit()
+
+            if delete:
+                # Remote objects sync never uploaded are only known from a listing.
+                removed = sorted(set(known) | remote_unseen)
+                report = self.delete_blobs(
+                    bucket_name, [f"{prefix}{name}" for name in removed], dry_run=dry_run
+                )
+                if isinstance(report, StorageError):
+                    report.raise_error()
+                for item in report["results"]:
+                    status = {
+                        "deleted": "deleted", "not_found": "deleted", "dry_run": "would_delete"
+                    }.get(item["status"], "failed")
+                    results.append({
+                        "path": item["name"][len(prefix):],
+                        "destination": item["name"],
+                        "status": status,
+                        "bytes": 0,
+                        "error": None if status != "failed" else item["error"],
+                    })
+                    counters["deleted"] += status == "deleted"
+                    counters["failed"] += status == "failed"
+                if not dry_run:
+                    manifest.remove(
+                        bucket_name, prefix, [r["path"] for r in results if r["status"] == "deleted"]
+                    )
+        except exceptions.NotFound as e:
+            return self._error("sync", e, "Bucket '%s' not found.", bucket_name, bucket=bucket_name, echo=False)
+        except Exception as e:
+            return self._error("sync", e, "An error occurred while syncing '%s': %s", local_dir, e,
+                               bucket=bucket_name, echo=False)
+        finally:
+            manifest.close()
+
+        elapsed = time.perf_counter() - started_at
+        summary = dict(counters)
+        summary["dry_run"] = dry_run
+        summary["elapsed_seconds"] = round(elapsed, 6)
+        summary["mb_per_sec"] = round(counters["bytes"] / (1024 * 1024) / elapsed, 3) if elapsed else 0.0
+        self.logger.info(
+            "Synced '%s' to '%s/%s': %s uploaded, %s deleted, %s unchanged, %s failed.",
+            local_dir, bucket_name, prefix, counters["uploaded"], counters["deleted"],
+            counters["skipped"] + counters["adopted"], counters["failed"]
+        )
+        return {"results": results, "summary": summary}
+
+    def iter_blobs(
+        self,
+        bucket_name: str,
+        prefix: str = None,
+        delimiter: str = None,
+        page_size: int = None,
+        start_offset: str = None,
+        end_offset: str = None
+    ):
+        """
+        Lazily lists the objects in a bucket, one API page at a time.
+
+        Only the current page is held in memory, so memory stays flat regardless of
+        bucket size. When ``delimiter`` is set, GCS groups deeper names into "folders"
+        server-side; those are yielded as ``{"kind": "prefix", "name": ...}`` records
+        in the order they arrive, alongside the blob records of the same page.
+
+        Documentation: https://cloud.google.com/storage/docs/listing-objects
+
+        Args:
+            bucket_name (str): The name of the bucket to list blobs from.
+            prefix (str, optional): Only list names starting with this prefix.
+            delimiter (str, optional): Folder delimiter, usually ``"/"``.
+            page_size (int, optional): Maximum results per API page.
+            start_offset (str, optional): Only list names lexicographically >= this value.
+            end_offset (str, optional): Only list names lexicographically < this value.
+
+        Yields:
+            dict: A blob record (see :meth:`_format_blob_listing`) or a prefix record.
+
+        Raises:
+            RuntimeError: If the client is not initialized.
+            google.cloud.exceptions.NotFound: If the bucket does not exist.
+        """
+        if not self.storage_client:
+            self._auth_error("iter_blobs", bucket_name).raise_error()
 
-    def list_blobs(self, bucket_name: str):
+        blobs_iterator = self.storage_client.list_blobs(
+            bucket_name,
+            prefix=prefix,
+            delimiter=delimiter,
+            page_size=page_size,
+            start_offset=start_offset,
+            end_offset=end_offset
+        )
+        for page in blobs_iterator.pages:
+            for folder in getattr(page, "prefixes", ()):
+                yield {"kind": "prefix", "name": folder}
+            for blob in page:
+                yield self._format_blob_listing(blob)
+
+    def _format_blob_listing(self, blob):
+        """Helper method to format the listing fields of a blob into a compact record."""
+        return {
+            "kind": "blob",
+            "name": blob.name,
+            "size": blob.size,
+            "updated": blob.updated,
+            "generation": blob.generation,
+            "metageneration": blob.metageneration,
+            "storage_class": blob.storage_class,
+            "content_type": blob.content_type,
+            "crc32c": blob.crc32c,
+            "md5_hash": blob.md5_hash,
+        }
+
+    @instrumented("list_blobs")
+    def list_blobs(self, bucket_name: str, prefix: str = None):
         """
         Lists all objects present inside a bucket.
 
-        This method first checks if the bucket contains any objects. If it's
-        not empty, it groups the blobs by their top-level directory (based on
-        the '/' delimiter in their names) and prints them in a structured format.
+        Root-level files are printed directly; top-level "folders" come from GCS's
+        native prefix listing (``delimiter='/'``) and each one is then listed on its
+        own. Output is streamed page by page via :meth:`iter_blobs`, so nothing is
+        held in memory beyond the current page. Per-object lines are only logged at
+        DEBUG level; use :meth:`iter_blobs` to consume listings programmatically.
 
         Documentation: https://cloud.google.com/storage/docs/listing-objects
         
         Args:
             bucket_name (str): The name of the bucket to list blobs from.
+            prefix (str, optional): Only list objects under this prefix.
+
+        Returns:
+            StorageResult: ``value`` holds the number of objects listed.
         """
         if not self.storage_client:
-            self.logger.error("Authentication failed.")
-            print("Authentication failed.")
-            return
+            return StorageResult("list_blobs", bucket_name, error=self._auth_error("list_blobs", bucket_name))
 
-        self.logger.info(f"\nListing objects in bucket '{bucket_name}':")
-        print(f"\nListing objects in bucket '{bucket_name}':")
+        self.logger.info("Listing objects in bucket '%s'...", bucket_name)
+        self._echo("\nListing objects in bucket '%s':", bucket_name)
         try:
-            blobs_iterator = self.storage_client.list_blobs(bucket_name)
-            blobs_list = list(blobs_iterator)
-
-            if not blobs_list:
-                self.logger.info(f"Bucket '{bucket_name}' is empty.")
-                print(f"Bucket '{bucket_name}' is empty.")
-                return
-
-            # Group blobs by their top-level directory
-            structured_list = {}
-            for blob in blobs_list:
-                parts = blob.name.split('/', 1)
-                prefix = parts[0]
-                if len(parts) == 1:
-                    # This is a file at the root of the bucket
-                    if '/' not in structured_list:
-                        structured_list['/'] = []
-                    structured_list['/'].append(prefix)
-                else:
-                    # This is a file within a 'directory'
-                    if prefix not in structured_list:
-                        structured_list[prefix] = []
-                    structured_list[prefix].append(parts[1])
-
-            # Print the structured output
-            for prefix, files in structured_list.items():
-                if prefix == '/':
-                    for file_name in files:
-                        self.logger.info(f"- {file_name}")
-                        print(f"- {file_name}")
-                else:
-                    print(f"{prefix} Folder:")
-                    for file_name in files:
-                        self.logger.info(f"    - {file_name}")
-                        print(f"    - {file_name}")
-
-        except NotFound:
-            self.logger.error(f"Bucket '{bucket_name}' not found.")
-            print(f"Bucket '{bucket_name}' not found.")
+            root = prefix or ""
+            count = 0
+            for record in self.iter_blobs(bucket_name, prefix=prefix, delimiter="/"):
+                if record["kind"] == "blob":
+                    count += 1
+                    self.logger.debug("- %s", record["name"])
+                    self._echo("- %s", record["name"][len(root):])
+                    continue
+
+                folder = record["name"]
+                self._echo("%s Folder:", folder[len(root):].rstrip("/"))
+                for blob in self.iter_blobs(bucket_name, prefix=folder):
+                    count += 1
+                    self.logger.debug("- %s", blob["name"])
+                    self._echo("    - %s", blob["name"][len(folder):])
+
+            if not count:
+                self.logger.info("Bucket '%s' is empty.", bucket_name)
+                self._echo("Bucket '%s' is empty.", bucket_name)
+            return StorageResult("list_blobs", bucket_name, value=count)
+
+        except exceptions.NotFound as e:
+            error = self._error("list_blobs", e, "Bucket '%s' not found.", bucket_name, bucket=bucket_name)
+        except Exception as e:
+            error = self._error("list_blobs", e, "An error occurred while listing blobs: %s", e,
+                                bucket=bucket_name)
+        return StorageResult("list_blobs", bucket_name, error=error)
+
+    def stream_ndjson(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        chunk_size: int = 8 * 1024 * 1024,
+        batch_size: int = None,
+        stats: dict = None
+    ):
+        """
+        Streams a newline-delimited JSON blob, parsing records as the bytes arrive.
+
+        The object is fetched in fixed-size ranged requests pinned to the generation
+        seen when the stream started, so peak memory is bounded by ``chunk_size``
+        rather than by the object size. Objects stored with a gzip or zstd
+        ``content_encoding`` (as written by :meth:`write_ndjson`) are fetched as
+        stored and decompressed on the fly.
+
+        Documentation: https://cloud.google.com/storage/docs/downloading-objects#download-object-portion
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+            chunk_size (int, optional): Bytes per ranged request. Defaults to 8 MiB.
+            batch_size (int, optional): If set, yield lists of up to this many records
+                instead of single records.
+            stats (dict, optional): Counters updated in place while streaming
+                (``records``, ``malformed``, ``lines``, ``bytes_read``, ``chunks``).
+
+        Yields:
+            The parsed records, or lists of records when ``batch_size`` is set.
+
+        Raises:
+            RuntimeError: If the client is not initialized.
+            google.cloud.exceptions.NotFound: If the bucket or blob does not exist.
+        """
+        if not self.storage_client:
+            self._auth_error("stream_ndjson", bucket_name, blob_name).raise_error()
+
+        stats = {} if stats is None else stats
+        stats.update(new_stats())
+
+        bucket = self.storage_client.bucket(bucket_name)
+        blob = bucket.get_blob(blob_name)
+        if blob is None:
+            raise exceptions.NotFound(f"Blob '{blob_name}' not found in bucket '{bucket_name}'.")
+
+        def chunks():
+            for start in range(0, blob.size or 0, chunk_size):
+                end = min(start + chunk_size, blob.size) - 1
+                # Raw bytes: a range of a transcoded (decompressed on the fly) object is not honoured.
+                yield blob.download_as_bytes(start=start, end=end, checksum=None, raw_download=True)
+
+        records = iter_ndjson(iter_decompressed(chunks(), blob.content_encoding), stats)
+        if batch_size:
+            records = iter_batches(records, batch_size)
+        yield from records
+
+        if stats["malformed"]:
+            self.logger.warning(
+                "Skipped %s malformed line(s) in '%s' from bucket '%s'.",
+                stats["malformed"], blob_name, bucket_name
+            )
+
+    @instrumented("read_blob_content")
+    def read_blob_content(self, bucket_name=None, blob_name=None):
+        """
+        Downloads a newline-delimited JSON blob and returns all of its records.
+
+        This is a convenience wrapper around :meth:`stream_ndjson` for small objects;
+        large exports should be consumed from :meth:`stream_ndjson` directly.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+
+        Returns:
+            list or StorageError: The parsed records, or a falsy StorageError if an error occurred.
+        Documentation: https://cloud.google.com/storage/docs/downloading-objects-into-memory
+        """
+        if not self.storage_client:
+            return self._auth_error("read_blob_content", bucket_name, blob_name)
+
+        self.logger.info("Downloading blob '%s' from bucket '%s' into memory...", blob_name, bucket_name)
+        self._echo("\nDownloading blob '%s' from bucket '%s' into memory...", blob_name, bucket_name)
+        try:
+            stats = new_stats()
+            records = list(self.stream_ndjson(bucket_name, blob_name, stats=stats))
+            self.logger.info(
+                "Downloaded storage object '%s' from bucket '%s': "
+                "%s records, %s malformed lines.",
+                blob_name, bucket_name, stats["records"], stats["malformed"]
+            )
+            return records
+
+        except exceptions.NotFound as e:
+            return self._error(
+                "read_blob_content", e, "Blob '%s' not found in bucket '%s'.", blob_name, bucket_name,
+                bucket=bucket_name, blob=blob_name, warning=True
+            )
+        except Exception as e:
+            return self._error("read_blob_content", e, "An error occurred while downloading contents: %s", e,
+                               bucket=bucket_name, blob=blob_name)
+
+    @instrumented("download_blob", direction="received")
+    def download_blob(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        destination: str = None,
+        slices: int = 4,
+        retries: int = 3,
+        verify: bool = True
+    ):
+        """
+        Downloads a blob as concurrent byte-range slices.
+
+        The destination (a local file, or an anonymous ``mmap`` when ``destination``
+        is None) is preallocated to ``blob.size`` and every slice is written straight
+        into it at its own offset. A failed slice is retried on its own, resuming from
+        the last byte it wrote, without restarting the rest of the transfer. All slices
+        are pinned to the generation read up front, and the result is checked against
+        the crc32c/md5 reported in the blob metadata. A file download is written to a
+        temporary file in the same directory and moved over ``destination`` only once
+        it is complete and verified, so a failed download leaves an existing file untouched.
+
+        Documentation: https://cloud.google.com/storage/docs/sliced-object-downloads
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+            destination (str, optional): Local file path. Defaults to an in-memory mmap.
+            slices (int, optional): Number of concurrent ranged requests. Defaults to 4.
+            retries (int, optional): Extra attempts allowed per slice. Defaults to 3.
+            verify (bool, optional): Check crc32c/md5 once complete. Defaults to True.
+
+        Returns:
+            dict: ``status`` ("downloaded" or "failed"), ``error``, ``bytes``, ``slices``,
+            ``retries`` (attempts beyond the first, summed over slices), ``elapsed_seconds``,
+            ``mb_per_sec``, ``destination``, the ``generation`` downloaded and, for in-memory
+            downloads, ``data`` (the mmap).
+            A falsy StorageError if the client is not initialized.
+        """
+        if not self.storage_client:
+            return self._auth_error("download_blob", bucket_name, blob_name)
+
+        result = {
+            "bucket": bucket_name,
+            "name": blob_name,
+            "destination": destination,
+            "status": "downloaded",
+            "error": None,
+            "bytes": 0,
+            "slices": 0,
+            "retries": 0,
+            "elapsed_seconds": 0.0,
+            "mb_per_sec": 0.0,
+            "generation": None,
+            "data": None,
+        }
+        started_at = time.perf_counter()
+        handle = buffer = None
+        writers = []
+        try:
+            blob = self.storage_client.bucket(bucket_name).get_blob(blob_name)
+            if blob is None:
+                raise exceptions.NotFound(f"Blob '{blob_name}' not found in bucket '{bucket_name}'.")
+            details = self._format_blob_details(blob)
+            size = blob.size or 0
+            result["generation"] = blob.generation
+
+            if destination:
+                # Slices land in a temporary file next to the destination, which only
+                # replaces an existing file once the download has completed and verified.
+                directory, base = os.path.split(os.path.abspath(destination))
+                handle = tempfile.NamedTemporaryFile(dir=directory, prefix=f".{base}.", suffix=".part", delete=False)
+                handle.truncate(size)
+            if size:
+                buffer = mmap.mmap(handle.fileno(), size) if handle else mmap.mmap(-1, size)
+
+            slices = max(1, min(slices, -(-size // self.MIN_SLICE_SIZE)))
+            slice_size = -(-size // slices) if size else 0
+            writers = [
+                SliceWriter(buffer, start, min(start + slice_size, size) - 1)
+                for start in range(0, size, slice_size or 1)
+            ]
+
+            def fetch(writer):
+                attempts = 0
+                while True:
+                    start, end = writer.remaining()
+                    try:
+                        # Retries are made here, from the last byte written, and counted.
+                        blob.download_to_file(writer, start=start, end=end, checksum=None, retry=None)
+                        if writer.remaining() is None:
+                            return attempts
+                        raise ConnectionError(f"Short read for range {start}-{end}.")
+                    except Exception as e:
+                        attempts += 1
+                        if attempts > retries or not is_retryable(e):
+                            raise
+                        self.logger.warning(
+                            "Retrying slice %s-%s of '%s' (attempt %s): %s", start, end, blob_name, attempts, e
+                        )
+                        time.sleep(backoff_delay(attempts))
+
+            result["retries"] = sum(run_bounded(fetch, writers, max_workers=max(1, slices)))
+            result["slices"] = len(writers)
+
+            if verify:
+                mismatch = verify_checksums(buffer, size, details["crc32c"], details["md5_hash"])
+                if mismatch:
+                    raise ValueError(f"Checksum validation failed for '{blob_name}': {mismatch}")
+
+            if handle:
+                for writer in writers:
+                    writer.release()
+                if buffer is not None:
+                    buffer.flush()
+                    buffer.close()
+                    buffer = None
+                handle.close()
+                os.replace(handle.name, destination)
+                handle = None
+            result["bytes"] = size
+            result["data"] = None if destination else (buffer if buffer is not None else b"")
+            elapsed = time.perf_counter() - started_at
+            result["elapsed_seconds"] = elapsed
+            result["mb_per_sec"] = round(size / (1024 * 1024) / elapsed, 3) if elapsed else 0.0
+            self.logger.info(
+                "Downloaded '%s' from bucket '%s' in %s slices "
+                "(%s MB/sec).",
+                blob_name, bucket_name, len(writers), result["mb_per_sec"]
+            )
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = f"Bucket '{bucket_name}' or blob '{blob_name}' not found." if isinstance(e, exceptions.NotFound) else str(e)
+            result["error_type"] = type(e).__name__
+            result["elapsed_seconds"] = time.perf_counter() - started_at
+            self.logger.error("An error occurred while downloading '%s': %s", blob_name, result["error"])
+        finally:
+            for writer in writers:
+                writer.release()
+            if buffer is not None and (handle or result["status"] == "failed"):
+                buffer.close()
+            if handle:
+                handle.close()
+                os.remove(handle.name)
+        return result
+
+    @instrumented("download_resumable", direction="received")
+    def download_resumable(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        destination: str,
+        checkpoint_path: str = None,
+        retries: int = 5,
+        verify: bool = True
+    ):
+        """
+        Downloads a blob to a local file, resuming partial downloads across restarts.
+
+        Bytes are streamed into ``<destination>.part`` and the generation being fetched
+        is recorded in a checkpoint. If the transfer is interrupted, the next call
+        (in this process or after a restart) continues with a ranged request from the
+        end of the partial file, provided the object still has the same generation;
+        otherwise it starts over. Transient failures (429, 5xx, dropped connections) are
+        retried with capped exponential backoff and jitter. Once complete, the file is
+        checked against the object's crc32c and moved to ``destination``.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+            destination (str): Local file path.
+            checkpoint_path (str, optional): Checkpoint file. Defaults to a file in
+                ``checkpoint_dir`` named after the bucket, blob and destination.
+            retries (int, optional): Consecutive failed attempts allowed before giving up;
+                the count resets whenever bytes are received. Defaults to 5.
+            verify (bool, optional): Check the crc32c once complete. Defaults to True.
+
+        Returns:
+            dict: ``status`` ("downloaded" or "failed"), ``error``, ``bytes`` (received so far),
+            ``resumed_from``, ``retries``, ``elapsed_seconds``, ``mb_per_sec``, ``generation``
+            and ``checkpoint``. A falsy StorageError if the client is not initialized.
+        """
+        if not self.storage_client:
+            return self._auth_error("download_resumable", bucket_name, blob_name)
+
+        part_path = f"{destination}.part"
+        checkpoint = TransferCheckpoint(
+            checkpoint_path or self._checkpoint_path("download", bucket_name, blob_name, destination)
+        )
+        result = {
+            "bucket": bucket_name,
+            "name": blob_name,
+            "destination": destination,
+            "status": "downloaded",
+            "error": None,
+            "bytes": 0,
+            "resumed_from": 0,
+            "retries": 0,
+            "elapsed_seconds": 0.0,
+            "mb_per_sec": 0.0,
+            "generation": None,
+            "checkpoint": checkpoint.path,
+        }
+        started_at = time.perf_counter()
+        try:
+            blob = None
+            attempts = 0
+            while blob is None:
+                try:
+                    blob = self.storage_client.bucket(bucket_name).get_blob(blob_name)
+                    if blob is None:
+                        raise exceptions.NotFound(f"Blob '{blob_name}' not found in bucket '{bucket_name}'.")
+                except Exception as e:
+                    attempts += 1
+                    if attempts > retries or not is_retryable(e):
+                        raise
+                    result["retries"] += 1
+                    time.sleep(backoff_delay(attempts))
+            size = blob.size or 0
+            result["generation"] = blob.generation
+
+            state = checkpoint.load()
+            offset = 0
+            if (
+                state is not None
+                and state.get("bucket") == bucket_name
+                and state.get("name") == blob_name
+                and state.get("generation") == blob.generation
+                and os.path.exists(part_path)
+            ):
+                offset = min(os.path.getsize(part_path), size)
+                self.logger.info("Resuming download of '%s' at byte %s.", blob_name, offset)
+            else:
+                state = {"bucket": bucket_name, "name": blob_name, "generation": blob.generation, "size": size}
+                checkpoint.save(state)
+            result["resumed_from"] = offset
+
+            attempts = 0
+            with open(part_path, "r+b" if offset else "wb") as handle:
+                while True:
+                    handle.seek(offset)
+                    handle.truncate()
+                    if offset >= size:
+                        break
+                    try:
+                        # The blob's media link pins the generation read above.
+                        blob.download_to_file(handle, start=offset, checksum=None, retry=None)
+                        if handle.tell() < size:
+                            raise ConnectionError(f"Short read for range {offset}-{size - 1}.")
+                    except Exception as e:
+                        received = handle.tell()
+                        if received > offset:
+                            attempts = 0
+                        offset = received
+                        result["bytes"] = offset
+                        handle.flush()
+                        checkpoint.save(dict(state, offset=offset))
+                        attempts += 1
+                        if attempts > retries or not is_retryable(e):
+                            raise
+                        result["retries"] += 1
+                        self.logger.warning(
+                            "Retrying download of '%s' at byte %s (attempt %s): %s", blob_name, offset, attempts, e
+                        )
+                        time.sleep(backoff_delay(attempts))
+                        continue
+                    offset = handle.tell()
+
+            if verify and blob.crc32c and file_crc32c(part_path) != blob.crc32c:
+                os.remove(part_path)
+                checkpoint.clear()
+                raise ValueError(f"Checksum validation failed for '{blob_name}': crc32c mismatch.")
+            os.replace(part_path, destination)
+            checkpoint.clear()
+
+            result["bytes"] = size
+            elapsed = time.perf_counter() - started_at
+            result["elapsed_seconds"] = elapsed
+            received = size - result["resumed_from"]
+            result["mb_per_sec"] = round(received / (1024 * 1024) / elapsed, 3) if elapsed else 0.0
+            self.logger.info(
+                "Downloaded '%s' from bucket '%s' "
+                "(%s retries, resumed from byte %s).",
+                blob_name, bucket_name, result["retries"], result["resumed_from"]
+            )
         except Exception as e:
-            self.logger.error(f"An error occurred while listing blobs: {e}")
-            print(f"An error occurred while listing blobs: {e}")
-
-    # def read_blob_content(self, bucket_name=None, blob_name=None):
-    #     """
-    #     Downloads a blob from a bucket into memory, decodes it as UTF-8,
-    #     and parses it as JSON.
-
-    #     Args:
-    #         bucket_name (str): The name of the bucket.
-    #         blob_name (str): The name of the blob.
-
-    #     Returns:
-    #         dict or None: The parsed JSON content as a dictionary, or None if an error occurred.
-    #     Documentation: https://cloud.google.com/storage/docs/downloading-objects-into-memory
-    #     """
-    #     if not self.storage_client:
-    #         self.logger.error("Authentication failed.")
-    #         print("Authentication failed.")
-    #         return
-
-    #     self.logger.info(f"\nDownloading blob '{blob_name}' from bucket '{bucket_name}' into memory...")
-    #     print(f"\nDownloading blob '{blob_name}' from bucket '{bucket_name}' into memory...")
-    #     try:
-    #         import json
-    #         bucket = self.storage_client.bucket(bucket_name)
-    #         blob = bucket.blob(blob_name)
-
-    #         # Download the blob's contents as a byte string.
-    #         contents_bytes = blob.download_as_bytes()
-
-    #         # Decode the byte string to a UTF-8 string.
-    #         contents_string = contents_bytes.decode("utf-8")
-
-    #         self.logger.info(
-    #             f"Downloaded storage object '{blob_name}' from bucket '{bucket_name}'."
-    #         )
-    #         contents_json = json.loads(contents_string)
-    #         print(contents_json)
-    #         return contents_json
-
-    #     except NotFound:
-    #         self.logger.warning(f"Blob '{blob_name}' not found in bucket '{bucket_name}'.")
-    #         print(f"Blob '{blob_name}' not found in bucket '{bucket_name}'.")
-    #     except Exception as e:
-    #         self.logger.error(f"An error occurred while downloading contents: {e}")
-    #         print(f"An error occurred while downloading contents: {e}")
+            result["status"] = "failed"
+            result["error"] = f"Bucket '{bucket_name}' or blob '{blob_name}' not found." if isinstance(e, exceptions.NotFound) else str(e)
+            result["error_type"] = type(e).__name__
+            result["elapsed_seconds"] = time.perf_counter() - started_at
+            self.logger.error("An error occurred while downloading '%s': %s", blob_name, result["error"])
+        return result
+
+    @instrumented("read_blob", direction="received")
+    def read_blob(self, bucket_name: str, blob_name: str) -> bytes:
+        """
+        Returns the contents of a blob, served from the disk cache when possible.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+
+        Returns:
+            bytes or StorageError: The object contents, or a falsy StorageError if the
+            client is not initialized, the bucket or blob does not exist or the download fails.
+        """
+        if not self.storage_client:
+            return self._auth_error("read_blob", bucket_name, blob_name)
+        if self.blob_cache is not None:
+            path = self.get_cached_blob_path(bucket_name, blob_name)
+            if isinstance(path, StorageError):
+                return path
+            with open(path, "rb") as handle:
+                return handle.read()
+        try:
+            return self.storage_client.bucket(bucket_name).blob(blob_name).download_as_bytes()
+        except exceptions.NotFound as e:
+            return self._error("read_blob", e, "Bucket '%s' or blob '%s' not found.", bucket_name, blob_name,
+                               bucket=bucket_name, blob=blob_name, echo=False)
+        except Exception as e:
+            return self._error("read_blob", e, "An error occurred while reading '%s': %s", blob_name, e,
+                               bucket=bucket_name, blob=blob_name, echo=False)
+
+    @instrumented("get_cached_blob_path", direction="received")
+    def get_cached_blob_path(self, bucket_name: str, blob_name: str) -> str:
+        """
+        Returns a local path holding the current generation of a blob, downloading it on a miss.
+
+        The current generation comes from :meth:`get_blob_metadata`'s lookup, so with a
+        metadata cache configured a hit costs no request at all until its TTL runs out,
+        and otherwise a single metadata GET. The returned file must be treated as read-only.
 
+        Args:
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+
+        Returns:
+            str or StorageError: Path of the cached file, or a falsy StorageError if no blob
+            cache is configured (kind ``"invalid_argument"``), the client is not initialized,
+            the bucket or blob does not exist or the download fails.
+        """
+        if self.blob_cache is None:
+            return self._argument_error("get_cached_blob_path", "No blob cache configured.", bucket_name)
+        if not self.storage_client:
+            return self._auth_error("get_cached_blob_path", bucket_name, blob_name)
+        try:
+            details = self._get_blob_details(bucket_name, blob_name)
+        except Exception as e:
+            return self._error("get_cached_blob_path", e, "An error occurred while looking up '%s': %s", blob_name, e,
+                               bucket=bucket_name, blob=blob_name, echo=False)
+        if details is None:
+            return self._not_found_error(
+                "get_cached_blob_path", "Blob '%s' not found in bucket '%s'.", blob_name, bucket_name,
+                bucket=bucket_name, blob=blob_name
+            )
+        path = self.blob_cache.get(bucket_name, blob_name, details["generation"])
+        if path is not None:
+            return path
+
+        temp_path = self.blob_cache.temp_path()
+        result = self.download_blob(bucket_name, blob_name, destination=temp_path)
+        if isinstance(result, StorageError):
+            self.blob_cache.discard(temp_path)
+            return result
+        if result["status"] != "downloaded":
+            self.blob_cache.discard(temp_path)
+            self.logger.error("Failed to cache '%s': %s", blob_name, result["error"])
+            kind = "not_found" if result.get("error_type") == "NotFound" else "error"
+            return StorageError("get_cached_blob_path", kind, result["error"], bucket_name, blob_name)
+        return self.blob_cache.commit(temp_path, bucket_name, blob_name, result["generation"])
+
+    def get_blob_cache_stats(self):
+        """
+        Returns the disk blob cache counters.
+
+        Returns:
+            dict or None: Hit ratio, bytes saved and eviction counters, or None if no cache is configured.
+        """
+        if self.blob_cache is None:
+            return None
+        return self.blob_cache.stats()
+
+    @instrumented("delete_blob")
     def delete_blob(self, bucket_name, blob_name):
-        """Deletes a blob from the bucket."""
+        """
+        Deletes a blob from the bucket.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+
+        Returns:
+            StorageResult: ``error.kind`` is ``"not_found"`` if the blob did not exist.
+        """
         if not self.storage_client:
-            self.logger.error("Authentication failed.")
-            print("Authentication failed.")
-            return
+            error = self._auth_error("delete_blob", bucket_name, blob_name)
+            return StorageResult("delete_blob", bucket_name, blob_name, error=error)
 
-        self.logger.info(f"\nDeleting blob '{blob_name}' from bucket '{bucket_name}'...")
-        print(f"\nDeleting blob '{blob_name}' from bucket '{bucket_name}'...")
+        self.logger.info("Deleting blob '%s' from bucket '%s'...", blob_name, bucket_name)
+        self._echo("\nDeleting blob '%s' from bucket '%s'...", blob_name, bucket_name)
         try:
             bucket = self.storage_client.bucket(bucket_name)
             blob = bucket.blob(blob_name)
             blob.delete()
-            self.logger.info(f"Blob '{blob_name}' deleted successfully.")
-            print(f"Blob '{blob_name}' deleted successfully.")
-        except NotFound:
-            self.logger.warning(f"Blob '{blob_name}' not found in bucket '{bucket_name}'.")
-            print(f"Blob '{blob_name}' not found in bucket '{bucket_name}'.")
+            self._invalidate_blob(bucket_name, blob_name)
+            self.logger.info("Blob '%s' deleted successfully.", blob_name)
+            self._echo("Blob '%s' deleted successfully.", blob_name)
+            return StorageResult("delete_blob", bucket_name, blob_name)
+        except exceptions.NotFound as e:
+            error = self._error("delete_blob", e, "Blob '%s' not found in bucket '%s'.", blob_name, bucket_name,
+                                bucket=bucket_name, blob=blob_name, warning=True)
+        except Exception as e:
+            error = self._error("delete_blob", e, "An error occurred while deleting: %s", e,
+                                bucket=bucket_name, blob=blob_name)
+        return StorageResult("delete_blob", bucket_name, blob_name, error=error)
+
+    # GCS recommends no more than 100 sub-requests per JSON batch request.
+    MAX_BATCH_SUBREQUESTS = 100
+
+    @instrumented("delete_blobs")
+    def delete_blobs(
+        self,
+        bucket_name: str,
+        names_or_prefix,
+        batch_size: int = 100,
+        max_workers: int = 4,
+        dry_run: bool = False,
+        progress=None
+    ):
+        """
+        Deletes many blobs using JSON API batch requests.
+
+        Deletes are grouped into batches of up to ``batch_size`` sub-requests and
+        several batches are sent at once. A failed delete is reported in the results
+        instead of stopping the run.
+
+        Documentation: https://cloud.google.com/storage/docs/batch
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            names_or_prefix (str or iterable): A prefix (every blob under it is deleted),
+                or an iterable of blob names.
+            batch_size (int, optional): Sub-requests per batch, at most 100. Defaults to 100.
+            max_workers (int, optional): Batches sent concurrently. Defaults to 4.
+            dry_run (bool, optional): Only resolve the names that would be deleted. Defaults to False.
+            progress (callable, optional): Called as ``progress(done, failed)`` after each batch.
+
+        Returns:
+            dict: ``results`` (one dict per blob with ``name``, ``status`` and ``error``;
+            status is "deleted", "not_found", "failed" or "dry_run") and ``summary``.
+            A falsy StorageError if the run could not complete
+            (client not initialized, bucket not found, listing failed).
+        """
+        if not self.storage_client:
+            return self._auth_error("delete_blobs", bucket_name)
+
+        bucket = self.storage_client.bucket(bucket_name)
+        if isinstance(names_or_prefix, str):
+            names = (
+                record["name"]
+                for record in self.iter_blobs(bucket_name, prefix=names_or_prefix)
+                if record["kind"] == "blob"
+            )
+        else:
+            names = names_or_prefix
+
+        def defer(name):
+            bucket.blob(name).delete()
+
+        def finish(name, response):
+            if response is None:
+                return {"name": name, "status": "dry_run", "error": None}
+            error = self._batch_error(response)
+            if response.status_code == 404:
+                # The blob is gone either way, so its cached metadata is too.
+                self._invalidate_blob(bucket_name, name)
+                return {"name": name, "status": "not_found", "error": error}
+            if error is None:
+                self._invalidate_blob(bucket_name, name)
+            return {"name": name, "status": "deleted" if error is None else "failed", "error": error}
+
+        self.logger.info("Deleting blobs from bucket '%s' in batches of %s...", bucket_name, batch_size)
+        try:
+            report = self._run_batches(names, defer, finish, batch_size, max_workers, dry_run, progress)
+            # Every delete in a missing bucket answers 404 too; that is a failed call, not a clean-up.
+            if any(r["status"] == "not_found" for r in report["results"]) and not bucket.exists():
+                raise exceptions.NotFound(f"Bucket '{bucket_name}' not found.")
+        except exceptions.NotFound as e:
+            return self._error("delete_blobs", e, "Bucket '%s' not found.", bucket_name, bucket=bucket_name, echo=False)
         except Exception as e:
-            self.logger.error(f"An error occurred while deleting: {e}")
-            print(f"An error occurred while deleting: {e}")
+            return self._error("delete_blobs", e, "An error occurred while deleting blobs: %s", e,
+                               bucket=bucket_name, echo=False)
+        self.logger.info(
+            "Batch delete in '%s': %s deleted, "
+            "%s failed.",
+            bucket_name, report["summary"]["succeeded"], report["summary"]["failed"]
+        )
+        return report
+
+    @instrumented("copy_prefix", bucket_arg="source_bucket")
+    def copy_prefix(
+        self,
+        source_bucket: str,
+        prefix: str,
+        destination_bucket: str,
+        destination_prefix: str = None,
+        storage_class: str = None,
+        max_workers: int = 16,
+        max_ops_per_sec: float = None,
+        max_bytes_per_sec: float = None,
+        checkpoint_path: str = None,
+        retries: int = 5,
+        dry_run: bool = False,
+        progress=None
+    ):
+        """
+        Copies every blob under a prefix to another bucket (or prefix) with server-side rewrites.
+
+        No data passes through this machine: each object is copied by GCS with the
+        ``rewrite`` API. Copies across locations or storage classes can take several
+        calls; those are continued with the rewrite token GCS returns. Many objects are
+        copied at once on a bounded thread pool, optionally throttled to a number of API
+        calls and of bytes rewritten per second (shared by all workers).
+
+        Progress is kept in a SQLite checkpoint (see :class:`RewriteCheckpoint`): running
+        the same copy again skips objects already copied, unless their source changed,
+        and continues unfinished rewrites from their token. The checkpoint is deleted
+        once a run finishes without failures.
+
+        Documentation: https://cloud.google.com/storage/docs/json_api/v1/objects/rewrite
+
+        Args:
+            source_bucket (str): The bucket to copy from.
+            prefix (str): Blob name prefix to copy, e.g. ``"json/"``; ``""`` copies the whole bucket.
+            destination_bucket (str): The bucket to copy to.
+            destination_prefix (str, optional): Replaces ``prefix`` in the destination names.
+                Defaults to ``prefix`` (same names).
+            storage_class (str, optional): Storage class of the copies, e.g. ``"NEARLINE"``.
+                Defaults to the destination bucket's default class.
+            max_workers (int, optional): Objects copied concurrently. Defaults to 16.
+            max_ops_per_sec (float, optional): Cap on rewrite (and delete) calls per second.
+            max_bytes_per_sec (float, optional): Cap on bytes rewritten per second.
+            checkpoint_path (str, optional): Checkpoint location. Defaults to a file in
+                ``checkpoint_dir`` named after the source and destination.
+            retries (int, optional): Consecutive failed calls allowed per object. Defaults to 5.
+            dry_run (bool, optional): Only resolve the names that would be copied. Defaults to False.
+            progress (callable, optional): Called as ``progress(done, failed)`` after each object.
+
+        Returns:
+            dict: ``results`` (one dict per blob with ``name``, ``destination``, ``status``,
+            ``bytes``, ``rewrites``, ``retries`` and ``error``; status is "copied", "skipped"
+            (already copied by an earlier run), "failed" or "dry_run") and ``summary``.
+            A falsy StorageError if the run could not complete (client not initialized,
+            source bucket not found, listing failed), or of kind ``"invalid_argument"`` if
+            the destination is the source itself (without a storage class change) or lies
+            under it in the same bucket.
+        """
+        return self._rewrite_prefix(
+            "copy", source_bucket, prefix, destination_bucket, destination_prefix, storage_class,
+            max_workers, max_ops_per_sec, max_bytes_per_sec, checkpoint_path, retries, dry_run, progress
+        )
+
+    @instrumented("move_prefix", bucket_arg="source_bucket")
+    def move_prefix(
+        self,
+        source_bucket: str,
+        prefix: str,
+        destination_bucket: str,
+        destination_prefix: str = None,
+        storage_class: str = None,
+        max_workers: int = 16,
+        max_ops_per_sec: float = None,
+        max_bytes_per_sec: float = None,
+        checkpoint_path: str = None,
+        retries: int = 5,
+        dry_run: bool = False,
+        progress=None
+    ):
+        """
+        Moves every blob under a prefix to another bucket (or prefix).
+
+        Works like :meth:`copy_prefix`; each source object is deleted as soon as its
+        copy is complete, and only if it still has the generation that was copied. An
+        object modified during the move is reported as failed and left in place.
 
+        Args:
+            Same as :meth:`copy_prefix`.
+
+        Returns:
+            dict: Same as :meth:`copy_prefix`, with status "moved" instead of "copied"
+            and ``summary["deleted"]`` counting removed sources, or a falsy StorageError
+            as for :meth:`copy_prefix`.
+        """
+        return self._rewrite_prefix(
+            "move", source_bucket, prefix, destination_bucket, destination_prefix, storage_class,
+            max_workers, max_ops_per_sec, max_bytes_per_sec, checkpoint_path, retries, dry_run, progress
+        )
+
+    def _rewrite_prefix(
+        self,
+        mode,
+        source_bucket,
+        prefix,
+        destination_bucket,
+        destination_prefix,
+        storage_class,
+        max_workers,
+        max_ops_per_sec,
+        max_bytes_per_sec,
+        checkpoint_path,
+        retries,
+        dry_run,
+        progress
+    ):
+        """Helper method running copy_prefix and move_prefix."""
+        if not self.storage_client:
+            return self._auth_error(f"{mode}_prefix", source_bucket)
+
+        prefix = prefix or ""
+        destination_prefix = prefix if destination_prefix is None else destination_prefix
+        if source_bucket == destination_bucket:
+            if destination_prefix == prefix and (mode == "move" or not storage_class):
+                return self._argument_error(f"{mode}_prefix", "The destination is the source itself.", source_bucket)
+            if destination_prefix != prefix and destination_prefix.startswith(prefix):
+                return self._argument_error(
+                    f"{mode}_prefix", "The destination prefix must not lie under the source prefix in the same bucket.",
+                    source_bucket
+                )
+
+        move = mode == "move"
+        source = self.storage_client.bucket(source_bucket)
+        destination = self.storage_client.bucket(destination_bucket)
+        ops_limit = RateLimiter(max_ops_per_sec)
+        bytes_limit = RateLimiter(max_bytes_per_sec)
+        checkpoint, saved = None, {}
+        if not dry_run:
+            job = f"{mode}\n{source_bucket}\n{prefix}\n{destination_bucket}\n{destination_prefix}\n{storage_class}"
+            if checkpoint_path is None:
+                os.makedirs(self.checkpoint_dir, exist_ok=True)
+                checkpoint_path = os.path.join(
+                    self.checkpoint_dir, f"{hashlib.sha256(job.encode('utf-8')).hexdigest()}.sqlite"
+                )
+            checkpoint = RewriteCheckpoint(checkpoint_path, job)
+            saved = checkpoint.load()
+
+        def rewrite(name, target, generation, state):
+            """Copies one object, continuing a saved rewrite; returns (bytes, calls, retries)."""
+            source_blob = source.blob(name, generation=generation)
+            target_blob = destination.blob(target)
+            if storage_class:
+                target_blob.storage_class = storage_class
+            token, rewritten = (state[2], state[1]) if state and state[0] == generation else (None, 0)
+            calls = attempts = retried = 0
+            while True:
+                ops_limit.acquire()
+                try:
+                    token, total, size = target_blob.rewrite(
+                        source_blob, token=token, if_source_generation_match=generation, retry=None
+                    )
+                except exceptions.BadRequest:
+                    if token is None:
+                        raise
+                    # The saved token no longer applies (it expired or the options changed): start over.
+                    token, rewritten = None, 0
+                    continue
+                except Exception as e:
+                    attempts += 1
+                    if attempts > retries or not is_retryable(e):
+                        raise
+                    retried += 1
+                    self.logger.warning("Retrying rewrite of '%s' (attempt %s): %s", name, attempts, e)
+                    time.sleep(backoff_delay(attempts))
+                    continue
+                calls += 1
+                attempts = 0
+                bytes_limit.acquire(total - rewritten)
+                rewritten = total
+                if token is None:
+                    checkpoint.mark_done(name, generation, size)
+                    self._invalidate_blob(destination_bucket, target)
+                    return size, calls, retried
+                checkpoint.save_token(name, generation, total, token)
+
+        def copy(record):
+            name = record["name"]
+            generation = record["generation"]
+            target = destination_prefix + name[len(prefix):]
+            result = {
+                "name": name,
+                "destination": target,
+                "status": "moved" if move else "copied",
+                "bytes": 0,
+                "rewrites": 0,
+                "retries": 0,
+                "error": None,
+            }
+            if dry_run:
+                result["status"] = "dry_run"
+                return result
+            state = saved.get(name)
+            try:
+                if state and state[0] == generation and state[3]:
+                    result["status"] = "skipped"
+                else:
+                    result["bytes"], result["rewrites"], result["retries"] = rewrite(name, target, generation, state)
+                if move:
+                    ops_limit.acquire()
+                    source.blob(name).delete(if_generation_match=generation)
+                    self._invalidate_blob(source_bucket, name)
+                    result["deleted"] = True
+            except exceptions.PreconditionFailed as e:
+                result.update(status="failed", error_type=type(e).__name__,
+                              error="The source changed during the run; it was left in place.")
+            except exceptions.NotFound as e:
+                result.update(status="failed", error_type=type(e).__name__,
+                              error=f"Bucket '{destination_bucket}' or blob '{name}' not found.")
+            except Exception as e:
+                result.update(status="failed", error_type=type(e).__name__, error=str(e))
+            return result
+
+        records = (record for record in self.iter_blobs(source_bucket, prefix=prefix) if record["kind"] == "blob")
+        self.logger.info(
+            "Rewriting '%s/%s' to '%s/%s' with %s workers...",
+            source_bucket, prefix, destination_bucket, destination_prefix, max_workers
+        )
+        started_at = time.perf_counter()
+        counters = {"done": 0, "failed": 0}
+        results = []
+        finished = False
+        try:
+            for result in run_bounded(copy, records, max_workers=max_workers):
+                results.append(result)
+                counters["done"] += 1
+                counters["failed"] += result["status"] == "failed"
+                if progress:
+                    progress(counters["done"], counters["failed"])
+            finished = True
+        except exceptions.NotFound as e:
+            return self._error(f"{mode}_prefix", e, "Bucket '%s' not found.", source_bucket,
+                               bucket=source_bucket, echo=False)
+        except Exception as e:
+            return self._error(f"{mode}_prefix", e, "An error occurred while rewriting '%s/%s': %s",
+                               source_bucket, prefix, e, bucket=source_bucket, echo=False)
+        finally:
+            # Keep the checkpoint for the next run unless everything was copied.
+            if checkpoint is not None:
+                if finished and not counters["failed"]:
+                    checkpoint.clear()
+                else:
+                    checkpoint.close()
+
+        elapsed = time.perf_counter() - started_at
+        total_bytes = sum(r["bytes"] for r in results)
+        summary = {
+            "total": len(results),
+            "succeeded": len(results) - counters["failed"],
+            "copied": sum(1 for r in results if r["status"] in ("copied", "moved")),
+            "skipped": sum(1 for r in results if r["status"] == "skipped"),
+            "failed": counters["failed"],
+            "bytes": total_bytes,
+            "rewrites": sum(r["rewrites"] for r in results),
+            "retries": sum(r["retries"] for r in results),
+            "dry_run": dry_run,
+            "elapsed_seconds": round(elapsed, 6),
+            "items_per_sec": round(len(results) / elapsed, 2) if elapsed else 0.0,
+            "mb_per_sec": round(total_bytes / (1024 * 1024) / elapsed, 3) if elapsed else 0.0,
+        }
+        if move:
+            summary["deleted"] = sum(1 for r in results if r.get("deleted"))
+        self.logger.info(
+            "Rewrite of '%s/%s' to '%s/%s': %s copied, %s skipped, "
+            "%s failed (%s MB/sec).",
+            source_bucket, prefix, destination_bucket, destination_prefix,
+            summary["copied"], summary["skipped"], summary["failed"], summary["mb_per_sec"]
+        )
+        for result in results:
+            if result["status"] == "failed":
+                self.logger.error("Failed to %s '%s': %s", mode, result["name"], result["error"])
+        return {"results": results, "summary": summary}
+
+    @instrumented("get_blobs_metadata")
+    def get_blobs_metadata(
+        self,
+        bucket_name: str,
+        names,
+        batch_size: int = 100,
+        max_workers: int = 4,
+        progress=None
+    ):
+        """
+        Fetches metadata for many blobs using JSON API batch requests.
+
+        Successful lookups also populate the metadata cache, when one is configured.
+
+        Documentation: https://cloud.google.com/storage/docs/batch
+
+        Args:
+            bucket_name (str): The name of the bucket.
+            names (iterable): The blob names.
+            batch_size (int, optional): Sub-requests per batch, at most 100. Defaults to 100.
+            max_workers (int, optional): Batches sent concurrently. Defaults to 4.
+            progress (callable, optional): Called as ``progress(done, failed)`` after each batch.
+
+        Returns:
+            dict: ``results`` (one dict per blob with ``name``, ``status``, ``metadata``
+            and ``error``) and ``summary``. A falsy StorageError if the client is not initialized.
+        """
+        if not self.storage_client:
+            return self._auth_error("get_blobs_metadata", bucket_name)
+
+        bucket = self.storage_client.bucket(bucket_name)
+
+        def defer(name):
+            blob = bucket.blob(name)
+            blob.reload()
+            return blob
+
+        def finish(name, response, blob):
+            error = self._batch_error(response)
+            if error is not None:
+                return {"name": name, "status": "failed", "metadata": None, "error": error}
+            # The batch has already loaded the sub-response into the blob's properties.
+            details = self._format_blob_details(blob)
+            self._cache_set(("blob", bucket_name, name), details)
+            return {"name": name, "status": "ok", "metadata": dict(details), "error": None}
+
+        return self._run_batches(names, defer, finish, batch_size, max_workers, False, progress)
+
+    def _run_batches(self, names, defer, finish, batch_size, max_workers, dry_run, progress):
+        """
+        Helper method that sends deferred operations as concurrent JSON batch requests.
+
+        ``defer(name)`` issues one API call inside an open batch (its return value is
+        kept as the target object); ``finish(name, response[, target])`` turns the
+        matching sub-response into a result dict.
+        """
+        batch_size = max(1, min(batch_size, self.MAX_BATCH_SUBREQUESTS))
+        counters = {"done": 0, "failed": 0}
+
+        def chunks():
+            chunk = []
+            for name in names:
+                chunk.append(name)
+                if len(chunk) >= batch_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+        def send(chunk):
+            if dry_run:
+                return [finish(name, None) for name in chunk]
+            targets = []
+            batch = _response_batch(self.storage_client)
+            try:
+                with batch:
+                    for name in chunk:
+                        targets.append(defer(name))
+                responses = batch.responses
+            except Exception as e:
+                return [{"name": name, "status": "failed", "error": str(e)} for name in chunk]
+            if targets[0] is None:
+                return [finish(name, response) for name, response in zip(chunk, responses)]
+            return [
+                finish(name, response, target)
+                for name, response, target in zip(chunk, responses, targets)
+            ]
+
+        started_at = time.perf_counter()
+        results = []
+        for chunk_results in run_bounded(send, chunks(), max_workers=max_workers):
+            results.extend(chunk_results)
+            counters["done"] += len(chunk_results)
+            counters["failed"] += sum(1 for r in chunk_results if r["status"] == "failed")
+            if progress:
+                progress(counters["done"], counters["failed"])
+
+        elapsed = time.perf_counter() - started_at
+        summary = {
+            "total": len(results),
+            "succeeded": len(results) - counters["failed"],
+            "failed": counters["failed"],
+            "dry_run": dry_run,
+            "elapsed_seconds": round(elapsed, 6),
+            "items_per_sec": round(len(results) / elapsed, 2) if elapsed else 0.0,
+        }
+        return {"results": results, "summary": summary}
+
+    @staticmethod
+    def _batch_error(response):
+        """Helper method returning the error message of a failed batch sub-response, or None."""
+        if 200 <= response.status_code < 300:
+            return None
+        try:
+            return response.json()["error"]["message"]
+        except Exception:
+            return f"HTTP {response.status_code}"
+
+    @instrumented("get_blob_metadata")
     def get_blob_metadata(self, bucket_name: str = None, blob_name: str = None):
         """
         Return a formatted dictionary with all Blob properties.
@@ -317,30 +2422,74 @@ class GCPStorage(GCPAuth):
         Args:
             bucket_name (str): The name of the bucket.
             blob_name (str): The name of the blob.
+
+        Returns:
+            dict or StorageError: The blob details, or a falsy StorageError whose
+            ``kind`` tells what went wrong.
         """
         if not self.storage_client:
-            self.logger.error("Authentication failed.")
-            return "Authentication failed."
+            return self._auth_error("get_blob_metadata", bucket_name, blob_name)
         if not bucket_name:
-            self.logger.error("Bucket Name cannot be empty.")
-            return "Bucket Name cannot be empty."
+            return self._argument_error("get_blob_metadata", "Bucket Name cannot be empty.")
         if not blob_name:
-            self.logger.error("Blob Name cannot be empty.")
-            return "Blob Name cannot be empty."
+            return self._argument_error("get_blob_metadata", "Blob Name cannot be empty.", bucket_name)
         try:
-            bucket = self.storage_client.get_bucket(bucket_name)
-            blob = bucket.get_blob(blob_name)
-            if blob is None:
-                self.logger.warning(f"The blob '{blob_name}' does not exist in bucket '{bucket_name}'.")
-                return f"The blob '{blob_name}' does not exist in bucket '{bucket_name}'."
-            return self._format_blob_details(blob)
+            details = self._get_blob_details(bucket_name, blob_name)
+            if details is None:
+                return self._not_found_error(
+                    "get_blob_metadata", "The blob '%s' does not exist in bucket '%s'.", blob_name, bucket_name,
+                    bucket=bucket_name, blob=blob_name
+                )
+            return details
 
-        except NotFound as e:
-            self.logger.error(f"Either the bucket '{bucket_name}' or blob '{blob_name}' does not exist: {e}")
-            return f"Either the bucket '{bucket_name}' or blob '{blob_name}' does not exist: {e}"
+        except exceptions.NotFound as e:
+            return self._error(
+                "get_blob_metadata", e, "Either the bucket '%s' or blob '%s' does not exist: %s",
+                bucket_name, blob_name, e, bucket=bucket_name, blob=blob_name, echo=False
+            )
         except Exception as e:
-            self.logger.error(f"An unexpected error occurred while getting the blob: {e}")
-            return f"An unexpected error occurred while getting the blob: {e}"
+            return self._error(
+                "get_blob_metadata", e, "An unexpected error occurred while getting the blob: %s", e,
+                bucket=bucket_name, blob=blob_name, echo=False
+            )
+
+    def _get_blob_details(self, bucket_name, blob_name):
+        """
+        Helper method to fetch blob details through the metadata cache.
+
+        Goes straight to the object without a ``get_bucket`` round trip. A stale entry
+        is revalidated with ``ifGenerationMatch`` + ``ifMetagenerationNotMatch``: an
+        unchanged object answers 304, new metadata on the same generation comes back
+        directly, and a new generation (412) triggers a plain refetch.
+
+        Returns:
+            dict or None: The blob details, or None if the blob (or bucket) does not exist.
+        """
+        key = ("blob", bucket_name, blob_name)
+        cached, fresh = self._cache_get(key)
+        if fresh:
+            return dict(cached)
+        bucket = self.storage_client.bucket(bucket_name)
+        if cached is not None:
+            try:
+                blob = bucket.get_blob(
+                    blob_name,
+                    if_generation_match=cached["generation"],
+                    if_metageneration_not_match=cached["metageneration"]
+                )
+            except exceptions.NotModified:
+                self.metadata_cache.touch(key)
+                return dict(cached)
+            except exceptions.PreconditionFailed:
+                blob = bucket.get_blob(blob_name)
+        else:
+            blob = bucket.get_blob(blob_name)
+        if blob is None:
+            self._invalidate_blob(bucket_name, blob_name)
+            return None
+        details = self._format_blob_details(blob)
+        self._cache_set(key, details)
+        return dict(details)
 
     def _format_blob_details(self, blob):
         """Helper method to get blob metadata"""
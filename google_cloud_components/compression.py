@@ -0,0 +1,73 @@
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # optional: only needed for zstd-encoded objects
+    zstandard = None
+
+# ``Content-Encoding`` values GCPStorage can write and read back.
+CONTENT_ENCODINGS = ("gzip", "zstd")
+
+
+def compressor(encoding, level=None):
+    """
+    Returns a streaming compressor for a ``Content-Encoding``.
+
+    The returned object has ``compress(data) -> bytes`` and ``flush() -> bytes``,
+    like ``zlib.compressobj``; output is produced incrementally, so memory stays
+    bounded by the compressor window rather than the object size.
+
+    Args:
+        encoding (str): ``"gzip"`` or ``"zstd"``.
+        level (int, optional): Compression level. Defaults to 6 for gzip and 3 for zstd.
+
+    Raises:
+        ValueError: If the encoding is unknown, or is zstd and ``zstandard`` is not installed.
+    """
+    if encoding == "gzip":
+        # wbits=31 writes a gzip header and trailer around the deflate stream.
+        return zlib.compressobj(6 if level is None else level, zlib.DEFLATED, 31)
+    if encoding == "zstd":
+        return _zstandard().ZstdCompressor(level=3 if level is None else level).compressobj()
+    raise ValueError(f"Unsupported content encoding {encoding!r}; expected one of {CONTENT_ENCODINGS}.")
+
+
+def iter_decompressed(chunks, encoding):
+    """
+    Incrementally decompresses an iterable of byte chunks.
+
+    Args:
+        chunks (iterable of bytes): The stored (compressed) bytes, in order.
+        encoding (str): The object's ``Content-Encoding``; None or ``"identity"``
+            passes chunks through unchanged.
+
+    Yields:
+        bytes: Decompressed data, as it becomes available.
+
+    Raises:
+        ValueError: If the encoding is unknown, or is zstd and ``zstandard`` is not installed.
+    """
+    if not encoding or encoding == "identity":
+        yield from chunks
+        return
+    if encoding == "gzip":
+        decompressor = zlib.decompressobj(31)
+    elif encoding == "zstd":
+        decompressor = _zstandard().ZstdDecompressor().decompressobj()
+    else:
+        raise ValueError(f"Unsupported content encoding {encoding!r}; expected one of {CONTENT_ENCODINGS}.")
+    for chunk in chunks:
+        data = decompressor.decompress(chunk)
+        if data:
+            yield data
+    if encoding == "gzip":
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+
+
+def _zstandard():
+    """Helper returning the ``zstandard`` module, or raising a clear error when it is missing."""
+    if zstandard is None:
+        raise ValueError("zstd compression requires the 'zstandard' package (pip install zstandard).")
+    return zstandard
@@ -0,0 +1,576 @@
+import fnmatch
+import json
+import mmap
+import os
+import re
+import struct
+import time
+from array import array
+from datetime import datetime, timezone
+
+# File layout: magic, little-endian u64 header length, JSON header, then 8-byte aligned
+# columns. ``offsets`` and ``cumulative`` hold count + 1 entries, so the names and the
+# total size of any index range [lo, hi) are found without scanning.
+MAGIC = b"GCSINV01"
+FORMAT_VERSION = 1
+COLUMNS = (("offsets", "Q"), ("cumulative", "Q"), ("updated", "q"), ("generations", "q"))
+
+# Change notification event types that remove the live object.
+_REMOVING_EVENTS = frozenset({"OBJECT_DELETE", "OBJECT_ARCHIVE"})
+_WILDCARDS = "*?["
+
+
+class _Columns:
+    """In-memory columns of an inventory being written, appended to in name order."""
+
+    def __init__(self):
+        self.names = bytearray()
+        self.offsets = array("Q", [0])
+        self.cumulative = array("Q", [0])
+        self.updated = array("q")
+        self.generations = array("q")
+
+    def append(self, name, size, updated, generation):
+        self.names += name
+        self.offsets.append(len(self.names))
+        self.cumulative.append(self.cumulative[-1] + size)
+        self.updated.append(updated)
+        self.generations.append(generation)
+
+    def extend_from(self, inventory, lo, hi):
+        """Bulk-copies entries ``[lo, hi)`` of an open inventory, rebasing offsets and sizes."""
+        if hi <= lo:
+            return
+        name_base, size_base = inventory._offsets[lo], inventory._cumulative[lo]
+        self.names += inventory._names[name_base:inventory._offsets[hi]]
+        name_shift = self.offsets[-1] - name_base
+        size_shift = self.cumulative[-1] - size_base
+        if name_shift == 0 and size_shift == 0:
+            self.offsets.frombytes(inventory._offsets[lo + 1:hi + 1].cast("B"))
+            self.cumulative.frombytes(inventory._cumulative[lo + 1:hi + 1].cast("B"))
+        else:
+            self.offsets.extend(value + name_shift for value in inventory._offsets[lo + 1:hi + 1])
+            self.cumulative.extend(value + size_shift for value in inventory._cumulative[lo + 1:hi + 1])
+        self.updated.frombytes(inventory._updated[lo:hi].cast("B"))
+        self.generations.frombytes(inventory._generations[lo:hi].cast("B"))
+
+    def __len__(self):
+        return len(self.updated)
+
+    def name(self, index):
+        return bytes(self.names[self.offsets[index]:self.offsets[index + 1]])
+
+    def sorted(self):
+        """Returns the same entries reordered by name; only an index permutation is held besides the columns."""
+        ordered = _Columns()
+        sizes = [self.cumulative[index + 1] - self.cumulative[index] for index in range(len(self))]
+        for index in sorted(range(len(self)), key=self.name):
+            ordered.append(self.name(index), sizes[index], self.updated[index], self.generations[index])
+        return ordered
+
+    def write(self, path, header):
+        """Atomically writes the columns with ``header`` (temporary file plus ``os.replace``)."""
+        sections, position = {}, 0
+        payloads = [(name, getattr(self, name).tobytes()) for name, _ in COLUMNS]
+        payloads.append(("names", bytes(self.names)))
+        for name, payload in payloads:
+            sections[name] = [position, len(payload)]
+            position += _padded(len(payload))
+        header = dict(header, count=len(self), sections=sections)
+        encoded = json.dumps(header).encode("utf-8")
+        encoded += b" " * (_padded(len(MAGIC) + 8 + len(encoded)) - len(MAGIC) - 8 - len(encoded))
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as handle:
+            handle.write(MAGIC)
+            handle.write(struct.pack("<Q", len(encoded)))
+            handle.write(encoded)
+            for _, payload in payloads:
+                handle.write(payload)
+                handle.write(b"\0" * (_padded(len(payload)) - len(payload)))
+        os.replace(temp_path, path)
+
+
+class BucketInventory:
+    """
+    Local, memory-mapped snapshot of the object names, sizes, update times and
+    generations under a bucket prefix, for instant ``du``/``ls`` style queries.
+
+    The index is a sorted array of names with parallel columns, built from one
+    listing pass (:meth:`build`) and stored in a single file that is memory-mapped
+    on load, so opening even a million-object inventory is immediate and queries
+    never touch the API. A running total of sizes is stored alongside the names:
+    counting the objects and bytes under a prefix or between two names takes two
+    binary searches, whatever their number.
+
+    Keep it current with :meth:`refresh`, which lists only the names after the
+    saved ``start_offset`` (cheap for append-mostly buckets such as dated logs,
+    but blind to changes of older names), or with :meth:`apply_changes`, which
+    folds in Pub/Sub change notifications. Rebuild periodically to pick up
+    anything both missed.
+    """
+    def __init__(self, path):
+        """
+        Opens an inventory file written by :meth:`build`.
+
+        Args:
+            path (str): The inventory file.
+
+        Raises:
+            ValueError: If the file is not an inventory of a supported version.
+        """
+        self.path = path
+        self._map = None
+        self._views = []
+        self._load()
+
+    @classmethod
+    def build(cls, storage, bucket_name, path, prefix=None, page_size=1000):
+        """
+        Lists a bucket (or one prefix of it) once and writes its inventory.
+
+        Each listed object is appended to the packed columns as its page arrives, so
+        no per-object records are held; peak memory is about the size of the file.
+
+        Args:
+            storage (GCPStorage): The client used for listing.
+            bucket_name (str): The name of the bucket.
+            path (str): Where to write the inventory file.
+            prefix (str, optional): Only index names starting with this prefix.
+            page_size (int, optional): Listing page size. Defaults to 1000.
+
+        Returns:
+            BucketInventory: The new inventory, opened.
+
+        Raises:
+            RuntimeError: If the storage client is not initialized.
+            google.cloud.exceptions.NotFound: If the bucket does not exist.
+        """
+        started_at = time.perf_counter()
+        # Records go straight into the packed columns, so memory is the size of the index itself.
+        columns = _Columns()
+        previous, in_order = None, True
+        for record in storage.iter_blobs(bucket_name, prefix=prefix, page_size=page_size):
+            if record["kind"] != "blob":
+                continue
+            name = record["name"].encode("utf-8")
+            in_order = in_order and (previous is None or previous < name)
+            previous = name
+            columns.append(name, record["size"] or 0, _micros(record["updated"]), record["generation"] or 0)
+        # GCS lists in UTF-8 byte order already; sort anyway so a reordered page cannot corrupt the index.
+        if not in_order:
+            columns = columns.sorted()
+        now = _now()
+        columns.write(path, {
+            "version": FORMAT_VERSION,
+            "bucket": bucket_name,
+            "prefix": prefix or "",
+            "start_offset": columns.name(len(columns) - 1).decode("utf-8") if len(columns) else "",
+            "built_at": now,
+            "updated_at": now,
+        })
+        storage.logger.info(
+            "Built inventory of %d object(s) in '%s/%s' in %.3fs.",
+            len(columns), bucket_name, prefix or "", time.perf_counter() - started_at
+        )
+        return cls(path)
+
+    # -- queries ------------------------------------------------------------
+
+    def __len__(self):
+        return self.header["count"]
+
+    @property
+    def bucket(self):
+        return self.header["bucket"]
+
+    @property
+    def prefix(self):
+        return self.header["prefix"]
+
+    @property
+    def start_offset(self):
+        """The name :meth:`refresh` resumes listing from."""
+        return self.header["start_offset"]
+
+    def du(self, pattern=""):
+        """
+        Counts the objects and bytes matching a prefix or glob.
+
+        A plain prefix (``"json/"``) or a prefix followed by a single trailing ``*``
+        (``"json/2019-*"``) is answered from the running size totals in O(log n).
+        Other wildcards are matched name by name within the literal prefix.
+
+        Args:
+            pattern (str, optional): Name prefix or ``fnmatch`` glob. Defaults to everything.
+
+        Returns:
+            dict: ``objects`` and ``bytes``.
+        """
+        lo, hi, matcher = self._select(pattern)
+        if matcher is None:
+            return {"objects": hi - lo, "bytes": self._cumulative[hi] - self._cumulative[lo]}
+        objects = total = 0
+        for index in range(lo, hi):
+            if matcher(self._name(index)):
+                objects += 1
+                total += self._cumulative[index + 1] - self._cumulative[index]
+        return {"objects": objects, "bytes": total}
+
+    def count(self, pattern=""):
+        """Returns the number of objects matching a prefix or glob (see :meth:`du`)."""
+        return self.du(pattern)["objects"]
+
+    def total_bytes(self, pattern=""):
+        """Returns the total size of the objects matching a prefix or glob (see :meth:`du`)."""
+        return self.du(pattern)["bytes"]
+
+    def range(self, start=None, end=None):
+        """
+        Counts the objects and bytes with ``start <= name < end``.
+
+        Args:
+            start (str, optional): Inclusive lower bound. Defaults to the first name.
+            end (str, optional): Exclusive upper bound. Defaults to past the last name.
+
+        Returns:
+            dict: ``objects`` and ``bytes``.
+        """
+        lo = self._lower_bound(start.encode("utf-8")) if start else 0
+        hi = self._lower_bound(end.encode("utf-8")) if end else len(self)
+        hi = max(lo, hi)
+        return {"objects": hi - lo, "bytes": self._cumulative[hi] - self._cumulative[lo]}
+
+    def get(self, name):
+        """
+        Returns the indexed record of one object.
+
+        Returns:
+            dict or None: ``name``, ``size``, ``updated`` and ``generation``, or None
+            if the name is not in the inventory.
+        """
+        encoded = name.encode("utf-8")
+        index = self._lower_bound(encoded)
+        if index < len(self) and self._name(index) == encoded:
+            return self._record(index)
+        return None
+
+    def iter_records(self, pattern="", start=None, end=None):
+        """
+        Yields the records matching a prefix or glob, in name order.
+
+        Args:
+            pattern (str, optional): Name prefix or ``fnmatch`` glob (see :meth:`du`).
+            start (str, optional): Only names >= this value.
+            end (str, optional): Only names < this value.
+
+        Yields:
+            dict: ``name``, ``size``, ``updated`` and ``generation``.
+        """
+        lo, hi, matcher = self._select(pattern)
+        if start:
+            lo = max(lo, self._lower_bound(start.encode("utf-8")))
+        if end:
+            hi = min(hi, self._lower_bound(end.encode("utf-8")))
+        for index in range(lo, hi):
+            if matcher is None or matcher(self._name(index)):
+                yield self._record(index)
+
+    def ls(self, prefix="", delimiter="/"):
+        """
+        Lists the direct children of a prefix, like a listing with a delimiter.
+
+        Each "folder" is visited once: after it is reported, the search jumps past
+        all of its names, so the cost depends on the number of children, not objects.
+
+        Args:
+            prefix (str, optional): The parent prefix, e.g. ``"json/"``. Defaults to the root.
+            delimiter (str, optional): Folder delimiter. Defaults to ``"/"``.
+
+        Returns:
+            list: ``{"kind": "prefix", "name", "objects", "bytes"}`` folder records and
+            ``{"kind": "blob", "name", "size", "updated", "generation"}`` blob records,
+            in name order.
+        """
+        encoded_prefix = prefix.encode("utf-8")
+        encoded_delimiter = delimiter.encode("utf-8")
+        lo, hi = self._prefix_range(encoded_prefix)
+        entries = []
+        while lo < hi:
+            name = self._name(lo)
+            cut = name.find(encoded_delimiter, len(encoded_prefix))
+            if cut == -1:
+                entries.append(dict(self._record(lo), kind="blob"))
+                lo += 1
+                continue
+            folder = name[:cut + len(encoded_delimiter)]
+            # 0xFF never occurs in UTF-8, so it sorts after every name inside the folder.
+            end = min(hi, self._lower_bound(folder + b"\xff", lo))
+            entries.append({
+                "kind": "prefix",
+                "name": folder.decode("utf-8"),
+                "objects": end - lo,
+                "bytes": self._cumulative[end] - self._cumulative[lo],
+            })
+            lo = end
+        return entries
+
+    # -- updates ------------------------------------------------------------
+
+    def refresh(self, storage, page_size=1000):
+        """
+        Adds the objects listed after the saved ``start_offset`` and saves the index.
+
+        Only names >= ``start_offset`` are listed, so the cost is proportional to what
+        was added since the last build or refresh. Changes to, or deletions of, older
+        names are not seen; feed those through :meth:`apply_changes` or rebuild.
+
+        Args:
+            storage (GCPStorage): The client used for listing.
+            page_size (int, optional): Listing page size. Defaults to 1000.
+
+        Returns:
+            dict: ``listed``, ``added``, ``updated``, ``count``, ``start_offset`` and
+            ``elapsed_seconds``.
+        """
+        started_at = time.perf_counter()
+        # The listing starts at the last indexed name, which comes back first; unchanged, it is no update.
+        boundary = self.get(self.start_offset) if self.start_offset else None
+        changes, listed = {}, 0
+        for record in storage.iter_blobs(
+            self.bucket, prefix=self.prefix or None, page_size=page_size, start_offset=self.start_offset or None
+        ):
+            if record["kind"] != "blob":
+                continue
+            listed += 1
+            generation = record["generation"] or 0
+            if boundary is not None and (record["name"], generation) == (boundary["name"], boundary["generation"] or 0):
+                continue
+            changes[record["name"].encode("utf-8")] = (record["size"] or 0, _micros(record["updated"]), generation)
+        counters = self._merge(changes)
+        result = {
+            "listed": listed,
+            "added": counters["added"],
+            "updated": counters["updated"],
+            "count": len(self),
+            "start_offset": self.start_offset,
+            "elapsed_seconds": round(time.perf_counter() - started_at, 6),
+        }
+        storage.logger.info(
+            "Refreshed inventory of '%s/%s': %d added, %d updated.",
+            self.bucket, self.prefix, counters["added"], counters["updated"]
+        )
+        return result
+
+    def apply_changes(self, events):
+        """
+        Folds a batch of object change notifications into the index and saves it.
+
+        Accepts Pub/Sub notification messages (``{"attributes": {...}, "data": ...}``,
+        with ``data`` as the JSON object resource, raw or decoded) or flat object
+        resources carrying an ``eventType`` key. ``OBJECT_FINALIZE`` and
+        ``OBJECT_METADATA_UPDATE`` upsert the object; ``OBJECT_DELETE`` and
+        ``OBJECT_ARCHIVE`` remove it. Events older than the indexed generation are
+        ignored, so redelivered or out-of-order notifications are harmless. Events for
+        other buckets or outside the inventory prefix are skipped.
+
+        Documentation: https://cloud.google.com/storage/docs/pubsub-notifications
+
+        Args:
+            events (iterable): The notifications.
+
+        Returns:
+            dict: ``added``, ``updated``, ``removed``, ``ignored`` and ``count``.
+        """
+        latest, ignored = {}, 0
+        for event in events:
+            event_type, resource = _parse_event(event)
+            name = resource.get("name")
+            if not name or resource.get("bucket", self.bucket) != self.bucket or not name.startswith(self.prefix):
+                ignored += 1
+                continue
+            generation = int(resource.get("generation") or 0)
+            removing = event_type in _REMOVING_EVENTS
+            encoded = name.encode("utf-8")
+            previous = latest.get(encoded)
+            # Keep the newest event per name; at the same generation a removal wins.
+            if previous is not None and (previous[0], previous[1]) > (generation, removing):
+                ignored += 1
+                continue
+            value = None if removing else (
+                int(resource.get("size") or 0), _micros(resource.get("updated")), generation
+            )
+            latest[encoded] = (generation, removing, value)
+
+        changes = {}
+        for encoded, (generation, removing, value) in latest.items():
+            index = self._lower_bound(encoded)
+            current = self._generations[index] if index < len(self) and self._name(index) == encoded else None
+            if current is not None and current > generation:
+                ignored += 1
+            elif removing and current is None:
+                ignored += 1
+            else:
+                changes[encoded] = value
+        counters = self._merge(changes)
+        counters["ignored"] = ignored
+        counters["count"] = len(self)
+        return counters
+
+    def close(self):
+        """Unmaps the inventory file."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # -- internals ----------------------------------------------------------
+
+    def _load(self):
+        """Helper method mapping the inventory file and exposing its columns as views."""
+        with open(self.path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f"'{self.path}' is not a bucket inventory.")
+        (header_length,) = struct.unpack_from("<Q", self._map, len(MAGIC))
+        data_start = len(MAGIC) + 8 + header_length
+        self.header = json.loads(self._map[len(MAGIC) + 8:data_start])
+        if self.header.get("version") != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"Unsupported inventory version {self.header.get('version')!r}.")
+        whole = memoryview(self._map)
+        self._views = [whole]
+        for name, typecode in COLUMNS + (("names", "B"),):
+            start, length = self.header["sections"][name]
+            view = whole[data_start + start:data_start + start + length]
+            if typecode != "B":
+                view = view.cast(typecode)
+            self._views.append(view)
+            setattr(self, f"_{name}", view)
+
+    def _merge(self, changes):
+        """
+        Helper method rewriting the index with ``changes`` (``name -> (size, updated,
+        generation)``, or None to remove) applied, then reloading it.
+
+        Entries before the first changed name are bulk-copied, so appending after
+        ``start_offset`` costs a memory copy plus the new entries.
+        """
+        counters = {"added": 0, "updated": 0, "removed": 0}
+        if not changes:
+            return counters
+        keys = sorted(changes)
+        columns = _Columns()
+        position = self._lower_bound(keys[0])
+        columns.extend_from(self, 0, position)
+        for key in keys:
+            end = self._lower_bound(key, position)
+            columns.extend_from(self, position, end)
+            position = end
+            exists = position < len(self) and self._name(position) == key
+            value = changes[key]
+            if exists:
+                position += 1
+                if value is None:
+                    counters["removed"] += 1
+                    continue
+                counters["updated"] += 1
+            elif value is None:
+                continue
+            else:
+                counters["added"] += 1
+            columns.append(key, *value)
+        columns.extend_from(self, position, len(self))
+
+        last = columns.names[columns.offsets[-2]:].decode("utf-8") if len(columns) else ""
+        header = {key: value for key, value in self.header.items() if key not in ("count", "sections")}
+        header["start_offset"] = last
+        header["updated_at"] = _now()
+        self.close()
+        columns.write(self.path, header)
+        self._load()
+        return counters
+
+    def _name(self, index):
+        return bytes(self._names[self._offsets[index]:self._offsets[index + 1]])
+
+    def _record(self, index):
+        updated = self._updated[index]
+        return {
+            "name": self._name(index).decode("utf-8"),
+            "size": self._cumulative[index + 1] - self._cumulative[index],
+            "updated": datetime.fromtimestamp(updated / 1e6, tz=timezone.utc) if updated else None,
+            "generation": self._generations[index] or None,
+        }
+
+    def _lower_bound(self, key, lo=0):
+        """Helper method returning the first index whose name is >= ``key`` (UTF-8 bytes)."""
+        hi = len(self)
+        while lo < hi:
+            middle = (lo + hi) // 2
+            if self._name(middle) < key:
+                lo = middle + 1
+            else:
+                hi = middle
+        return lo
+
+    def _prefix_range(self, encoded_prefix):
+        if not encoded_prefix:
+            return 0, len(self)
+        lo = self._lower_bound(encoded_prefix)
+        return lo, self._lower_bound(encoded_prefix + b"\xff", lo)
+
+    def _select(self, pattern):
+        """
+        Helper method resolving a prefix or glob to ``(lo, hi, matcher)``; ``matcher``
+        is None when every name in ``[lo, hi)`` matches.
+        """
+        cut = min((pattern.find(char) for char in _WILDCARDS if char in pattern), default=-1)
+        if cut == -1:
+            return self._prefix_range(pattern.encode("utf-8")) + (None,)
+        lo, hi = self._prefix_range(pattern[:cut].encode("utf-8"))
+        if pattern[cut:] == "*":
+            return lo, hi, None
+        compiled = re.compile(fnmatch.translate(pattern).encode("utf-8"), re.DOTALL)
+        return lo, hi, lambda name: compiled.match(name) is not None
+
+
+def _padded(length):
+    return (length + 7) // 8 * 8
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _micros(value):
+    """Helper converting a datetime or RFC 3339 string to integer microseconds since the epoch (0 if unknown)."""
+    if not value:
+        return 0
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return int(value.timestamp() * 1e6)
+
+
+def _parse_event(event):
+    """Helper returning ``(event_type, object_resource)`` from a Pub/Sub message or flat resource."""
+    if "attributes" in event:
+        data = event.get("data") or {}
+        if isinstance(data, (bytes, str)):
+            data = json.loads(data)
+        resource = dict(data)
+        attributes = event["attributes"]
+        resource.setdefault("name", attributes.get("objectId"))
+        resource.setdefault("bucket", attributes.get("bucketId"))
+        resource.setdefault("generation", attributes.get("objectGeneration"))
+        return attributes.get("eventType"), resource
+    return event.get("eventType"), event
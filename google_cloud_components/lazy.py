@@ -0,0 +1,48 @@
+import importlib
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported on first attribute access.
+
+    The Google SDK modules (``google.cloud.storage``, ``google.api_core``, ``requests``,
+    ``google.auth`` transports) take a few hundred milliseconds to import, which a CLI
+    or a serverless cold start pays even on code paths that never reach storage.
+    Modules hold these proxies in place of the real imports and use them exactly like
+    modules (``storage.Client``, ``except exceptions.NotFound``); the first attribute
+    lookup imports the module, later ones go straight to it.
+
+    Only attribute access is deferred, so ``from module import name`` must not be
+    used for proxied modules.
+    """
+    def __init__(self, name):
+        """
+        Args:
+            name (str): The absolute module name, e.g. ``"google.cloud.storage"``.
+        """
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        module = self._module
+        if module is None:
+            # import_module holds the per-module import lock, so concurrent first uses are safe.
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attribute)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name):
+    """
+    Returns a :class:`LazyModule` for ``name``.
+
+    Args:
+        name (str): The absolute module name.
+
+    Returns:
+        LazyModule: The proxy; nothing is imported yet.
+    """
+    return LazyModule(name)
@@ -0,0 +1,330 @@
+import bisect
+import contextvars
+import functools
+import inspect
+import threading
+import time
+
+from google_cloud_components.results import StorageError, StorageResult
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implied.
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+# The outermost instrumented call in progress in this context; calls nested in it are not recorded.
+_current_call = contextvars.ContextVar("gcs_instrumented_call", default=None)
+
+
+class _Call:
+    """Network transfer reported by the instrumented calls nested in one outermost call."""
+    __slots__ = ("metrics", "transferred", "retries", "_lock")
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+        # None until a nested transfer reports; the outermost call then counts these bytes instead of its own.
+        self.transferred = None
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def add(self, transferred, retries):
+        with self._lock:
+            self.transferred = (self.transferred or 0) + transferred
+            self.retries += retries
+
+
+class _Series:
+    """Counters of one ``(operation, bucket)`` pair."""
+    __slots__ = ("count", "seconds", "histogram", "bytes_sent", "bytes_received", "retries", "errors")
+
+    def __init__(self, buckets):
+        self.count = 0
+        self.seconds = 0.0
+        self.histogram = [0] * (len(buckets) + 1)
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.errors = {}
+
+
+class StorageMetrics:
+    """
+    Thread-safe collector of per-operation GCPStorage metrics.
+
+    For every ``(operation, bucket)`` pair it keeps a latency histogram, bytes sent
+    and received, retries and error counts by error class. Pass one instance to
+    ``GCPStorage(metrics=...)`` (several clients may share it) and read it back with
+    :meth:`snapshot` or :meth:`to_prometheus`. Without a collector, instrumented
+    methods cost one attribute check per call.
+
+    ``span_factory`` hooks storage calls into a tracer. It is called as
+    ``span_factory(name, attributes)`` and must return a context manager; if the
+    object it yields has ``set_attribute`` (as OpenTelemetry spans do), the outcome is
+    attached to it. With OpenTelemetry::
+
+        tracer = trace.get_tracer("google_cloud_components")
+        metrics = StorageMetrics(
+            span_factory=lambda name, attributes: tracer.start_as_current_span(name, attributes=attributes)
+        )
+    """
+    def __init__(self, latency_buckets=DEFAULT_LATENCY_BUCKETS, span_factory=None, clock=time.perf_counter):
+        """
+        Initializes an empty collector.
+
+        Args:
+            latency_buckets (tuple): Histogram upper bounds in seconds, ascending.
+            span_factory (callable, optional): ``(name, attributes) -> context manager`` tracing hook.
+            clock (callable): Time source, overridable for tests.
+        """
+        self.latency_buckets = tuple(latency_buckets)
+        self.span_factory = span_factory
+        self._clock = clock
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, operation, bucket, method, args, kwargs, direction=None):
+        """
+        Calls ``method(*args, **kwargs)`` and records its latency and outcome.
+
+        Exceptions are recorded under their class name and re-raised.
+        """
+        if self.span_factory is None:
+            return self._call(operation, bucket, method, args, kwargs, direction, None)
+        attributes = {"gcs.operation": operation}
+        if bucket:
+            attributes["gcs.bucket"] = bucket
+        with self.span_factory(f"gcs.{operation}", attributes) as span:
+            return self._call(operation, bucket, method, args, kwargs, direction, span)
+
+    def _call(self, operation, bucket, method, args, kwargs, direction, span):
+        """Helper method timing one call and recording it."""
+        started_at = self._clock()
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            self.record(operation, bucket, self._clock() - started_at, error=type(e).__name__)
+            if span is not None and hasattr(span, "set_attribute"):
+                span.set_attribute("gcs.error", type(e).__name__)
+            raise
+        transferred, retries, error = _outcome(result)
+        call = _current_call.get()
+        if call is not None and call.transferred is not None:
+            transferred, retries = call.transferred, call.retries
+        self.record(
+            operation, bucket, self._clock() - started_at,
+            bytes_sent=transferred if direction == "sent" else 0,
+            bytes_received=transferred if direction == "received" else 0,
+            retries=retries,
+            error=error,
+        )
+        if span is not None and hasattr(span, "set_attribute"):
+            if direction:
+                span.set_attribute(f"gcs.bytes_{direction}", transferred)
+            if retries:
+                span.set_attribute("gcs.retries", retries)
+            if error:
+                span.set_attribute("gcs.error", error)
+        return result
+
+    def record(self, operation, bucket, seconds, bytes_sent=0, bytes_received=0, retries=0, error=None):
+        """
+        Records one completed operation.
+
+        Args:
+            operation (str): The operation name, e.g. ``"create_blob"``.
+            bucket (str): The bucket, or None for project-level calls.
+            seconds (float): Wall-clock latency.
+            bytes_sent (int): Bytes uploaded.
+            bytes_received (int): Bytes downloaded.
+            retries (int): Retries made.
+            error (str, optional): Error class, if the operation failed.
+        """
+        index = bisect.bisect_left(self.latency_buckets, seconds)
+        key = (operation, bucket or "")
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(self.latency_buckets)
+            series.count += 1
+            series.seconds += seconds
+            series.histogram[index] += 1
+            series.bytes_sent += bytes_sent
+            series.bytes_received += bytes_received
+            series.retries += retries
+            if error:
+                series.errors[error] = series.errors.get(error, 0) + 1
+
+    def snapshot(self):
+        """
+        Returns a copy of every series.
+
+        Returns:
+            dict: ``{(operation, bucket): {...}}`` where each value holds ``count``,
+            ``seconds`` (total), ``histogram`` (cumulative ``[(upper_bound, count), ...]``
+            ending with ``inf``), ``bytes_sent``, ``bytes_received``, ``retries`` and
+            ``errors`` (``{error_class: count}``).
+        """
+        bounds = self.latency_buckets + (float("inf"),)
+        with self._lock:
+            items = [
+                (key, series.count, series.seconds, list(series.histogram), series.bytes_sent,
+                 series.bytes_received, series.retries, dict(series.errors))
+                for key, series in self._series.items()
+            ]
+        snapshot = {}
+        for key, count, seconds, histogram, sent, received, retries, errors in items:
+            cumulative, total = [], 0
+            for bound, hits in zip(bounds, histogram):
+                total += hits
+                cumulative.append((bound, total))
+            snapshot[key] = {
+                "count": count,
+                "seconds": seconds,
+                "histogram": cumulative,
+                "bytes_sent": sent,
+                "bytes_received": received,
+                "retries": retries,
+                "errors": errors,
+            }
+        return snapshot
+
+    def to_prometheus(self, prefix="gcs_client"):
+        """
+        Renders every series in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Metric name prefix. Defaults to ``gcs_client``.
+
+        Returns:
+            str: The exposition text, ready to serve from a ``/metrics`` endpoint.
+        """
+        snapshot = sorted(self.snapshot().items())
+        lines = [
+            f"# HELP {prefix}_operation_seconds Latency of GCPStorage operations.",
+            f"# TYPE {prefix}_operation_seconds histogram",
+        ]
+        for (operation, bucket), series in snapshot:
+            labels = f'operation="{_escape(operation)}",bucket="{_escape(bucket)}"'
+            for bound, count in series["histogram"]:
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_operation_seconds_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{prefix}_operation_seconds_sum{{{labels}}} {series['seconds']!r}")
+            lines.append(f"{prefix}_operation_seconds_count{{{labels}}} {series['count']}")
+
+        lines.append(f"# HELP {prefix}_bytes_total Bytes transferred by GCPStorage operations.")
+        lines.append(f"# TYPE {prefix}_bytes_total counter")
+        for (operation, bucket), series in snapshot:
+            labels = f'operation="{_escape(operation)}",bucket="{_escape(bucket)}"'
+            for direction in ("sent", "received"):
+                if series[f"bytes_{direction}"]:
+                    lines.append(
+                        f'{prefix}_bytes_total{{{labels},direction="{direction}"}} {series[f"bytes_{direction}"]}'
+                    )
+
+        lines.append(f"# HELP {prefix}_retries_total Retries made by GCPStorage operations.")
+        lines.append(f"# TYPE {prefix}_retries_total counter")
+        for (operation, bucket), series in snapshot:
+            if series["retries"]:
+                labels = f'operation="{_escape(operation)}",bucket="{_escape(bucket)}"'
+                lines.append(f"{prefix}_retries_total{{{labels}}} {series['retries']}")
+
+        lines.append(f"# HELP {prefix}_errors_total Failed GCPStorage operations by error class.")
+        lines.append(f"# TYPE {prefix}_errors_total counter")
+        for (operation, bucket), series in snapshot:
+            labels = f'operation="{_escape(operation)}",bucket="{_escape(bucket)}"'
+            for error, count in sorted(series["errors"].items()):
+                lines.append(f'{prefix}_errors_total{{{labels},error="{_escape(error)}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Drops every series."""
+        with self._lock:
+            self._series.clear()
+
+
+def instrumented(operation, direction=None, bucket_arg="bucket_name"):
+    """
+    Decorates a GCPStorage method so calls are recorded in ``self.metrics``, when set.
+
+    Only the outermost instrumented call is recorded: a method called by another one
+    (``create_blob`` uploading through ``upload_resumable``, ``read_blob`` through the
+    disk cache) is not counted as an operation of its own. The bytes it moved over the
+    network are credited to the outer call instead of whatever the outer call returned,
+    so a ``read_blob`` served from the disk cache reports no bytes received.
+
+    Args:
+        operation (str): The operation name used as metric label.
+        direction (str, optional): ``"sent"`` or ``"received"``: where the bytes reported
+            by the result are counted.
+        bucket_arg (str, optional): The parameter holding the bucket label. Defaults to ``"bucket_name"``.
+    """
+    def decorate(method):
+        parameters = list(inspect.signature(method).parameters.values())
+        names = [parameter.name for parameter in parameters]
+        # Position of the bucket argument among the arguments after ``self``, and its default.
+        position = names.index(bucket_arg) - 1 if bucket_arg in names else None
+        default = parameters[position + 1].default if position is not None else None
+        if default is inspect.Parameter.empty:
+            default = None
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            metrics = self.metrics
+            if metrics is None:
+                return method(self, *args, **kwargs)
+            outer = _current_call.get()
+            if outer is not None and outer.metrics is metrics:
+                result = method(self, *args, **kwargs)
+                if direction:
+                    transferred, retries, _ = _outcome(result)
+                    outer.add(transferred, retries)
+                return result
+            if position is None:
+                bucket = None
+            elif position < len(args):
+                bucket = args[position]
+            else:
+                bucket = kwargs.get(bucket_arg, default)
+            token = _current_call.set(_Call(metrics))
+            try:
+                return metrics.observe(operation, bucket, method, (self,) + args, kwargs, direction)
+            finally:
+                _current_call.reset(token)
+        return wrapper
+    return decorate
+
+
+def _outcome(result):
+    """
+    Helper extracting ``(bytes, retries, error_class)`` from a GCPStorage return value.
+
+    Understands StorageError/StorageResult, transfer result dicts (``status``, ``bytes``,
+    ``retries``, ``error_type``), bulk reports (``summary``) and raw ``bytes``.
+    """
+    if isinstance(result, StorageError):
+        return 0, 0, _error_class(result)
+    if isinstance(result, StorageResult):
+        if result.error is not None:
+            return 0, 0, _error_class(result.error)
+        return (result.value if isinstance(result.value, int) else 0), 0, None
+    if isinstance(result, (bytes, bytearray)):
+        return len(result), 0, None
+    if isinstance(result, dict):
+        if "summary" in result:
+            summary = result["summary"]
+            return summary.get("bytes", 0), 0, ("partial_failure" if summary.get("failed") else None)
+        if "status" in result:
+            error = None
+            if result["status"] == "failed":
+                error = result.get("error_type") or "failed"
+            return result.get("bytes", 0), result.get("retries", 0), error
+    return 0, 0, None
+
+
+def _error_class(error):
+    """Helper naming the class of a StorageError: its cause's exception class, or its kind."""
+    return type(error.cause).__name__ if error.cause is not None else error.kind
+
+
+def _escape(value):
+    """Helper escaping a Prometheus label value."""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
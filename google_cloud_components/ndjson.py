@@ -0,0 +1,118 @@
+import json
+
+
+def new_stats():
+    """
+    Returns a fresh counters dict for :func:`iter_ndjson`.
+
+    Returns:
+        dict: ``records``, ``malformed``, ``lines``, ``bytes_read`` and ``chunks``, all zero.
+    """
+    return {"records": 0, "malformed": 0, "lines": 0, "bytes_read": 0, "chunks": 0}
+
+
+def iter_ndjson(chunks, stats=None):
+    """
+    Incrementally parses newline-delimited JSON from an iterable of byte chunks.
+
+    A line that straddles two chunks is carried over and completed by the next
+    chunk, so only one partial line is ever buffered. Blank lines are skipped;
+    lines that fail to parse are counted in ``stats["malformed"]`` rather than
+    dropped silently.
+
+    Args:
+        chunks (iterable of bytes): The raw object contents, in order.
+        stats (dict, optional): Counters to update in place, as returned by :func:`new_stats`.
+
+    Yields:
+        The parsed JSON value of each non-blank line.
+    """
+    if stats is None:
+        stats = new_stats()
+    remainder = b""
+    for chunk in chunks:
+        stats["chunks"] += 1
+        stats["bytes_read"] += len(chunk)
+        lines = (remainder + chunk).split(b"\n")
+        remainder = lines.pop()
+        for line in lines:
+            record = _parse_line(line, stats)
+            if record is not _SKIP:
+                yield record
+    if remainder:
+        record = _parse_line(remainder, stats)
+        if record is not _SKIP:
+            yield record
+
+
+def iter_batches(records, batch_size):
+    """
+    Groups an iterable of records into lists of at most ``batch_size`` items.
+
+    Args:
+        records (iterable): The records to group.
+        batch_size (int): Maximum number of records per batch.
+
+    Yields:
+        list: The next batch; only the last one may be shorter than ``batch_size``.
+    """
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def encode_ndjson(records, chunk_size=256 * 1024, stats=None):
+    """
+    Serializes records as newline-delimited JSON, grouped into byte chunks.
+
+    The inverse of :func:`iter_ndjson`. Lines are joined until a chunk reaches
+    ``chunk_size`` bytes, so a writer receives a few large writes instead of one
+    per record, and at most one chunk is held in memory.
+
+    Args:
+        records (iterable): JSON-serializable values.
+        chunk_size (int, optional): Target chunk size in bytes. Defaults to 256 KiB.
+        stats (dict, optional): Updated in place with ``records`` and ``bytes``.
+
+    Yields:
+        bytes: UTF-8 encoded lines, each ending with ``\\n``.
+    """
+    if stats is None:
+        stats = {}
+    stats.setdefault("records", 0)
+    stats.setdefault("bytes", 0)
+    lines, pending = [], 0
+    for record in records:
+        line = json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+        lines.append(line)
+        pending += len(line)
+        stats["records"] += 1
+        if pending >= chunk_size:
+            stats["bytes"] += pending
+            yield b"".join(lines)
+            lines, pending = [], 0
+    if lines:
+        stats["bytes"] += pending
+        yield b"".join(lines)
+
+
+_SKIP = object()
+
+
+def _parse_line(line, stats):
+    """Helper to parse one raw line, updating ``stats``; returns ``_SKIP`` for blank or bad lines."""
+    stats["lines"] += 1
+    if not line.strip():
+        return _SKIP
+    try:
+        record = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        stats["malformed"] += 1
+        return _SKIP
+    stats["records"] += 1
+    return record
@@ -0,0 +1,113 @@
+from google_cloud_components.lazy import lazy_import
+
+exceptions = lazy_import("google.api_core.exceptions")
+
+
+class StorageError:
+    """
+    Typed description of a failed GCPStorage call.
+
+    Returned in place of the human-readable error strings the storage methods used
+    to hand back. It is falsy, so ``if not result:`` still detects failures, and
+    ``str()`` gives the same message that used to be returned.
+
+    Attributes:
+        operation (str): The GCPStorage method that failed, e.g. ``"get_bucket_metadata"``.
+        kind (str): ``"unauthenticated"``, ``"invalid_argument"``, ``"not_found"``,
+            ``"api_error"`` (any other HTTP error) or ``"error"``.
+        message (str): Human-readable description.
+        bucket (str): The bucket involved, if any.
+        blob (str): The blob involved, if any.
+        status_code (int): HTTP status of the underlying API error, if any.
+        cause (Exception): The original exception, if any.
+    """
+    __slots__ = ("operation", "kind", "message", "bucket", "blob", "status_code", "cause")
+
+    def __init__(self, operation, kind, message, bucket=None, blob=None, status_code=None, cause=None):
+        self.operation = operation
+        self.kind = kind
+        self.message = message
+        self.bucket = bucket
+        self.blob = blob
+        self.status_code = status_code
+        self.cause = cause
+
+    @classmethod
+    def from_exception(cls, operation, error, message=None, bucket=None, blob=None):
+        """
+        Builds an error from an exception raised by the storage client.
+
+        Args:
+            operation (str): The GCPStorage method that failed.
+            error (Exception): The exception.
+            message (str, optional): Overrides the message; defaults to ``str(error)``.
+            bucket (str, optional): The bucket involved.
+            blob (str, optional): The blob involved.
+        """
+        status_code = getattr(error, "code", None)
+        if isinstance(error, exceptions.NotFound):
+            kind = "not_found"
+        elif isinstance(error, exceptions.GoogleAPICallError):
+            kind = "api_error"
+        else:
+            kind = "error"
+            status_code = None
+        return cls(operation, kind, message or str(error), bucket, blob, status_code, error)
+
+    def raise_error(self):
+        """Raises the original exception, or a RuntimeError carrying the message."""
+        if self.cause is not None:
+            raise self.cause
+        raise RuntimeError(self.message)
+
+    def __bool__(self):
+        return False
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"StorageError(operation={self.operation!r}, kind={self.kind!r}, message={self.message!r})"
+
+
+class StorageResult:
+    """
+    Outcome of a GCPStorage call that changes or lists resources.
+
+    Truthy when the call succeeded. ``value`` carries what the call produced (for
+    example the new bucket's details or the listed bucket names) and ``error`` the
+    :class:`StorageError` when it failed.
+
+    Attributes:
+        operation (str): The GCPStorage method, e.g. ``"create_blob"``.
+        bucket (str): The bucket involved, if any.
+        blob (str): The blob involved, if any.
+        value: The call's return value, if any.
+        error (StorageError): Set when the call failed.
+    """
+    __slots__ = ("operation", "bucket", "blob", "value", "error")
+
+    def __init__(self, operation, bucket=None, blob=None, value=None, error=None):
+        self.operation = operation
+        self.bucket = bucket
+        self.blob = blob
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self):
+        """True if the call succeeded."""
+        return self.error is None
+
+    def unwrap(self):
+        """Returns ``value``, or raises the error if the call failed."""
+        if self.error is not None:
+            self.error.raise_error()
+        return self.value
+
+    def __bool__(self):
+        return self.error is None
+
+    def __repr__(self):
+        state = f"value={self.value!r}" if self.error is None else f"error={self.error!r}"
+        return f"StorageResult(operation={self.operation!r}, bucket={self.bucket!r}, blob={self.blob!r}, {state})"
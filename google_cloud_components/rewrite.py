@@ -0,0 +1,93 @@
+import os
+import sqlite3
+import threading
+
+
+class RewriteCheckpoint:
+    """
+    SQLite record of the progress of one ``copy_prefix`` / ``move_prefix`` run.
+
+    One row per source object stores the generation being copied, the bytes
+    rewritten so far and, while a multi-call rewrite is under way, its continuation
+    token. A row marked done is skipped by the next run as long as the source still
+    has the same generation; an unfinished row resumes the rewrite from its token
+    instead of starting over. Every update is committed as it happens (WAL mode, so
+    commits are cheap), so a run killed at any point loses at most the call in flight.
+
+    The workers of a run share one instance; access is serialized with a lock.
+    """
+    def __init__(self, path, job):
+        """
+        Opens (and creates if needed) the checkpoint database.
+
+        Args:
+            path (str): Location of the SQLite file.
+            job (str): Identifies the source, destination and options of the run. Rows
+                left by a different job are discarded.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS job (key TEXT NOT NULL)")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS objects (
+                name TEXT PRIMARY KEY,
+                generation INTEGER NOT NULL,
+                bytes INTEGER NOT NULL,
+                rewrite_token TEXT,
+                done INTEGER NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        row = self._db.execute("SELECT key FROM job").fetchone()
+        if row is None or row[0] != job:
+            self._db.execute("DELETE FROM job")
+            self._db.execute("DELETE FROM objects")
+            self._db.execute("INSERT INTO job (key) VALUES (?)", (job,))
+        self._db.commit()
+
+    def load(self):
+        """
+        Returns every recorded object.
+
+        Returns:
+            dict: ``name -> (generation, bytes, rewrite_token, done)``.
+        """
+        with self._lock:
+            rows = self._db.execute("SELECT name, generation, bytes, rewrite_token, done FROM objects").fetchall()
+        return {row[0]: (row[1], row[2], row[3], bool(row[4])) for row in rows}
+
+    def save_token(self, name, generation, rewritten, token):
+        """Records an unfinished rewrite and the token that continues it."""
+        self._write(name, generation, rewritten, token, False)
+
+    def mark_done(self, name, generation, size):
+        """Records a finished copy."""
+        self._write(name, generation, size, None, True)
+
+    def _write(self, name, generation, rewritten, token, done):
+        """Helper method upserting and committing one row."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO objects (name, generation, bytes, rewrite_token, done) VALUES (?, ?, ?, ?, ?)",
+                (name, generation, rewritten, token, int(done)),
+            )
+            self._db.commit()
+
+    def close(self):
+        """Commits and closes the database."""
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+    def clear(self):
+        """Closes and deletes the checkpoint once the run has completed."""
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self.path + suffix)
+            except OSError:
+                pass
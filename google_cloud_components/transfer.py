@@ -0,0 +1,282 @@
+import base64
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+
+import google_crc32c
+
+from google_cloud_components.lazy import lazy_import
+
+# Imported on first use to keep importing GCPStorage cheap.
+futures = lazy_import("concurrent.futures")
+exceptions = lazy_import("google.api_core.exceptions")
+requests = lazy_import("requests")
+
+# HTTP statuses worth retrying: rate limiting and transient server-side failures.
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def run_bounded(func, items, max_workers=8, max_pending=None):
+    """
+    Runs ``func`` over ``items`` on a bounded thread pool and yields results as they finish.
+
+    Items are pulled from the iterable lazily, so at most ``max_pending`` calls are
+    queued at any time. This keeps memory flat when ``items`` is a generator over
+    tens of thousands of files.
+
+    Args:
+        func (callable): Called once per item; its return value is yielded.
+        items (iterable): The work items.
+        max_workers (int): Number of worker threads. Defaults to 8.
+        max_pending (int, optional): Maximum number of submitted but unfinished calls.
+            Defaults to twice ``max_workers``.
+
+    Yields:
+        The return value of ``func`` for each item, in completion order.
+    """
+    max_pending = max_pending or max_workers * 2
+    items = iter(items)
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for item in items:
+            pending.add(executor.submit(func, item))
+            if len(pending) >= max_pending:
+                done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def summarize(results, started_at, ok_status):
+    """
+    Builds an aggregate throughput report for a list of per-item transfer results.
+
+    Args:
+        results (list): Per-item result dicts carrying ``status`` and ``bytes`` keys.
+        started_at (float): ``time.perf_counter()`` value taken before the first transfer.
+        ok_status (str): The ``status`` value that marks a successful transfer.
+
+    Returns:
+        dict: Counts, total bytes, wall-clock seconds, files/sec and MB/sec.
+    """
+    elapsed = time.perf_counter() - started_at
+    succeeded = [r for r in results if r["status"] == ok_status]
+    total_bytes = sum(r["bytes"] for r in succeeded)
+    return {
+        "files": len(results),
+        "succeeded": len(succeeded),
+        "failed": len(results) - len(succeeded),
+        "bytes": total_bytes,
+        "elapsed_seconds": round(elapsed, 6),
+        "files_per_sec": round(len(succeeded) / elapsed, 2) if elapsed else 0.0,
+        "mb_per_sec": round(total_bytes / (1024 * 1024) / elapsed, 3) if elapsed else 0.0,
+    }
+
+
+class SliceWriter:
+    """
+    Minimal file-like object that writes into a fixed window of a shared buffer.
+
+    Ranged downloads stream straight into a preallocated ``mmap`` through this
+    writer, so each slice lands at its final offset without an intermediate copy.
+
+    Args:
+        buffer: A writable buffer (``mmap.mmap`` or ``bytearray``) covering the whole object.
+        start (int): Offset of the first byte of this slice.
+        end (int): Offset of the last byte of this slice (inclusive).
+    """
+    def __init__(self, buffer, start, end):
+        self.view = memoryview(buffer)
+        self.start = start
+        self.end = end
+        self.position = start
+
+    def write(self, data):
+        """Copies ``data`` into the buffer at the current position."""
+        size = len(data)
+        if self.position + size > self.end + 1:
+            raise ValueError("Received more bytes than the requested range.")
+        self.view[self.position:self.position + size] = data
+        self.position += size
+        return size
+
+    def remaining(self):
+        """Returns the ``(start, end)`` range still to be written, or None when complete."""
+        if self.position > self.end:
+            return None
+        return self.position, self.end
+
+    def release(self):
+        """Releases the memoryview so the underlying mmap can be closed."""
+        self.view.release()
+
+
+def verify_checksums(buffer, size, crc32c=None, md5_hash=None, block_size=4 * 1024 * 1024):
+    """
+    Checks a downloaded buffer against the base64 crc32c / md5 values GCS reports.
+
+    Args:
+        buffer: The downloaded bytes (``mmap.mmap``, ``bytearray`` or ``bytes``).
+        size (int): Number of bytes to check.
+        crc32c (str, optional): Expected base64 big-endian CRC32C.
+        md5_hash (str, optional): Expected base64 MD5 (absent for composite objects).
+        block_size (int, optional): Bytes hashed per step.
+
+    Returns:
+        str or None: A description of the mismatch, or None if every available checksum matches.
+    """
+    crc = google_crc32c.Checksum() if crc32c else None
+    md5 = hashlib.md5() if md5_hash else None
+    for offset in range(0, size, block_size):
+        block = buffer[offset:min(offset + block_size, size)]
+        if crc:
+            crc.update(block)
+        if md5:
+            md5.update(block)
+    if crc and base64.b64encode(crc.digest()).decode("ascii") != crc32c:
+        return f"crc32c mismatch (expected {crc32c})"
+    if md5 and base64.b64encode(md5.digest()).decode("ascii") != md5_hash:
+        return f"md5 mismatch (expected {md5_hash})"
+    return None
+
+
+def file_crc32c(path, block_size=1024 * 1024):
+    """
+    Computes the base64 big-endian CRC32C of a local file, the same encoding GCS reports.
+
+    Args:
+        path (str): The local file.
+        block_size (int, optional): Bytes read per step.
+
+    Returns:
+        str: The base64 CRC32C.
+    """
+    crc = google_crc32c.Checksum()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            crc.update(block)
+    return base64.b64encode(crc.digest()).decode("ascii")
+
+
+def is_retryable(error):
+    """
+    Tells transient transfer errors (429, 5xx, dropped connections) from fatal ones.
+
+    Args:
+        error (Exception): The error raised by a request.
+
+    Returns:
+        bool: True if the request may succeed when retried.
+    """
+    if isinstance(error, exceptions.GoogleAPICallError):
+        return error.code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (
+        ConnectionError,
+        TimeoutError,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.ChunkedEncodingError,
+        requests.exceptions.Timeout,
+    ))
+
+
+def backoff_delay(attempt, initial=0.5, maximum=30.0, multiplier=2.0):
+    """
+    Returns how long to sleep before retry number ``attempt`` (starting at 1).
+
+    Uses "full jitter": a uniform draw between zero and the capped exponential
+    delay, so clients that failed together do not retry in lockstep.
+
+    Args:
+        attempt (int): The retry about to be made, starting at 1.
+        initial (float): Upper bound of the first delay, in seconds. Defaults to 0.5.
+        maximum (float): Cap on the exponential bound, in seconds. Defaults to 30.
+        multiplier (float): Growth factor per attempt. Defaults to 2.
+
+    Returns:
+        float: Seconds to sleep.
+    """
+    return random.uniform(0, min(maximum, initial * multiplier ** (attempt - 1)))
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by the workers of one bulk operation.
+
+    ``acquire(amount)`` takes ``amount`` tokens and sleeps for as long as the bucket
+    is in debt, so the long-run rate never exceeds ``rate`` per second while short
+    bursts of up to ``burst`` go through immediately. Amounts larger than the bucket
+    are allowed; they simply make the caller (and the callers after it) wait longer.
+
+    Args:
+        rate (float): Tokens added per second; None disables the limit.
+        burst (float, optional): Bucket capacity. Defaults to a tenth of a second's worth of
+            ``rate`` (at least 1), which keeps the rate over any second close to the cap.
+    """
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, (rate or 0) / 10)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount=1):
+        """
+        Takes ``amount`` tokens, sleeping until the bucket has paid them back.
+
+        Returns:
+            float: Seconds slept.
+        """
+        if not self.rate or amount <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class TransferCheckpoint:
+    """
+    JSON file recording the progress of one resumable transfer.
+
+    The state is rewritten atomically (temporary file plus ``os.replace``) after
+    every acknowledged chunk, so a process killed at any point leaves either the
+    previous or the new checkpoint behind, never a torn one.
+
+    Args:
+        path (str): Location of the checkpoint file.
+    """
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        """Returns the saved state, or None if there is no usable checkpoint."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, state):
+        """Atomically replaces the saved state with ``state``."""
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(state, handle)
+        os.replace(temp_path, self.path)
+
+    def clear(self):
+        """Deletes the checkpoint once the transfer has completed."""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
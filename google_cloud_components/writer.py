@@ -0,0 +1,284 @@
+import base64
+import mimetypes
+import time
+
+import google_crc32c
+
+from google_cloud_components.compression import compressor
+from google_cloud_components.transfer import backoff_delay, is_retryable
+
+# Every chunk of a resumable upload but the last must be a multiple of 256 KiB.
+UPLOAD_CHUNK_ALIGNMENT = 256 * 1024
+
+
+class BlobWriter:
+    """
+    Writable binary file-like object that streams into a GCS object.
+
+    Written bytes are (optionally) compressed as they arrive and sent through a
+    resumable upload session in ``chunk_size`` pieces, so memory stays bounded by
+    one chunk plus the current write whatever the object size. Nothing is visible
+    in the bucket until :meth:`close`, which sends the last chunk and finalizes
+    the object; an object that fits in a single chunk is sent with one simple
+    upload instead of opening a session.
+
+    Each chunk is kept until GCS acknowledges it. A transient failure (429, 5xx,
+    dropped connection) is retried with backoff after asking the session how many
+    bytes it holds, so only the missing tail of the chunk is resent. The stored
+    crc32c is checked against the bytes sent once the object is finalized.
+
+    Use it as a context manager: leaving the block normally closes (and commits)
+    the object, leaving it with an exception cancels the upload::
+
+        with storage.open_blob_writer("bucket", "json/2019-04-28.json.gz", compression="gzip") as writer:
+            for record in records:
+                writer.write(json.dumps(record).encode("utf-8") + b"\\n")
+
+    After closing, ``result`` holds the same kind of report as ``upload_resumable``.
+    Instances are created by :meth:`GCPStorage.open_blob_writer`.
+    """
+    def __init__(
+        self,
+        storage,
+        bucket_name,
+        blob_name,
+        chunk_size,
+        content_type=None,
+        compression=None,
+        compression_level=None,
+        metadata=None,
+        retries=5
+    ):
+        """
+        Prepares the writer; no request is made until the first chunk is full or the writer is closed.
+
+        Args:
+            storage (GCPStorage): The authenticated client.
+            bucket_name (str): The name of the bucket.
+            blob_name (str): The name of the blob.
+            chunk_size (int): Bytes sent per request, a multiple of 256 KiB.
+            content_type (str, optional): Defaults to a type guessed from the blob name.
+            compression (str, optional): ``"gzip"`` or ``"zstd"``; sets ``content_encoding``.
+            compression_level (int, optional): Compressor level.
+            metadata (dict, optional): Custom object metadata.
+            retries (int, optional): Consecutive failed attempts allowed per chunk. Defaults to 5.
+
+        Raises:
+            ValueError: If ``chunk_size`` is not a positive multiple of 256 KiB, or the
+                compression is unsupported.
+        """
+        if chunk_size <= 0 or chunk_size % UPLOAD_CHUNK_ALIGNMENT:
+            raise ValueError("chunk_size must be a positive multiple of 256 KiB.")
+        self.storage = storage
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.blob = storage.storage_client.bucket(bucket_name).blob(blob_name)
+        self.blob.content_type = content_type or mimetypes.guess_type(blob_name)[0] or "application/octet-stream"
+        if compression:
+            self.blob.content_encoding = compression
+        if metadata:
+            self.blob.metadata = metadata
+        self.closed = False
+        self._compressor = compressor(compression, compression_level) if compression else None
+        self._buffer = bytearray()
+        self._checksum = google_crc32c.Checksum()
+        self._session_url = None
+        self._offset = 0
+        self._started_at = time.perf_counter()
+        self.result = {
+            "bucket": bucket_name,
+            "name": blob_name,
+            "status": "open",
+            "error": None,
+            "bytes": 0,
+            "raw_bytes": 0,
+            "content_encoding": compression,
+            "chunks": 0,
+            "retries": 0,
+            "elapsed_seconds": 0.0,
+            "mb_per_sec": 0.0,
+            "generation": None,
+        }
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        """Returns the number of (uncompressed) bytes written so far."""
+        return self.result["raw_bytes"]
+
+    def write(self, data):
+        """
+        Buffers ``data`` (compressing it first, if enabled) and sends every full chunk.
+
+        Args:
+            data (bytes-like): The bytes to append.
+
+        Returns:
+            int: The number of bytes accepted (always all of them).
+
+        Raises:
+            ValueError: If the writer is closed.
+            TypeError: If ``data`` is a ``str``; encode it first.
+        """
+        if self.closed:
+            raise ValueError("I/O operation on a closed blob writer.")
+        if isinstance(data, str):
+            raise TypeError("BlobWriter writes bytes; encode str data first.")
+        size = memoryview(data).nbytes
+        self.result["raw_bytes"] += size
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        self._buffer += data
+        try:
+            self._send_full_chunks()
+        except Exception as e:
+            self._fail(e)
+            self.closed = True
+            raise
+        return size
+
+    def flush(self):
+        """No-op: data is sent in whole chunks as they fill up, and the rest on :meth:`close`."""
+
+    def close(self):
+        """
+        Sends the buffered tail, finalizes the object and verifies its crc32c.
+
+        Returns:
+            dict: The upload report (also kept in ``result``).
+
+        Raises:
+            Exception: Whatever made the upload fail; the session is cancelled first.
+        """
+        if self.closed:
+            return self.result
+        try:
+            if self._compressor is not None:
+                self._buffer += self._compressor.flush()
+            self._send_full_chunks()
+            total = self._offset + len(self._buffer)
+            self._checksum.update(bytes(self._buffer))
+            if self._session_url is None:
+                self.blob.upload_from_string(bytes(self._buffer), content_type=self.blob.content_type)
+                self.result["chunks"] += 1
+            else:
+                self.blob._set_properties(self._put(bytes(self._buffer), total))
+            self._buffer = bytearray()
+            self.storage._invalidate_blob(self.blob.bucket.name, self.blob.name)
+            if self.blob.crc32c and self.blob.crc32c != base64.b64encode(self._checksum.digest()).decode("ascii"):
+                raise ValueError(f"Checksum validation failed for '{self.blob.name}': crc32c mismatch.")
+
+            elapsed = time.perf_counter() - self._started_at
+            self.result.update(
+                status="uploaded",
+                bytes=total,
+                generation=self.blob.generation,
+                elapsed_seconds=elapsed,
+                mb_per_sec=round(total / (1024 * 1024) / elapsed, 3) if elapsed else 0.0,
+            )
+            self.storage.logger.info(
+                "Streamed '%s' to bucket '%s': %s bytes stored from %s written (%s chunks, %s retries).",
+                self.blob.name, self.blob.bucket.name, total, self.result["raw_bytes"],
+                self.result["chunks"], self.result["retries"]
+            )
+            return self.result
+        except Exception as e:
+            self._fail(e)
+            raise
+        finally:
+            self.closed = True
+
+    def abort(self):
+        """Cancels the upload; nothing is written to the bucket."""
+        if self.closed:
+            return
+        self.closed = True
+        self._buffer = bytearray()
+        self._cancel_session()
+        self.result["status"] = "aborted"
+        self.result["elapsed_seconds"] = time.perf_counter() - self._started_at
+        self.storage.logger.warning("Aborted streaming upload of '%s'.", self.blob.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _send_full_chunks(self):
+        """Helper method sending whole chunks while the buffer holds at least one."""
+        while len(self._buffer) >= self.chunk_size:
+            chunk = bytes(self._buffer[:self.chunk_size])
+            self._checksum.update(chunk)
+            self._put(chunk, None)
+            del self._buffer[:self.chunk_size]
+
+    def _put(self, chunk, total):
+        """
+        Helper method uploading one chunk at the acknowledged offset, retrying transient
+        failures from wherever the session says it stopped.
+
+        ``total`` is None for intermediate chunks and the object size for the last one.
+        Returns the object resource once the upload is finalized, else None.
+        """
+        client = self.storage.storage_client
+        start, attempts, needs_query = self._offset, 0, False
+        size = "*" if total is None else total
+        while True:
+            try:
+                if self._session_url is None:
+                    self._session_url = self.blob.create_resumable_upload_session(
+                        content_type=self.blob.content_type, client=client
+                    )
+                if needs_query:
+                    offset, resource = self.storage._send_upload_chunk(self._session_url, b"", 0, size)
+                    needs_query = False
+                else:
+                    offset, resource = self.storage._send_upload_chunk(
+                        self._session_url, chunk[self._offset - start:], self._offset, size
+                    )
+                    self.result["chunks"] += 1
+                if offset < start:
+                    raise RuntimeError(f"Upload session lost acknowledged bytes (at {offset}, expected {start}).")
+                self._offset = offset
+                attempts = 0
+                if resource is not None:
+                    return resource
+                if total is None and offset >= start + len(chunk):
+                    return None
+            except Exception as e:
+                attempts += 1
+                if attempts > self.retries or not is_retryable(e):
+                    raise
+                self.result["retries"] += 1
+                self.storage.logger.warning(
+                    "Retrying streaming upload of '%s' at byte %s (attempt %s): %s",
+                    self.blob.name, self._offset, attempts, e
+                )
+                time.sleep(backoff_delay(attempts))
+                needs_query = self._session_url is not None
+
+    def _cancel_session(self):
+        """Helper method cancelling the resumable session, if one was opened."""
+        if self._session_url is None:
+            return
+        try:
+            self.storage.storage_client._http.delete(self._session_url, timeout=60)
+        except Exception as e:
+            self.storage.logger.warning("Could not cancel upload session of '%s': %s", self.blob.name, e)
+        self._session_url = None
+
+    def _fail(self, error):
+        """Helper method recording a failure in ``result`` and cancelling the session."""
+        self._cancel_session()
+        self.result.update(
+            status="failed",
+            error=str(error),
+            error_type=type(error).__name__,
+            elapsed_seconds=time.perf_counter() - self._started_at,
+        )
+        self.storage.logger.error("An error occurred while streaming '%s': %s", self.blob.name, error)
@@ -1,5 +1,4 @@
 """ Entry point for google_cloud_components package"""
-import json
 from google_cloud_components.cloud_storage import GCPStorage
 
 if __name__ == "__main__":
@@ -11,16 +10,13 @@ if __name__ == "__main__":
         BLOB_NAME = "json/2019-04-28.json"
 
         # storage_ob.list_blobs(bucket_name=BUCKET_NAME)
-        # json_data = storage_ob.read_blob_content(bucket_name=BUCKET_NAME, blob_name=BLOB_NAME)
 
-        # parsed_data = []
-        # for line in json_data.strip().splitlines():
-        #     if line:
-        #         try:
-        #             parsed_data.append(json.loads(line))
-        #         except json.JSONDecodeError as e:
-        #             # Continue to the next line to process the rest of the file
-        #             pass
-        # # Return the list of parsed JSON objects.
-        # print(type(json_data))
-        # print(parsed_data)
+        # Records are parsed as the blob streams in; malformed lines are counted in `stats`.
+        # stats = {}
+        # for batch in storage_ob.stream_ndjson(BUCKET_NAME, BLOB_NAME, batch_size=1000, stats=stats):
+        #     print(len(batch))
+        # print(stats)
+
+        # Records can be written back the same way, streamed and gzip-compressed without a temp file.
+        # result = storage_ob.write_ndjson(BUCKET_NAME, "json/2019-04-28.json.gz", records, compression="gzip")
+        # print(result["status"], result["records"], result["bytes"])
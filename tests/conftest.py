@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from benchmarks.fake_gcs import FakeGCSServer
+from google_cloud_components.cloud_storage import GCPStorage
+from utils import logger
+
+
+@pytest.fixture(scope="session", autouse=True)
+def log_dir(tmp_path_factory):
+    """Sends the log files of every logger the tests create to a temporary directory, not ``log/``."""
+    path = str(tmp_path_factory.mktemp("log"))
+    previous = logger.LOG_DIR
+    os.environ["GCC_LOG_DIR"] = logger.LOG_DIR = path
+    yield path
+    logger.LOG_DIR = previous
+
+
+@pytest.fixture
+def server():
+    """A fake GCS server with one empty bucket, ``test-bucket``."""
+    with FakeGCSServer() as fake:
+        fake.create_bucket("test-bucket")
+        yield fake
+
+
+@pytest.fixture
+def credentials(server, tmp_path):
+    """Path of a service-account key whose token endpoint is the fake server."""
+    return server.write_credentials(os.path.join(tmp_path, "credentials.json"))
+
+
+@pytest.fixture
+def storage(server, credentials, tmp_path):
+    """A quiet GCPStorage with its own client, talking to the fake server."""
+    return GCPStorage(
+        credentials,
+        api_endpoint=server.endpoint,
+        checkpoint_dir=os.path.join(tmp_path, "checkpoints"),
+        shared_client=False,
+        quiet=True,
+    )
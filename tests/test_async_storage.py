@@ -0,0 +1,114 @@
+import asyncio
+import os
+
+import pytest
+from google.api_core import exceptions
+
+from google_cloud_components.async_storage import AsyncGCPStorage
+
+
+@pytest.fixture
+def async_storage(server, credentials):
+    """Builds a quiet AsyncGCPStorage talking to the fake server; open it with ``async with``."""
+    def build(**kwargs):
+        return AsyncGCPStorage(credentials, api_endpoint=server.endpoint, quiet=True, **kwargs)
+    return build
+
+
+def test_upload_download_list_and_delete(server, async_storage, tmp_path):
+    source = tmp_path / "reference.csv"
+    source.write_bytes(b"a,b\n1,2\n")
+
+    async def scenario():
+        async with async_storage() as gcs:
+            uploaded = await gcs.upload_blob("test-bucket", "json/a.json", b'{"id": 1}', "application/json")
+            from_file = await gcs.upload_blob("test-bucket", "csv/reference.csv", str(source))
+            data = await gcs.download_blob("test-bucket", "csv/reference.csv")
+            part = await gcs.download_blob("test-bucket", "csv/reference.csv", start=4, end=6)
+            details = await gcs.get_blob_metadata("test-bucket", "json/a.json")
+            listed = [entry async for entry in gcs.iter_blobs("test-bucket", delimiter="/")]
+            await gcs.delete_blob("test-bucket", "json/a.json")
+            remaining = [entry["name"] async for entry in gcs.iter_blobs("test-bucket", page_size=1)]
+        return uploaded, from_file, data, part, details, listed, remaining
+
+    uploaded, from_file, data, part, details, listed, remaining = asyncio.run(scenario())
+
+    assert (uploaded["name"], uploaded["size"]) == ("json/a.json", "9 bytes")
+    assert from_file["content_type"] == "application/octet-stream"
+    assert data == b"a,b\n1,2\n"
+    assert part == b"1,2"
+    assert details == uploaded
+    assert sorted(entry["name"] for entry in listed) == ["csv/", "json/"]
+    assert {entry["kind"] for entry in listed} == {"prefix"}
+    assert remaining == ["csv/reference.csv"]
+    assert server.sorted_names("test-bucket") == ["csv/reference.csv"]
+
+
+def test_requests_in_flight_are_bounded(server, async_storage):
+    server.put_objects("test-bucket", [f"part-{i:02d}" for i in range(12)], data=b"x" * 1024)
+    server.latency = 0.05
+
+    async def scenario():
+        async with async_storage(max_concurrency=3) as gcs:
+            # Fetch the token first so the parallel downloads are the only requests measured.
+            await gcs.get_blob_metadata("test-bucket", "part-00")
+            server.max_in_flight = 0
+            return await asyncio.gather(*(gcs.download_blob("test-bucket", f"part-{i:02d}") for i in range(12)))
+
+    results = asyncio.run(scenario())
+
+    assert results == [b"x" * 1024] * 12
+    assert 1 < server.max_in_flight <= 3
+
+
+def test_cancelled_requests_release_their_slot(server, async_storage):
+    server.put_object("test-bucket", "slow.bin", os.urandom(1024))
+
+    async def scenario():
+        async with async_storage(max_concurrency=1) as gcs:
+            await gcs.get_blob_metadata("test-bucket", "slow.bin")
+            server.latency = 0.5
+            task = asyncio.create_task(gcs.download_blob("test-bucket", "slow.bin"))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            server.latency = 0.0
+            # With one slot, this only completes if the cancelled request gave it back.
+            return await asyncio.wait_for(gcs.get_blob_metadata("test-bucket", "slow.bin"), timeout=5)
+
+    assert asyncio.run(scenario())["name"] == "slow.bin"
+
+
+@pytest.mark.parametrize("method, arguments", [
+    ("get_blob_metadata", ("test-bucket", "missing.bin")),
+    ("download_blob", ("test-bucket", "missing.bin")),
+    ("delete_blob", ("test-bucket", "missing.bin")),
+    ("upload_blob", ("missing-bucket", "a.bin", b"data")),
+])
+def test_missing_objects_raise_not_found(async_storage, method, arguments):
+    async def scenario():
+        async with async_storage() as gcs:
+            await getattr(gcs, method)(*arguments)
+
+    with pytest.raises(exceptions.NotFound):
+        asyncio.run(scenario())
+
+
+def test_listing_a_missing_bucket_raises_not_found(async_storage):
+    async def scenario():
+        async with async_storage() as gcs:
+            return [entry async for entry in gcs.iter_blobs("missing-bucket")]
+
+    with pytest.raises(exceptions.NotFound):
+        asyncio.run(scenario())
+
+
+def test_missing_credentials_raise_unauthenticated(server, tmp_path):
+    async def scenario():
+        async with AsyncGCPStorage(os.path.join(tmp_path, "missing.json"), api_endpoint=server.endpoint,
+                                   quiet=True) as gcs:
+            await gcs.download_blob("test-bucket", "reference.csv")
+
+    with pytest.raises(exceptions.Unauthenticated):
+        asyncio.run(scenario())
@@ -0,0 +1,125 @@
+import datetime
+import threading
+import time
+
+from google_cloud_components.auth import TokenRefresher, _utcnow
+
+
+class FakeCredentials:
+    """Minimal stand-in for google.auth credentials with a slow, counted token endpoint."""
+
+    def __init__(self, lifetime=3600.0, delay=0.0):
+        self.lifetime = lifetime
+        self.delay = delay
+        self.token = None
+        self.expiry = None
+        self.calls = 0
+        self.valid_when_refreshed = []
+        self.release = threading.Event()
+        self.release.set()
+        self._lock = threading.Lock()
+
+    @property
+    def valid(self):
+        return self.token is not None and self.expiry > _utcnow()
+
+    def refresh(self, request):
+        with self._lock:
+            self.calls += 1
+            calls = self.calls
+        self.valid_when_refreshed.append(self.valid)
+        time.sleep(self.delay)
+        self.release.wait()
+        self.token = f"token-{calls}"
+        self.expiry = _utcnow() + datetime.timedelta(seconds=self.lifetime)
+
+    def ensure_token(self):
+        """What an authorized transport does before each request."""
+        if not self.valid:
+            self.refresh(None)
+        return self.token
+
+
+def test_concurrent_refreshes_are_coalesced():
+    credentials = FakeCredentials(delay=0.2)
+    refresher = TokenRefresher(credentials, background=False)
+    barrier = threading.Barrier(16)
+    tokens = []
+
+    def worker():
+        barrier.wait()
+        tokens.append(credentials.ensure_token())
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert credentials.calls == 1
+    assert tokens == ["token-1"] * 16
+    stats = refresher.stats()
+    assert stats["refreshes"] == 1
+    assert stats["coalesced"] == 15
+    assert stats["last_refresh_seconds"] >= 0.2
+
+
+def test_refresh_after_expiry_is_not_coalesced():
+    credentials = FakeCredentials()
+    refresher = TokenRefresher(credentials, background=False)
+    credentials.ensure_token()
+    credentials.expiry = _utcnow() - datetime.timedelta(seconds=1)
+
+    assert credentials.ensure_token() == "token-2"
+    assert refresher.stats()["refreshes"] == 2
+
+
+def test_token_near_expiry_is_refreshed_in_background_without_blocking_callers():
+    credentials = FakeCredentials(lifetime=3600.0)
+    credentials.token = "token-0"
+    credentials.expiry = _utcnow() + datetime.timedelta(seconds=1.0)
+    credentials.release.clear()
+    refresher = TokenRefresher(credentials, background=True, margin=0.8)
+    try:
+        deadline = time.monotonic() + 5
+        while credentials.calls == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # The background refresh is in flight (held by ``release``), before the old token expired.
+        assert credentials.calls == 1
+        assert credentials.valid_when_refreshed == [True]
+
+        started = time.perf_counter()
+        assert credentials.ensure_token() == "token-0"
+        assert time.perf_counter() - started < 0.05
+
+        credentials.release.set()
+        while credentials.token == "token-0" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert credentials.ensure_token() == "token-1"
+        stats = refresher.stats()
+        assert stats["refreshes"] == 1
+        assert stats["background_refreshes"] == 1
+        assert stats["expires_in"] > 3000
+    finally:
+        credentials.release.set()
+        refresher.stop()
+
+
+def test_storage_threads_share_one_token_fetch(server, storage):
+    server.token_delay = 0.2
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(storage.get_bucket_metadata("test-bucket"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(result["name"] == "test-bucket" for result in results)
+    assert server.request_counts["POST token"] == 1
+    assert storage.get_token_stats()["refreshes"] == 1
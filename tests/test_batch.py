@@ -0,0 +1,96 @@
+from google_cloud_components.results import StorageError
+
+
+def _names(count):
+    return [f"logs/{index:04d}.json" for index in range(count)]
+
+
+def test_delete_blobs_splits_into_envelopes_of_at_most_100(server, storage):
+    server.put_objects("test-bucket", _names(250), b"{}")
+
+    report = storage.delete_blobs("test-bucket", _names(250), max_workers=1)
+
+    assert server.batch_envelopes == [100, 100, 50]
+    assert report["summary"]["total"] == 250
+    assert report["summary"]["succeeded"] == 250
+    assert {result["status"] for result in report["results"]} == {"deleted"}
+    assert server.buckets["test-bucket"]["objects"] == {}
+
+
+def test_delete_blobs_batch_size_is_capped_at_100(server, storage):
+    server.put_objects("test-bucket", _names(150), b"{}")
+
+    storage.delete_blobs("test-bucket", _names(150), batch_size=500, max_workers=2)
+
+    assert sorted(server.batch_envelopes) == [50, 100]
+
+
+def test_delete_blobs_reports_each_sub_request(server, storage):
+    names = _names(5)
+    server.put_objects("test-bucket", names[:4], b"{}")
+    # The third sub-request of the batch fails; the fifth name does not exist.
+    server.inject_failure("DELETE subrequest", status=503, skip=2)
+
+    report = storage.delete_blobs("test-bucket", names)
+
+    statuses = {result["name"]: result["status"] for result in report["results"]}
+    assert statuses == {
+        names[0]: "deleted",
+        names[1]: "deleted",
+        names[2]: "failed",
+        names[3]: "deleted",
+        names[4]: "not_found",
+    }
+    failed = next(result for result in report["results"] if result["status"] == "failed")
+    assert failed["error"] == "injected failure"
+    assert report["summary"]["failed"] == 1
+    assert report["summary"]["succeeded"] == 4
+    assert list(server.buckets["test-bucket"]["objects"]) == [names[2]]
+
+
+def test_delete_blobs_in_a_missing_bucket_fails_the_call(server, storage):
+    result = storage.delete_blobs("missing-bucket", _names(3))
+
+    assert isinstance(result, StorageError)
+    assert result.kind == "not_found"
+    assert result.bucket == "missing-bucket"
+
+
+def test_delete_blobs_by_prefix(server, storage):
+    server.put_objects("test-bucket", _names(3) + ["other/keep.json"], b"{}")
+
+    report = storage.delete_blobs("test-bucket", "logs/")
+
+    assert report["summary"]["succeeded"] == 3
+    assert list(server.buckets["test-bucket"]["objects"]) == ["other/keep.json"]
+
+
+def test_delete_blobs_dry_run_sends_nothing(server, storage):
+    server.put_objects("test-bucket", _names(3), b"{}")
+    progress = []
+
+    report = storage.delete_blobs("test-bucket", "logs/", dry_run=True, progress=lambda *args: progress.append(args))
+
+    assert server.batch_envelopes == []
+    assert [result["status"] for result in report["results"]] == ["dry_run"] * 3
+    assert progress == [(3, 0)]
+    assert len(server.buckets["test-bucket"]["objects"]) == 3
+
+
+def test_get_blobs_metadata(server, storage):
+    names = _names(120)
+    server.put_objects("test-bucket", names[:-1], b"{}")
+    progress = []
+
+    report = storage.get_blobs_metadata(
+        "test-bucket", names, max_workers=1, progress=lambda *args: progress.append(args)
+    )
+
+    assert server.batch_envelopes == [100, 20]
+    assert progress == [(100, 0), (120, 1)]
+    results = {result["name"]: result for result in report["results"]}
+    assert results[names[0]]["status"] == "ok"
+    assert results[names[0]]["metadata"]["size"] == "2 bytes"
+    assert results[names[-1]]["status"] == "failed"
+    assert results[names[-1]]["metadata"] is None
+    assert report["summary"]["failed"] == 1
@@ -0,0 +1,251 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from google_cloud_components.cache import BlobDiskCache, MetadataCache
+
+
+class Clock:
+    """A manual monotonic clock for TTL tests."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cached(storage, clock):
+    """The ``storage`` fixture with a 10 second metadata cache driven by ``clock``."""
+    storage.metadata_cache = MetadataCache(ttl=10.0, clock=clock)
+    return storage
+
+
+@pytest.fixture
+def disk_cached(storage, tmp_path):
+    """The ``storage`` fixture with a disk blob cache under ``tmp_path``."""
+    storage.blob_cache = BlobDiskCache(os.path.join(tmp_path, "blob-cache"))
+    return storage
+
+
+def _gets(server):
+    return server.request_counts.get("GET storage", 0)
+
+
+def _commit(cache, name, generation, data):
+    """Writes ``data`` to a temporary file and commits it as ``name``'s ``generation``."""
+    temp_path = cache.temp_path()
+    with open(temp_path, "wb") as handle:
+        handle.write(data)
+    return cache.commit(temp_path, "bucket", name, generation)
+
+
+def test_entries_go_stale_after_ttl_until_touched(clock):
+    cache = MetadataCache(ttl=10.0, clock=clock)
+    cache.set(("blob", "b", "a"), {"generation": 1})
+
+    assert cache.get(("blob", "b", "a")) == ({"generation": 1}, True)
+    clock.advance(10.0)
+    assert cache.get(("blob", "b", "a")) == ({"generation": 1}, False)
+    cache.touch(("blob", "b", "a"))
+    assert cache.get(("blob", "b", "a")) == ({"generation": 1}, True)
+    assert cache.get(("blob", "b", "missing")) == (None, False)
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["stale"], stats["misses"], stats["revalidated"]) == (2, 1, 1, 1)
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = MetadataCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") == (None, False)
+    assert cache.get("a")[0] == 1
+    assert cache.get("c")[0] == 3
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 2
+
+
+def test_invalidate_prefix_only_drops_that_bucket():
+    cache = MetadataCache()
+    cache.set(("bucket", "one"), {})
+    cache.set(("blob", "one", "a"), {})
+    cache.set(("blob", "one", "b"), {})
+    cache.set(("blob", "two", "a"), {})
+
+    cache.invalidate_prefix(("blob", "one"))
+
+    assert cache.stats()["invalidations"] == 2
+    assert cache.get(("blob", "two", "a"))[0] == {}
+    assert cache.get(("bucket", "one"))[0] == {}
+
+
+def test_concurrent_fills_stay_within_bounds():
+    cache = MetadataCache(max_entries=100)
+    lookups_per_thread = 2000
+
+    def fill(worker):
+        for i in range(lookups_per_thread):
+            key = ("blob", "bucket", f"{worker}-{i % 150}")
+            if cache.get(key)[0] is None:
+                cache.set(key, {"generation": i})
+
+    threads = [threading.Thread(target=fill, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats["size"] == 100
+    assert stats["hits"] + stats["misses"] + stats["stale"] == 8 * lookups_per_thread
+    assert stats["evictions"] == stats["misses"] - 100
+
+
+def test_blob_metadata_is_served_from_cache_then_revalidated(server, cached, clock):
+    server.put_object("test-bucket", "reference.csv", b"a,b\n")
+    first = cached.get_blob_metadata("test-bucket", "reference.csv")
+    requests = _gets(server)
+
+    assert cached.get_blob_metadata("test-bucket", "reference.csv") == first
+    assert _gets(server) == requests
+
+    clock.advance(10.0)
+    assert cached.get_blob_metadata("test-bucket", "reference.csv") == first
+    assert _gets(server) == requests + 1
+    assert cached.get_cache_stats()["revalidated"] == 1
+
+
+def test_new_metadata_on_the_same_generation_replaces_the_entry(server, cached, clock):
+    stored = server.put_object("test-bucket", "reference.csv", b"a,b\n")
+    cached.get_blob_metadata("test-bucket", "reference.csv")
+    stored.metadata["cacheControl"] = "no-cache"
+    stored.metageneration += 1
+
+    clock.advance(10.0)
+    details = cached.get_blob_metadata("test-bucket", "reference.csv")
+
+    assert details["metageneration"] == 2
+    assert details["cache_control"] == "no-cache"
+    assert cached.get_cache_stats()["revalidated"] == 0
+
+
+def test_new_generation_is_refetched_after_ttl(server, cached, clock):
+    server.put_object("test-bucket", "reference.csv", b"a,b\n")
+    old = cached.get_blob_metadata("test-bucket", "reference.csv")
+    new = server.put_object("test-bucket", "reference.csv", b"a,b\n1,2\n")
+
+    assert cached.get_blob_metadata("test-bucket", "reference.csv")["generation"] == old["generation"]
+    clock.advance(10.0)
+    requests = _gets(server)
+    details = cached.get_blob_metadata("test-bucket", "reference.csv")
+
+    assert details["generation"] == new.generation
+    assert details["size"] == "8 bytes"
+    # The conditional GET answers 412, then a plain GET fetches the new generation.
+    assert _gets(server) == requests + 2
+
+
+def test_writes_and_deletes_invalidate_without_waiting_for_ttl(server, cached, tmp_path):
+    source = tmp_path / "reference.csv"
+    source.write_bytes(b"a,b\n1,2\n")
+    server.put_object("test-bucket", "reference.csv", b"a,b\n")
+    old = cached.get_blob_metadata("test-bucket", "reference.csv")
+
+    assert cached.create_blob("test-bucket", str(source), "reference.csv")
+    assert cached.get_blob_metadata("test-bucket", "reference.csv")["generation"] != old["generation"]
+
+    cached.delete_blob("test-bucket", "reference.csv")
+    assert cached.get_blob_metadata("test-bucket", "reference.csv").kind == "not_found"
+
+
+def test_bucket_metadata_is_revalidated_by_metageneration(server, cached, clock):
+    first = cached.get_bucket_metadata("test-bucket")
+    clock.advance(10.0)
+
+    assert cached.get_bucket_metadata("test-bucket") == first
+    assert cached.get_cache_stats()["revalidated"] == 1
+
+
+def test_disk_cache_serves_only_the_committed_generation(tmp_path):
+    cache = BlobDiskCache(str(tmp_path))
+    old = _commit(cache, "a.bin", 1, b"old")
+    new = _commit(cache, "a.bin", 2, b"new")
+
+    assert not os.path.exists(old)
+    assert cache.get("bucket", "a.bin", 1) is None
+    assert cache.get("bucket", "a.bin", 2) == new
+    with open(new, "rb") as handle:
+        assert handle.read() == b"new"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["bytes_saved"], stats["size_bytes"]) == (1, 1, 3, 3)
+
+
+def test_disk_cache_evicts_least_recently_used_past_max_bytes(tmp_path):
+    cache = BlobDiskCache(str(tmp_path), max_bytes=250)
+    first = _commit(cache, "first.bin", 1, b"1" * 100)
+    second = _commit(cache, "second.bin", 1, b"2" * 100)
+    os.utime(first, (1000, 1000))
+    os.utime(second, (2000, 2000))
+    cache.get("bucket", "first.bin", 1)
+
+    third = _commit(cache, "third.bin", 1, b"3" * 100)
+
+    assert os.path.exists(first) and os.path.exists(third)
+    assert not os.path.exists(second)
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size_bytes"] == 200
+    assert BlobDiskCache(str(tmp_path), max_bytes=250).stats()["size_bytes"] == 200
+
+
+def test_concurrent_commits_of_one_generation_leave_a_complete_file(tmp_path):
+    data = os.urandom(256 * 1024)
+    caches = [BlobDiskCache(str(tmp_path)) for _ in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        paths = set(pool.map(lambda cache: _commit(cache, "a.bin", 1, data), caches))
+
+    assert len(paths) == 1
+    with open(paths.pop(), "rb") as handle:
+        assert handle.read() == data
+    assert os.listdir(os.path.join(tmp_path, "tmp")) == []
+
+
+def test_cached_blob_is_downloaded_once_per_generation(server, disk_cached):
+    server.put_object("test-bucket", "reference.csv", b"a,b\n")
+
+    assert disk_cached.read_blob("test-bucket", "reference.csv") == b"a,b\n"
+    assert disk_cached.read_blob("test-bucket", "reference.csv") == b"a,b\n"
+    assert server.request_counts["GET download"] == 1
+
+    server.put_object("test-bucket", "reference.csv", b"a,b\n1,2\n")
+    assert disk_cached.read_blob("test-bucket", "reference.csv") == b"a,b\n1,2\n"
+    assert server.request_counts["GET download"] == 2
+    assert disk_cached.get_blob_cache_stats()["hits"] == 1
+
+
+def test_concurrent_fills_of_one_blob_return_the_same_complete_file(server, disk_cached):
+    data = os.urandom(512 * 1024)
+    server.put_object("test-bucket", "large.bin", data)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        paths = set(pool.map(lambda _: disk_cached.get_cached_blob_path("test-bucket", "large.bin"), range(8)))
+
+    assert len(paths) == 1
+    with open(paths.pop(), "rb") as handle:
+        assert handle.read() == data
+    assert os.listdir(os.path.join(disk_cached.blob_cache.root, "tmp")) == []
@@ -0,0 +1,59 @@
+import os
+
+import pytest
+
+from google_cloud_components.client_registry import default_registry
+from google_cloud_components.cloud_storage import GCPStorage
+
+
+@pytest.fixture
+def registry():
+    """The process-wide registry, emptied before and after the test."""
+    default_registry.clear()
+    yield default_registry
+    default_registry.clear()
+
+
+def _shared(credentials, server):
+    return GCPStorage(credentials, api_endpoint=server.endpoint, quiet=True)
+
+
+def _pool(client):
+    """Returns the only connection pool of a client's session."""
+    pools = client._http.adapters["http://"].poolmanager.pools
+    assert len(pools) == 1
+    (key,) = pools.keys()
+    return pools.get(key)
+
+
+def test_same_credentials_share_one_client(registry, server, credentials):
+    first, second = _shared(credentials, server), _shared(credentials, server)
+
+    assert first.storage_client is second.storage_client
+    assert registry.stats()["clients"] == 1
+
+
+def test_reloaded_credentials_replace_the_client(registry, server, credentials):
+    server.put_object("test-bucket", "reference.csv", b"a,b\n")
+    before = _shared(credentials, server)
+    old_client = before.storage_client
+    assert before.read_blob("test-bucket", "reference.csv") == b"a,b\n"
+    old_pool = _pool(old_client)
+    requests = old_pool.num_requests
+    stat = os.stat(credentials)
+
+    for step in range(1, 4):
+        # A new mtime makes the key file reload, as after a key rotation.
+        os.utime(credentials, ns=(stat.st_atime_ns, stat.st_mtime_ns + step * 1_000_000_000))
+        after = _shared(credentials, server)
+        assert after.storage_client is not old_client
+        assert after.read_blob("test-bucket", "reference.csv") == b"a,b\n"
+
+    stats = registry.stats()
+    assert (stats["clients"], stats["replaced"]) == (1, 3)
+    # The instance created before the reloads keeps using its client and its pooled connection.
+    assert before.storage_client is old_client
+    assert before.read_blob("test-bucket", "reference.csv") == b"a,b\n"
+    assert _pool(old_client) is old_pool
+    assert old_pool.num_requests > requests
+    assert old_pool.num_connections == 1
@@ -0,0 +1,66 @@
+import os
+
+import pytest
+
+from google_cloud_components.transfer import file_crc32c
+
+PARTS = 40
+PART_SIZE = 1000
+
+
+def _objects(server):
+    return server.buckets["test-bucket"]["objects"]
+
+
+@pytest.fixture
+def source(tmp_path):
+    """A local file of ``PARTS`` parts of ``PART_SIZE`` random bytes."""
+    path = tmp_path / "large.bin"
+    path.write_bytes(os.urandom(PARTS * PART_SIZE))
+    return path
+
+
+def test_more_than_32_parts_compose_in_a_tree(server, storage, source):
+    report = storage.upload_composite("test-bucket", str(source), "large.bin", parts=PARTS)
+
+    assert report["status"] == "uploaded"
+    assert report["parts"] == PARTS
+    assert report["component_count"] == PARTS
+    # One intermediate level (32 + 8 parts) and the final compose of its two objects.
+    assert server.request_counts["POST storage"] == 3
+    stored = _objects(server)["large.bin"]
+    assert stored.data == source.read_bytes()
+    assert stored.crc32c == file_crc32c(str(source))
+    assert list(_objects(server)) == ["large.bin"]
+
+
+def test_failed_compose_deletes_every_temporary_object(server, storage, source):
+    # The second intermediate compose fails after the first has created its object.
+    server.inject_failure("POST storage", status=403, count=1, skip=1)
+
+    report = storage.upload_composite("test-bucket", str(source), "large.bin", parts=PARTS)
+
+    assert report["status"] == "failed"
+    assert report["error_type"] == "Forbidden"
+    assert _objects(server) == {}
+
+
+def test_failed_part_upload_deletes_the_parts_already_uploaded(server, storage, source):
+    server.inject_failure("POST upload", status=403, count=1, skip=PARTS // 2)
+
+    report = storage.upload_composite("test-bucket", str(source), "large.bin", parts=PARTS)
+
+    assert report["status"] == "failed"
+    assert server.request_counts["POST upload"] > PARTS // 2
+    assert _objects(server) == {}
+
+
+def test_create_blob_switches_to_composite_above_the_threshold(server, storage, source):
+    storage.composite_upload_threshold = PART_SIZE
+    storage.composite_upload_parts = 4
+
+    result = storage.create_blob("test-bucket", str(source), "large.bin")
+
+    assert result
+    assert _objects(server)["large.bin"].component_count == 4
+    assert list(_objects(server)) == ["large.bin"]
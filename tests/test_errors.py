@@ -0,0 +1,170 @@
+import os
+
+import pytest
+
+from google_cloud_components.cache import BlobDiskCache
+from google_cloud_components.cloud_storage import GCPStorage
+from google_cloud_components.inventory import BucketInventory
+from google_cloud_components.results import StorageError, StorageResult
+
+# (method, positional arguments) for every public call that reports failures as values.
+REPORTING_CALLS = [
+    ("get_bucket_metadata", ("test-bucket",)),
+    ("get_blob_metadata", ("test-bucket", "reference.csv")),
+    ("read_blob", ("test-bucket", "reference.csv")),
+    ("read_blob_content", ("test-bucket", "reference.csv")),
+    ("get_cached_blob_path", ("test-bucket", "reference.csv")),
+    ("create_bucket", ("test-bucket",)),
+    ("list_buckets", ()),
+    ("delete_bucket", ("test-bucket",)),
+    ("create_blob", ("test-bucket", "{source}", "reference.csv")),
+    ("list_blobs", ("test-bucket",)),
+    ("delete_blob", ("test-bucket", "reference.csv")),
+    ("upload_composite", ("test-bucket", "{source}", "reference.csv")),
+    ("upload_resumable", ("test-bucket", "{source}", "reference.csv")),
+    ("upload_stream", ("test-bucket", "reference.csv", b"data")),
+    ("write_ndjson", ("test-bucket", "records.ndjson", [{"id": 1}])),
+    ("upload_many", ("test-bucket", [("{source}", "reference.csv")])),
+    ("upload_directory", ("test-bucket", "{directory}")),
+    ("sync", ("{directory}", "test-bucket")),
+    ("download_blob", ("test-bucket", "reference.csv", "{destination}")),
+    ("download_resumable", ("test-bucket", "reference.csv", "{destination}")),
+    ("delete_blobs", ("test-bucket", "json/")),
+    ("copy_prefix", ("test-bucket", "json/", "other-bucket")),
+    ("move_prefix", ("test-bucket", "json/", "other-bucket")),
+    ("get_blobs_metadata", ("test-bucket", ["reference.csv"])),
+]
+
+
+@pytest.fixture
+def unauthenticated(tmp_path):
+    """A GCPStorage whose credentials file does not exist."""
+    return GCPStorage(
+        os.path.join(tmp_path, "missing.json"),
+        blob_cache=BlobDiskCache(os.path.join(tmp_path, "blob-cache")),
+        checkpoint_dir=os.path.join(tmp_path, "checkpoints"),
+        quiet=True,
+    )
+
+
+def _arguments(arguments, tmp_path):
+    """Fills the file placeholders of a call's arguments with real paths."""
+    directory = tmp_path / "local"
+    directory.mkdir(exist_ok=True)
+    source = directory / "reference.csv"
+    source.write_bytes(b"a,b\n1,2\n")
+    paths = {"source": str(source), "directory": str(directory), "destination": str(tmp_path / "out.csv")}
+
+    def fill(value):
+        if isinstance(value, str):
+            return value.format(**paths)
+        if isinstance(value, list):
+            return [tuple(fill(item) for item in entry) if isinstance(entry, tuple) else fill(entry) for entry in value]
+        return value
+
+    return [fill(value) for value in arguments]
+
+
+@pytest.mark.parametrize("method, arguments", REPORTING_CALLS, ids=[call[0] for call in REPORTING_CALLS])
+def test_every_call_reports_auth_failure(unauthenticated, tmp_path, method, arguments):
+    result = getattr(unauthenticated, method)(*_arguments(arguments, tmp_path))
+
+    assert not result
+    error = result.error if isinstance(result, StorageResult) else result
+    assert isinstance(error, StorageError)
+    assert error.kind == "unauthenticated"
+
+
+@pytest.mark.parametrize("method", ["read_blob", "get_cached_blob_path"])
+def test_blob_reads_report_auth_failure(unauthenticated, method):
+    result = getattr(unauthenticated, method)("test-bucket", "reference.csv")
+
+    assert isinstance(result, StorageError)
+    assert (result.operation, result.bucket, result.blob) == (method, "test-bucket", "reference.csv")
+
+
+@pytest.mark.parametrize("method, arguments", [
+    ("iter_blobs", ("test-bucket",)),
+    ("stream_ndjson", ("test-bucket", "records.ndjson")),
+    ("open_blob_writer", ("test-bucket", "records.ndjson")),
+])
+def test_streams_raise_auth_failure(unauthenticated, method, arguments):
+    with pytest.raises(RuntimeError, match="Authentication failed"):
+        result = getattr(unauthenticated, method)(*arguments)
+        next(iter(result))
+
+
+def test_inventory_build_raises_auth_failure(unauthenticated, tmp_path):
+    path = os.path.join(tmp_path, "inventory.bin")
+
+    with pytest.raises(RuntimeError):
+        BucketInventory.build(unauthenticated, "test-bucket", path)
+    assert not os.path.exists(path)
+
+
+@pytest.mark.parametrize("method, arguments", [
+    ("read_blob", ("missing-bucket", "reference.csv")),
+    ("delete_blobs", ("missing-bucket", "json/")),
+    ("copy_prefix", ("missing-bucket", "json/", "test-bucket")),
+    ("move_prefix", ("missing-bucket", "json/", "test-bucket")),
+])
+def test_missing_bucket_is_reported_not_raised(storage, method, arguments):
+    result = getattr(storage, method)(*arguments)
+
+    assert isinstance(result, StorageError)
+    assert result.kind == "not_found"
+    assert result.bucket == "missing-bucket"
+
+
+def test_sync_reports_missing_bucket(storage, tmp_path):
+    (tmp_path / "reference.csv").write_bytes(b"a,b\n")
+
+    result = storage.sync(str(tmp_path), "missing-bucket")
+
+    assert isinstance(result, StorageError)
+    assert result.kind == "not_found"
+
+
+def test_cached_read_of_missing_blob_is_reported(storage, tmp_path):
+    storage.blob_cache = BlobDiskCache(os.path.join(tmp_path, "blob-cache"))
+
+    result = storage.read_blob("test-bucket", "missing.csv")
+
+    assert isinstance(result, StorageError)
+    assert result.kind == "not_found"
+
+
+@pytest.mark.parametrize("method", ["copy_prefix", "move_prefix"])
+def test_rewrite_onto_itself_is_an_argument_error(storage, method):
+    result = getattr(storage, method)("test-bucket", "json/", "test-bucket")
+
+    assert isinstance(result, StorageError)
+    assert result.kind == "invalid_argument"
+
+
+def test_cache_lookup_without_cache_is_an_argument_error(storage):
+    result = storage.get_cached_blob_path("test-bucket", "reference.csv")
+
+    assert isinstance(result, StorageError)
+    assert result.kind == "invalid_argument"
+
+
+@pytest.mark.parametrize("threshold", [None, 1], ids=["simple", "resumable"])
+def test_create_blob_reports_missing_bucket_on_every_upload_path(storage, tmp_path, threshold):
+    source = tmp_path / "reference.csv"
+    source.write_bytes(b"a,b\n1,2\n")
+    storage.resumable_upload_threshold = threshold
+
+    result = storage.create_blob("missing-bucket", str(source), "reference.csv")
+
+    assert not result
+    assert result.error.kind == "not_found"
+    assert result.error.message == "Bucket 'missing-bucket' not found."
+
+
+def test_missing_blob_metadata_is_not_found(storage):
+    result = storage.get_blob_metadata("test-bucket", "missing.csv")
+
+    assert isinstance(result, StorageError)
+    assert (result.kind, result.status_code) == ("not_found", 404)
+    assert result.message == "The blob 'missing.csv' does not exist in bucket 'test-bucket'."
@@ -0,0 +1,155 @@
+import json
+import logging
+import os
+
+import pytest
+
+from google_cloud_components.inventory import BucketInventory
+
+
+class ShuffledListing:
+    """Stands in for GCPStorage, listing blobs in the order given rather than by name."""
+
+    def __init__(self, names):
+        self.names = names
+        self.logger = logging.getLogger(__name__)
+
+    def iter_blobs(self, bucket_name, prefix=None, page_size=None):
+        yield {"kind": "prefix", "name": "json/"}
+        for generation, name in enumerate(self.names, start=1):
+            yield {"kind": "blob", "name": name, "size": len(name), "updated": None, "generation": generation}
+
+
+def test_build_indexes_listing(server, storage, tmp_path):
+    server.put_objects("test-bucket", (f"json/{index:04d}.json" for index in range(250)), b"x" * 10)
+    server.put_object("test-bucket", "csv/reference.csv", b"a,b\n")
+
+    inventory = BucketInventory.build(storage, "test-bucket", os.path.join(tmp_path, "inventory.bin"), page_size=100)
+
+    assert len(inventory) == 251
+    assert inventory.du("json/") == {"objects": 250, "bytes": 2500}
+    assert inventory.start_offset == "json/0249.json"
+    assert inventory.get("csv/reference.csv")["size"] == 4
+
+
+def test_build_sorts_out_of_order_listing(tmp_path):
+    names = ["b/2", "a/1", "c/3", "a/0"]
+
+    inventory = BucketInventory.build(ShuffledListing(names), "test-bucket", os.path.join(tmp_path, "inventory.bin"))
+
+    assert [record["name"] for record in inventory.iter_records()] == sorted(names)
+    assert inventory.get("a/1")["generation"] == 2
+    assert inventory.du("a/") == {"objects": 2, "bytes": 6}
+    assert inventory.start_offset == "c/3"
+
+
+def test_build_of_empty_listing(tmp_path):
+    inventory = BucketInventory.build(ShuffledListing([]), "test-bucket", os.path.join(tmp_path, "inventory.bin"))
+
+    assert len(inventory) == 0
+    assert inventory.start_offset == ""
+
+
+@pytest.fixture
+def inventory(server, storage, tmp_path):
+    """An inventory of ``logs/`` holding three objects, built from the fake server."""
+    server.put_objects("test-bucket", [f"logs/2024-01-0{day}.json" for day in (1, 2, 3)], b"x" * 10)
+    with BucketInventory.build(storage, "test-bucket", str(tmp_path / "inventory.bin"), prefix="logs/") as built:
+        yield built
+
+
+def test_refresh_adds_new_names_only(server, storage, inventory):
+    server.put_objects("test-bucket", ["logs/2024-01-04.json", "logs/2024-01-05.json"], b"y" * 5)
+
+    result = inventory.refresh(storage)
+
+    assert (result["added"], result["updated"]) == (2, 0)
+    assert len(inventory) == 5
+    assert inventory.start_offset == "logs/2024-01-05.json"
+    assert inventory.du("logs/") == {"objects": 5, "bytes": 40}
+
+
+def test_refresh_without_changes_updates_nothing(storage, inventory):
+    result = inventory.refresh(storage)
+
+    # The last indexed name is listed again (start_offset is inclusive) but is unchanged.
+    assert result["listed"] == 1
+    assert (result["added"], result["updated"]) == (0, 0)
+    assert len(inventory) == 3
+
+
+def test_refresh_picks_up_a_rewritten_boundary_object(server, storage, inventory):
+    server.put_object("test-bucket", "logs/2024-01-03.json", b"z" * 20)
+
+    result = inventory.refresh(storage)
+
+    assert (result["added"], result["updated"]) == (0, 1)
+    assert inventory.get("logs/2024-01-03.json")["size"] == 20
+
+
+def test_refresh_persists_across_reopen(server, storage, inventory):
+    server.put_object("test-bucket", "logs/2024-01-04.json", b"y")
+    inventory.refresh(storage)
+
+    with BucketInventory(inventory.path) as reopened:
+        assert len(reopened) == 4
+        assert reopened.start_offset == "logs/2024-01-04.json"
+
+
+def _event(event_type, name, generation, size=1, bucket="test-bucket"):
+    return {"eventType": event_type, "bucket": bucket, "name": name, "generation": str(generation), "size": str(size)}
+
+
+def test_apply_changes(inventory):
+    existing = inventory.get("logs/2024-01-01.json")["generation"]
+    events = [
+        _event("OBJECT_FINALIZE", "logs/2024-01-09.json", 5, size=7),
+        _event("OBJECT_DELETE", "logs/2024-01-02.json", inventory.get("logs/2024-01-02.json")["generation"]),
+        _event("OBJECT_METADATA_UPDATE", "logs/2024-01-01.json", existing, size=3),
+        # Older than what is indexed, in another bucket, and outside the prefix: all ignored.
+        _event("OBJECT_FINALIZE", "logs/2024-01-03.json", 1, size=99),
+        _event("OBJECT_FINALIZE", "logs/2024-01-07.json", 5, bucket="other-bucket"),
+        _event("OBJECT_FINALIZE", "csv/reference.csv", 5),
+    ]
+
+    result = inventory.apply_changes(events)
+
+    assert result == {"added": 1, "updated": 1, "removed": 1, "ignored": 3, "count": 3}
+    assert [record["name"] for record in inventory.iter_records()] == [
+        "logs/2024-01-01.json", "logs/2024-01-03.json", "logs/2024-01-09.json"
+    ]
+    assert inventory.get("logs/2024-01-01.json")["size"] == 3
+    assert inventory.get("logs/2024-01-03.json")["size"] == 10
+
+
+def test_apply_changes_accepts_pubsub_messages_in_any_order(inventory):
+    message = {
+        "attributes": {"eventType": "OBJECT_FINALIZE", "bucketId": "test-bucket",
+                       "objectId": "logs/2024-01-08.json", "objectGeneration": "7"},
+        "data": json.dumps({"name": "logs/2024-01-08.json", "bucket": "test-bucket", "size": "4"}),
+    }
+    deleted = _event("OBJECT_DELETE", "logs/2024-01-08.json", 7)
+
+    # The deletion arrives before the creation it follows; at the same generation it still wins.
+    result = inventory.apply_changes([deleted, message])
+
+    assert inventory.get("logs/2024-01-08.json") is None
+    assert result["added"] == 0
+
+
+def test_ls_groups_children_by_delimiter(tmp_path):
+    names = ["a.txt", "json/2024/01.json", "json/2024/02.json", "json/2025/01.json", "json/top.json", "z/last"]
+
+    inventory = BucketInventory.build(ShuffledListing(names), "test-bucket", str(tmp_path / "inventory.bin"))
+
+    root = inventory.ls()
+    assert [(entry["kind"], entry["name"]) for entry in root] == [
+        ("blob", "a.txt"), ("prefix", "json/"), ("prefix", "z/")
+    ]
+    assert root[1]["objects"] == 4
+    assert root[1]["bytes"] == sum(len(name) for name in names[1:5])
+    children = inventory.ls("json/")
+    assert [(entry["kind"], entry["name"], entry.get("objects")) for entry in children] == [
+        ("prefix", "json/2024/", 2), ("prefix", "json/2025/", 1), ("blob", "json/top.json", None)
+    ]
+    assert inventory.ls("missing/") == []
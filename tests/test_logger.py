@@ -0,0 +1,133 @@
+import json
+import logging
+import os
+import queue
+import subprocess
+import sys
+import threading
+import uuid
+
+import pytest
+
+from utils import logger as logger_module
+from utils.logger import BoundedQueueHandler, Logger
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _record(message, *args):
+    return logging.LogRecord("test", logging.INFO, __file__, 0, message, args, None)
+
+
+@pytest.fixture
+def name():
+    """A logger name no other test has configured."""
+    return f"test-{uuid.uuid4().hex}"
+
+
+def test_drop_overflow_discards_and_reports_once_there_is_room():
+    log_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue, overflow="drop")
+
+    for index in range(5):
+        handler.handle(_record("record %d", index))
+
+    assert handler.dropped == 3
+    assert [log_queue.get_nowait().getMessage() for _ in range(2)] == ["record 0", "record 1"]
+
+    handler.handle(_record("record %d", 5))
+
+    warning, record = log_queue.get_nowait(), log_queue.get_nowait()
+    assert warning.levelno == logging.WARNING
+    assert warning.getMessage() == "Log queue full: dropped 3 record(s)."
+    assert record.getMessage() == "record 5"
+    assert handler.dropped == 3
+
+
+def test_block_overflow_waits_for_room():
+    log_queue = queue.Queue(maxsize=1)
+    handler = BoundedQueueHandler(log_queue, overflow="block")
+    handler.handle(_record("first"))
+
+    second = threading.Thread(target=handler.handle, args=(_record("second"),), daemon=True)
+    second.start()
+    second.join(0.1)
+    assert second.is_alive()
+
+    assert log_queue.get_nowait().getMessage() == "first"
+    second.join(1)
+    assert not second.is_alive()
+    assert log_queue.get_nowait().getMessage() == "second"
+    assert handler.dropped == 0
+
+
+def test_invalid_overflow_is_rejected():
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(queue.Queue(), overflow="spill")
+
+
+def test_messages_are_formatted_on_the_calling_thread():
+    log_queue = queue.Queue()
+    handler = BoundedQueueHandler(log_queue)
+    value = ["before"]
+
+    handler.handle(_record("value %s", value))
+    value[0] = "after"
+
+    assert log_queue.get_nowait().getMessage() == "value ['before']"
+
+
+def test_queued_json_lines(name, tmp_path):
+    path = str(tmp_path / "json.log")
+    log = Logger(name, path, queued=True, json_lines=True).get_logger()
+
+    log.info("plain %s", "message")
+    try:
+        raise KeyError("boom")
+    except KeyError:
+        log.exception("failed")
+    logger_module.shutdown()
+
+    with open(path, encoding="utf-8") as handle:
+        entries = [json.loads(line) for line in handle]
+    assert [(entry["level"], entry["message"]) for entry in entries] == [("INFO", "plain message"), ("ERROR", "failed")]
+    assert entries[0]["logger"] == name
+    assert entries[0]["ts"].endswith("+00:00")
+    assert "KeyError: 'boom'" in entries[1]["exc_info"]
+
+
+def test_queued_size_rotation(name, tmp_path):
+    path = str(tmp_path / "rotating.log")
+    log = Logger(name, path, queued=True, max_bytes=2048, backup_count=2).get_logger()
+
+    for index in range(200):
+        log.info("line %04d %s", index, "x" * 40)
+    logger_module.shutdown()
+
+    assert sorted(os.listdir(tmp_path)) == ["rotating.log", "rotating.log.1", "rotating.log.2"]
+    assert all(os.path.getsize(tmp_path / file) <= 2048 for file in os.listdir(tmp_path))
+    with open(path, encoding="utf-8") as handle:
+        assert handle.read().rstrip().endswith(f"line 0199 {'x' * 40}")
+
+
+def test_bare_file_names_go_to_log_dir(name, log_dir):
+    Logger(name, f"{name}.log").get_logger().warning("placed")
+
+    assert os.path.exists(os.path.join(log_dir, f"{name}.log"))
+
+
+def test_pending_records_are_written_at_exit(tmp_path):
+    path = str(tmp_path / "exit.log")
+    script = (
+        "from utils.logger import Logger\n"
+        f"log = Logger('exit', {path!r}, queued=True).get_logger()\n"
+        "for index in range(5000):\n"
+        "    log.info('record %d', index)\n"
+    )
+
+    subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True, timeout=60)
+
+    with open(path, encoding="utf-8") as handle:
+        lines = handle.read().splitlines()
+    assert len(lines) == 5000
+    assert lines[-1].endswith("record 4999")
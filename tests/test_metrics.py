@@ -0,0 +1,97 @@
+import os
+
+import pytest
+
+from google_cloud_components.cache import BlobDiskCache
+from google_cloud_components.cloud_storage import GCPStorage
+from google_cloud_components.metrics import StorageMetrics
+
+
+@pytest.fixture
+def metrics():
+    return StorageMetrics()
+
+
+@pytest.fixture
+def measured(server, credentials, metrics, tmp_path):
+    """A GCPStorage recording into ``metrics``, with a disk blob cache."""
+    return GCPStorage(
+        credentials,
+        api_endpoint=server.endpoint,
+        checkpoint_dir=os.path.join(tmp_path, "checkpoints"),
+        blob_cache=BlobDiskCache(os.path.join(tmp_path, "blob-cache")),
+        shared_client=False,
+        quiet=True,
+        metrics=metrics,
+    )
+
+
+def test_bucket_label_comes_from_the_bucket_argument(server, measured, metrics, tmp_path):
+    local_dir = os.path.join(tmp_path, "tree")
+    os.makedirs(local_dir)
+    with open(os.path.join(local_dir, "a.txt"), "wb") as handle:
+        handle.write(b"hello")
+    server.create_bucket("archive")
+
+    measured.sync(local_dir, "test-bucket", prefix="tree/")
+    measured.copy_prefix("test-bucket", "tree/", "archive")
+    measured.get_bucket_metadata(bucket_name="test-bucket")
+    measured.list_buckets()
+
+    assert set(metrics.snapshot()) == {
+        ("sync", "test-bucket"),
+        ("copy_prefix", "test-bucket"),
+        ("get_bucket_metadata", "test-bucket"),
+        ("list_buckets", ""),
+    }
+
+
+def test_nested_upload_is_recorded_once(measured, metrics, tmp_path):
+    measured.resumable_upload_threshold = 1
+    source = os.path.join(tmp_path, "payload.bin")
+    with open(source, "wb") as handle:
+        handle.write(os.urandom(1000))
+
+    assert measured.create_blob("test-bucket", source, "payload.bin")
+
+    snapshot = metrics.snapshot()
+    assert list(snapshot) == [("create_blob", "test-bucket")]
+    assert snapshot[("create_blob", "test-bucket")]["count"] == 1
+    assert snapshot[("create_blob", "test-bucket")]["bytes_sent"] == 1000
+
+
+def test_write_ndjson_counts_the_bytes_stored(server, measured, metrics):
+    result = measured.write_ndjson("test-bucket", "rows.json.gz", ({"id": i} for i in range(100)), compression="gzip")
+
+    assert result["status"] == "uploaded"
+    stored = len(server.buckets["test-bucket"]["objects"]["rows.json.gz"].data)
+    snapshot = metrics.snapshot()
+    assert list(snapshot) == [("write_ndjson", "test-bucket")]
+    assert snapshot[("write_ndjson", "test-bucket")]["bytes_sent"] == stored
+
+
+def test_disk_cache_hits_report_no_bytes_received(server, measured, metrics):
+    server.put_object("test-bucket", "reference.csv", b"x" * 4096)
+
+    assert measured.read_blob("test-bucket", "reference.csv") == b"x" * 4096
+    first = metrics.snapshot()[("read_blob", "test-bucket")]
+    assert measured.read_blob("test-bucket", "reference.csv") == b"x" * 4096
+    second = metrics.snapshot()[("read_blob", "test-bucket")]
+
+    assert first["bytes_received"] == 4096
+    assert second["count"] == 2
+    assert second["bytes_received"] == 4096
+    assert {operation for operation, _ in metrics.snapshot()} == {"read_blob"}
+
+    path = measured.get_cached_blob_path("test-bucket", "reference.csv")
+    assert os.path.getsize(path) == 4096
+    assert metrics.snapshot()[("get_cached_blob_path", "test-bucket")]["bytes_received"] == 0
+
+
+def test_metrics_without_cache_count_downloaded_bytes(server, measured, metrics):
+    measured.blob_cache = None
+    server.put_object("test-bucket", "reference.csv", b"y" * 100)
+
+    measured.read_blob("test-bucket", "reference.csv")
+
+    assert metrics.snapshot()[("read_blob", "test-bucket")]["bytes_received"] == 100
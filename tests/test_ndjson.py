@@ -0,0 +1,99 @@
+import gzip
+import json
+
+import pytest
+from google.cloud import exceptions
+
+from google_cloud_components.ndjson import encode_ndjson, iter_ndjson, new_stats
+
+RECORDS = [
+    {"id": 1, "city": "Zürich"},
+    {"id": 2, "text": "日本語 \U0001f600"},
+    {"id": 3, "nested": {"values": [1, 2, 3]}},
+]
+PAYLOAD = b"".join(encode_ndjson(RECORDS))
+
+
+def _split(data, size):
+    """Cuts ``data`` into chunks of ``size`` bytes, ignoring line and character boundaries."""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 64])
+def test_records_split_across_chunks_are_reassembled(size):
+    stats = new_stats()
+
+    assert list(iter_ndjson(_split(PAYLOAD, size), stats)) == RECORDS
+    assert (stats["records"], stats["malformed"], stats["bytes_read"]) == (3, 0, len(PAYLOAD))
+
+
+def test_multibyte_characters_split_between_chunks():
+    line = json.dumps({"emoji": "\U0001f600"}, ensure_ascii=False).encode("utf-8") + b"\n"
+    middle = line.index("\U0001f600".encode("utf-8")) + 2
+
+    assert list(iter_ndjson([line[:middle], line[middle:]])) == [{"emoji": "\U0001f600"}]
+
+
+def test_final_line_without_newline_is_parsed():
+    stats = new_stats()
+
+    assert list(iter_ndjson([b'{"id": 1}\n{"id"', b': 2}'], stats)) == [{"id": 1}, {"id": 2}]
+    assert stats["lines"] == 2
+
+
+def test_blank_and_malformed_lines_are_skipped_and_counted():
+    stats = new_stats()
+
+    assert list(iter_ndjson([b'{"id": 1}\n\n{broken\n\xff\n{"id": 2}\n'], stats)) == [{"id": 1}, {"id": 2}]
+    assert (stats["records"], stats["malformed"], stats["lines"]) == (2, 2, 5)
+
+
+def test_encode_groups_lines_into_chunks():
+    stats = {}
+    chunks = list(encode_ndjson(({"id": i} for i in range(100)), chunk_size=100, stats=stats))
+
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    assert all(len(chunk) >= 100 for chunk in chunks[:-1])
+    assert stats == {"records": 100, "bytes": sum(len(chunk) for chunk in chunks)}
+
+
+@pytest.mark.parametrize("data", [PAYLOAD, PAYLOAD.rstrip(b"\n")], ids=["newline", "no-final-newline"])
+def test_stream_ndjson_with_ranges_smaller_than_a_line(server, storage, data):
+    server.put_object("test-bucket", "records.ndjson", data)
+    stats = {}
+
+    records = list(storage.stream_ndjson("test-bucket", "records.ndjson", chunk_size=5, stats=stats))
+
+    assert records == RECORDS
+    assert stats["chunks"] == -(-len(data) // 5)
+    assert stats["bytes_read"] == len(data)
+
+
+def test_stream_ndjson_batches(server, storage):
+    server.put_object("test-bucket", "records.ndjson", PAYLOAD)
+
+    batches = list(storage.stream_ndjson("test-bucket", "records.ndjson", chunk_size=16, batch_size=2))
+
+    assert batches == [RECORDS[:2], RECORDS[2:]]
+
+
+def test_stream_ndjson_decompresses_gzip_objects(server, storage):
+    records = [{"id": i, "name": f"récord {i}"} for i in range(500)]
+    result = storage.write_ndjson("test-bucket", "records.ndjson.gz", records, compression="gzip")
+    stored = server.buckets["test-bucket"]["objects"]["records.ndjson.gz"]
+
+    assert result["status"] == "uploaded"
+    assert stored.metadata["contentEncoding"] == "gzip"
+    assert gzip.decompress(stored.data) == b"".join(encode_ndjson(records))
+    assert list(storage.stream_ndjson("test-bucket", "records.ndjson.gz", chunk_size=97)) == records
+
+
+def test_read_blob_content_returns_every_record(server, storage):
+    server.put_object("test-bucket", "records.ndjson", PAYLOAD + b"not json\n")
+
+    assert storage.read_blob_content("test-bucket", "records.ndjson") == RECORDS
+
+
+def test_stream_ndjson_raises_not_found(storage):
+    with pytest.raises(exceptions.NotFound):
+        list(storage.stream_ndjson("test-bucket", "missing.ndjson"))
@@ -0,0 +1,158 @@
+import base64
+import os
+
+import google_crc32c
+
+from google_cloud_components.cloud_storage import GCPStorage
+from google_cloud_components.transfer import TransferCheckpoint
+
+CHUNK_SIZE = 256 * 1024
+SIZE = 4 * CHUNK_SIZE + 1000
+
+
+def _write(path, size=SIZE):
+    data = os.urandom(size)
+    with open(path, "wb") as handle:
+        handle.write(data)
+    return data
+
+
+def _crc32c(data):
+    return base64.b64encode(google_crc32c.value(data).to_bytes(4, "big")).decode("ascii")
+
+
+def _restarted(server, credentials, storage):
+    """A new GCPStorage sharing ``storage``'s checkpoint directory, like a restarted process."""
+    return GCPStorage(
+        credentials, api_endpoint=server.endpoint, checkpoint_dir=storage.checkpoint_dir,
+        shared_client=False, quiet=True
+    )
+
+
+def _interrupt_upload(server, storage, source, cut):
+    """Starts an upload that dies (no retries) once the server holds ``cut`` bytes."""
+    server.inject_failure("PUT upload", status=503, after_bytes=cut % CHUNK_SIZE, skip=cut // CHUNK_SIZE)
+    result = storage.upload_resumable("test-bucket", source, "payload.bin", chunk_size=CHUNK_SIZE, retries=0)
+    assert result["status"] == "failed"
+    assert os.path.exists(result["checkpoint"])
+    return result
+
+
+def test_upload_resumes_from_checkpointed_offset(server, credentials, storage, tmp_path):
+    source = os.path.join(tmp_path, "payload.bin")
+    data = _write(source)
+    cut = 2 * CHUNK_SIZE + 1234
+    interrupted = _interrupt_upload(server, storage, source, cut)
+    # The checkpoint holds the last acknowledged chunk; the session itself kept the partial one too.
+    assert TransferCheckpoint(interrupted["checkpoint"]).load()["offset"] == 2 * CHUNK_SIZE
+
+    result = _restarted(server, credentials, storage).upload_resumable(
+        "test-bucket", source, "payload.bin", chunk_size=CHUNK_SIZE
+    )
+
+    assert result["status"] == "uploaded"
+    assert result["resumed_from"] == cut
+    assert TransferCheckpoint(interrupted["checkpoint"]).load() is None
+    assert result["bytes"] == SIZE
+    stored = server.buckets["test-bucket"]["objects"]["payload.bin"]
+    assert stored.data == data
+    assert stored.crc32c == _crc32c(data)
+    assert not os.path.exists(interrupted["checkpoint"])
+
+
+def test_upload_retries_in_process_from_acknowledged_offset(server, storage, tmp_path):
+    source = os.path.join(tmp_path, "payload.bin")
+    data = _write(source)
+    server.inject_failure("PUT upload", status=503, after_bytes=100, skip=1)
+
+    result = storage.upload_resumable("test-bucket", source, "payload.bin", chunk_size=CHUNK_SIZE)
+
+    assert result["status"] == "uploaded"
+    assert result["retries"] == 1
+    assert result["resumed_from"] == 0
+    assert server.buckets["test-bucket"]["objects"]["payload.bin"].data == data
+
+
+def test_upload_discards_checkpoint_of_changed_source(server, storage, tmp_path):
+    source = os.path.join(tmp_path, "payload.bin")
+    _write(source)
+    _interrupt_upload(server, storage, source, 2 * CHUNK_SIZE)
+    data = _write(source, SIZE + 10)
+
+    result = storage.upload_resumable("test-bucket", source, "payload.bin", chunk_size=CHUNK_SIZE)
+
+    assert result["status"] == "uploaded"
+    assert result["resumed_from"] == 0
+    assert server.buckets["test-bucket"]["objects"]["payload.bin"].data == data
+
+
+def test_upload_fatal_error_is_not_retried(server, storage, tmp_path):
+    source = os.path.join(tmp_path, "payload.bin")
+    _write(source)
+    server.inject_failure("PUT upload", status=403)
+
+    result = storage.upload_resumable("test-bucket", source, "payload.bin", chunk_size=CHUNK_SIZE)
+
+    assert result["status"] == "failed"
+    assert result["retries"] == 0
+    assert result["error_type"] == "Forbidden"
+
+
+def test_download_resumes_from_partial_file(server, credentials, storage, tmp_path):
+    data = os.urandom(SIZE)
+    server.put_object("test-bucket", "payload.bin", data)
+    destination = os.path.join(tmp_path, "download.bin")
+    cut = SIZE // 2 + 17
+    server.inject_failure("GET download", status=200, after_bytes=cut)
+
+    interrupted = storage.download_resumable("test-bucket", "payload.bin", destination, retries=0)
+
+    assert interrupted["status"] == "failed"
+    assert not os.path.exists(destination)
+    # Whatever reached the partial file before the connection dropped is kept and checkpointed.
+    received = os.path.getsize(f"{destination}.part")
+    assert 0 < received <= cut
+    assert TransferCheckpoint(interrupted["checkpoint"]).load()["offset"] == received
+
+    result = _restarted(server, credentials, storage).download_resumable("test-bucket", "payload.bin", destination)
+
+    assert result["status"] == "downloaded"
+    assert result["resumed_from"] == received
+    assert server.request_counts["GET download"] == 2
+    with open(destination, "rb") as handle:
+        assert handle.read() == data
+    assert not os.path.exists(f"{destination}.part")
+    assert not os.path.exists(result["checkpoint"])
+
+
+def test_download_restarts_when_object_changed(server, storage, tmp_path):
+    server.put_object("test-bucket", "payload.bin", os.urandom(SIZE))
+    destination = os.path.join(tmp_path, "download.bin")
+    server.inject_failure("GET download", status=200, after_bytes=SIZE // 2)
+    assert storage.download_resumable("test-bucket", "payload.bin", destination, retries=0)["status"] == "failed"
+    data = os.urandom(SIZE)
+    server.put_object("test-bucket", "payload.bin", data)
+
+    result = storage.download_resumable("test-bucket", "payload.bin", destination)
+
+    assert result["status"] == "downloaded"
+    assert result["resumed_from"] == 0
+    with open(destination, "rb") as handle:
+        assert handle.read() == data
+
+
+def test_sliced_download_retries_only_the_failed_slice(server, storage, tmp_path):
+    data = os.urandom(SIZE)
+    server.put_object("test-bucket", "payload.bin", data)
+    storage.MIN_SLICE_SIZE = CHUNK_SIZE
+    server.inject_failure("GET download", status=200, after_bytes=1000)
+
+    result = storage.download_blob("test-bucket", "payload.bin", os.path.join(tmp_path, "download.bin"), slices=4)
+
+    assert result["status"] == "downloaded"
+    assert result["slices"] == 4
+    assert result["retries"] == 1
+    # Four slices plus one ranged request for the rest of the interrupted slice.
+    assert server.request_counts["GET download"] == 5
+    with open(result["destination"], "rb") as handle:
+        assert handle.read() == data
@@ -0,0 +1,144 @@
+import os
+import sqlite3
+import time
+
+import pytest
+
+CHUNK = 1024
+
+
+def _objects(server, bucket):
+    return server.buckets[bucket]["objects"]
+
+
+@pytest.fixture
+def source(server):
+    """Ten objects under ``json/`` in ``test-bucket`` and an empty ``other-bucket``."""
+    server.create_bucket("other-bucket")
+    for index in range(10):
+        server.put_object("test-bucket", f"json/{index:02d}.json", bytes([index]) * (index + 1))
+    server.put_object("test-bucket", "csv/reference.csv", b"a,b\n")
+    return server
+
+
+def _checkpoints(storage):
+    directory = storage.checkpoint_dir
+    return [name for name in os.listdir(directory) if name.endswith(".sqlite")] if os.path.isdir(directory) else []
+
+
+def test_copy_prefix_copies_under_the_new_prefix(source, storage):
+    report = storage.copy_prefix("test-bucket", "json/", "other-bucket", "copied/")
+
+    assert report["summary"]["copied"] == 10
+    assert report["summary"]["bytes"] == sum(range(1, 11))
+    assert sorted(_objects(source, "other-bucket")) == [f"copied/{index:02d}.json" for index in range(10)]
+    assert _objects(source, "other-bucket")["copied/03.json"].data == b"\x03" * 4
+    assert len(_objects(source, "test-bucket")) == 11
+    assert _checkpoints(storage) == []
+
+
+def test_interrupted_copy_resumes_without_recopying(source, storage):
+    def interrupt(done, failed):
+        if done == 4:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        storage.copy_prefix("test-bucket", "json/", "other-bucket", max_workers=1, progress=interrupt)
+    assert len(_checkpoints(storage)) == 1
+    already = len(_objects(source, "other-bucket"))
+    rewrites = source.request_counts["POST storage"]
+
+    report = storage.copy_prefix("test-bucket", "json/", "other-bucket", max_workers=1)
+
+    assert already >= 4
+    assert report["summary"]["skipped"] == already
+    assert report["summary"]["copied"] == 10 - already
+    assert source.request_counts["POST storage"] - rewrites == 10 - already
+    assert _checkpoints(storage) == []
+
+
+def test_changed_source_is_copied_again(source, storage):
+    source.inject_failure("POST storage", status=403, count=1, skip=9)
+    first = storage.copy_prefix("test-bucket", "json/", "other-bucket", max_workers=1)
+    assert first["summary"]["failed"] == 1
+    source.put_object("test-bucket", "json/00.json", b"changed")
+
+    report = storage.copy_prefix("test-bucket", "json/", "other-bucket", max_workers=1)
+
+    assert report["summary"]["failed"] == 0
+    assert report["summary"]["copied"] == 2
+    assert _objects(source, "other-bucket")["json/00.json"].data == b"changed"
+
+
+def test_multi_call_rewrite_continues_from_its_token(source, storage, tmp_path):
+    source.rewrite_chunk = CHUNK
+    source.put_object("test-bucket", "big/blob.bin", os.urandom(4 * CHUNK))
+    checkpoint_path = str(tmp_path / "rewrite.sqlite")
+    # The third of four calls fails with a status that is not retried.
+    source.inject_failure("POST storage", status=403, count=1, skip=2)
+
+    first = storage.copy_prefix("test-bucket", "big/", "other-bucket", checkpoint_path=checkpoint_path)
+
+    assert first["results"][0]["status"] == "failed"
+    with sqlite3.connect(checkpoint_path) as db:
+        rewritten, token, done = db.execute("SELECT bytes, rewrite_token, done FROM objects").fetchone()
+    assert (rewritten, bool(token), done) == (2 * CHUNK, True, 0)
+
+    report = storage.copy_prefix("test-bucket", "big/", "other-bucket", checkpoint_path=checkpoint_path)
+
+    assert report["results"][0]["status"] == "copied"
+    assert report["results"][0]["rewrites"] == 2
+    copied = _objects(source, "other-bucket")["big/blob.bin"].data
+    assert copied == _objects(source, "test-bucket")["big/blob.bin"].data
+    assert not os.path.exists(checkpoint_path)
+
+
+def test_storage_class_change_in_place(source, storage):
+    report = storage.copy_prefix("test-bucket", "csv/", "test-bucket", storage_class="NEARLINE")
+
+    assert report["summary"]["copied"] == 1
+    assert _objects(source, "test-bucket")["csv/reference.csv"].metadata["storageClass"] == "NEARLINE"
+
+
+def test_max_ops_per_sec_caps_the_call_rate(source, storage):
+    storage.storage_client  # Authenticate before timing.
+    started = time.perf_counter()
+
+    report = storage.copy_prefix("test-bucket", "json/", "other-bucket", max_workers=8, max_ops_per_sec=20)
+
+    elapsed = time.perf_counter() - started
+    assert report["summary"]["rewrites"] == 10
+    # A burst of two goes through at once; the other eight wait 1/20 s each.
+    assert elapsed >= 0.35
+
+
+def test_move_prefix_deletes_sources_only_after_their_copy(source, storage):
+    source.inject_failure("POST storage", status=403, count=1, skip=3)
+
+    report = storage.move_prefix("test-bucket", "json/", "other-bucket", "moved/", max_workers=1)
+
+    assert report["summary"]["copied"] == 9
+    assert report["summary"]["deleted"] == 9
+    failed = [r["name"] for r in report["results"] if r["status"] == "failed"]
+    assert len(failed) == 1
+    assert [name for name in _objects(source, "test-bucket") if name.startswith("json/")] == failed
+    assert "moved/" + failed[0][len("json/"):] not in _objects(source, "other-bucket")
+
+    retry = storage.move_prefix("test-bucket", "json/", "other-bucket", "moved/", max_workers=1)
+
+    assert retry["summary"]["copied"] == 1
+    assert not [name for name in _objects(source, "test-bucket") if name.startswith("json/")]
+    assert len(_objects(source, "other-bucket")) == 10
+
+
+def test_move_leaves_a_source_changed_after_listing(source, storage):
+    def rewrite_then_change(done, failed):
+        # Overwrite the next object once the first is moved: its listed generation goes stale.
+        if done == 1:
+            source.put_object("test-bucket", "json/09.json", b"newer")
+
+    report = storage.move_prefix("test-bucket", "json/", "other-bucket", max_workers=1, progress=rewrite_then_change)
+
+    failed = [r for r in report["results"] if r["status"] == "failed"]
+    assert [r["name"] for r in failed] == ["json/09.json"]
+    assert _objects(source, "test-bucket")["json/09.json"].data == b"newer"
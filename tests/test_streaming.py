@@ -0,0 +1,31 @@
+import gzip
+import io
+
+import pytest
+
+
+@pytest.mark.parametrize("source, expected", [
+    (io.BytesIO(b""), b""),
+    (io.StringIO(""), b""),
+    (io.BytesIO(b"binary payload"), b"binary payload"),
+    (io.StringIO("text payload \u00e9"), "text payload \u00e9".encode("utf-8")),
+    (["a", b"b", "c"], b"abc"),
+])
+def test_upload_stream_sources(server, storage, source, expected):
+    result = storage.upload_stream("test-bucket", "stream.txt", source)
+
+    assert result["status"] == "uploaded"
+    assert result["bytes"] == len(expected)
+    assert server.buckets["test-bucket"]["objects"]["stream.txt"].data == expected
+
+
+def test_upload_stream_text_file_is_compressed(server, storage, tmp_path):
+    path = tmp_path / "rows.txt"
+    path.write_text("line\n" * 1000, encoding="utf-8")
+
+    with open(path, "r", encoding="utf-8") as handle:
+        result = storage.upload_stream("test-bucket", "rows.txt.gz", handle, compression="gzip")
+
+    assert result["status"] == "uploaded"
+    stored = server.buckets["test-bucket"]["objects"]["rows.txt.gz"].data
+    assert gzip.decompress(stored) == b"line\n" * 1000
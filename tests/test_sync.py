@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+
+def _objects(server):
+    return server.buckets["test-bucket"]["objects"]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A small local tree: two files at the top and one nested."""
+    root = tmp_path / "tree"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.txt").write_bytes(b"alpha")
+    (root / "b.txt").write_bytes(b"bravo")
+    (root / "sub" / "c.txt").write_bytes(b"charlie")
+    return root
+
+
+def test_first_run_uploads_everything(server, storage, tree):
+    report = storage.sync(str(tree), "test-bucket", prefix="backup/")
+
+    assert report["summary"]["uploaded"] == 3
+    assert report["summary"]["bytes"] == len(b"alphabravocharlie")
+    assert sorted(_objects(server)) == ["backup/a.txt", "backup/b.txt", "backup/sub/c.txt"]
+    assert _objects(server)["backup/sub/c.txt"].data == b"charlie"
+
+
+def test_unchanged_tree_is_a_no_op(server, storage, tree):
+    storage.sync(str(tree), "test-bucket", prefix="backup/")
+    uploads = server.request_counts.get("POST upload", 0)
+
+    report = storage.sync(str(tree), "test-bucket", prefix="backup/")
+
+    assert report["summary"]["skipped"] == 3
+    assert report["summary"]["uploaded"] == 0
+    assert report["results"] == []
+    assert server.request_counts.get("POST upload", 0) == uploads
+
+
+def test_only_changed_files_are_uploaded(server, storage, tree):
+    storage.sync(str(tree), "test-bucket", prefix="backup/")
+    (tree / "b.txt").write_bytes(b"bravo, again")
+    # Same size and content, new mtime: hashed, found unchanged and not uploaded.
+    stat = os.stat(tree / "a.txt")
+    os.utime(tree / "a.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    report = storage.sync(str(tree), "test-bucket", prefix="backup/")
+
+    assert [(r["path"], r["status"]) for r in report["results"]] == [("b.txt", "uploaded")]
+    assert report["summary"]["adopted"] == 1
+    assert _objects(server)["backup/b.txt"].data == b"bravo, again"
+
+
+def test_existing_remote_objects_are_adopted(server, storage, tree):
+    server.put_object("test-bucket", "backup/a.txt", b"alpha")
+
+    report = storage.sync(str(tree), "test-bucket", prefix="backup/")
+
+    assert report["summary"]["adopted"] == 1
+    assert report["summary"]["uploaded"] == 2
+
+
+def test_delete_removes_remote_copies_of_removed_files(server, storage, tree):
+    storage.sync(str(tree), "test-bucket", prefix="backup/")
+    os.remove(tree / "sub" / "c.txt")
+
+    dry_run = storage.sync(str(tree), "test-bucket", prefix="backup/", delete=True, dry_run=True)
+    assert [(r["path"], r["status"]) for r in dry_run["results"]] == [("sub/c.txt", "would_delete")]
+    assert "backup/sub/c.txt" in _objects(server)
+
+    report = storage.sync(str(tree), "test-bucket", prefix="backup/", delete=True)
+    assert report["summary"]["deleted"] == 1
+    assert "backup/sub/c.txt" not in _objects(server)
+    assert storage.sync(str(tree), "test-bucket", prefix="backup/", delete=True)["summary"]["deleted"] == 0
+
+
+def test_manifests_are_never_uploaded(server, storage, tree, tmp_path):
+    storage.sync(str(tree), "test-bucket", prefix="backup/")
+    assert (tree / ".gcs_sync_manifest.sqlite").exists()
+
+    # A later run keeping its manifest elsewhere must still skip the default one left in the tree.
+    elsewhere = str(tmp_path / "manifest.sqlite")
+    report = storage.sync(str(tree), "test-bucket", prefix="mirror/", manifest_path=elsewhere)
+
+    assert report["summary"]["uploaded"] == 3
+    assert not [name for name in _objects(server) if ".gcs_sync_manifest" in name]
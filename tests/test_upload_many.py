@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+
+def _objects(server):
+    return server.buckets["test-bucket"]["objects"]
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Ten small local files under ``tmp_path/data``."""
+    directory = tmp_path / "data"
+    (directory / "nested").mkdir(parents=True)
+    paths = []
+    for index in range(10):
+        path = directory / ("nested" if index % 2 else "") / f"f{index}.txt"
+        path.write_bytes(b"x" * (index + 1))
+        paths.append(str(path))
+    return paths
+
+
+def test_pairs_upload_under_their_destination(server, storage, files):
+    report = storage.upload_many("test-bucket", [(path, f"pairs/{i}.txt") for i, path in enumerate(files)])
+
+    assert report["summary"]["succeeded"] == 10
+    assert report["summary"]["bytes"] == sum(range(1, 11))
+    assert sorted(_objects(server)) == sorted(f"pairs/{i}.txt" for i in range(10))
+    assert _objects(server)["pairs/3.txt"].data == b"x" * 4
+
+
+def test_absolute_bare_paths_use_their_file_name(server, storage, files):
+    report = storage.upload_many("test-bucket", files[:2])
+
+    assert [r["status"] for r in report["results"]] == ["uploaded", "uploaded"]
+    assert sorted(_objects(server)) == ["f0.txt", "f1.txt"]
+
+
+def test_bare_paths_are_named_relative_to_base_dir(server, storage, files, tmp_path):
+    report = storage.upload_many("test-bucket", files[:2] + [str(tmp_path)], base_dir=tmp_path / "data")
+
+    statuses = {r["source"]: r["status"] for r in report["results"]}
+    assert statuses[str(tmp_path)] == "failed"
+    assert sorted(_objects(server)) == ["f0.txt", "nested/f1.txt"]
+    assert not any(name.startswith("/") for name in _objects(server))
+
+
+def test_relative_bare_paths_keep_their_name(server, storage, files, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    storage.upload_many("test-bucket", [os.path.join("data", "nested", "f1.txt")])
+
+    assert list(_objects(server)) == ["data/nested/f1.txt"]
+
+
+def test_failures_are_reported_per_file(server, storage, files):
+    server.inject_failure("POST upload", status=403, count=1, skip=2)
+
+    report = storage.upload_many("test-bucket", files[:5] + ["missing.txt"], max_workers=1)
+
+    failed = [r for r in report["results"] if r["status"] == "failed"]
+    assert report["summary"]["failed"] == len(failed) == 2
+    assert report["summary"]["succeeded"] == 4
+    assert all(r["error"] for r in failed)
+    assert "missing.txt" in [r["source"] for r in failed]
+
+
+def test_missing_bucket_fails_each_file(storage, files):
+    report = storage.upload_many("missing-bucket", files[:3])
+
+    assert report["summary"]["failed"] == 3
+    assert all(r["error"] == "Bucket 'missing-bucket' not found." for r in report["results"])
+
+
+def test_concurrency_is_bounded_by_max_workers(server, storage, files):
+    storage.storage_client  # Authenticate before measuring.
+    server.latency = 0.05
+
+    report = storage.upload_many("test-bucket", files, max_workers=3)
+
+    assert report["summary"]["succeeded"] == 10
+    assert 1 < server.max_in_flight <= 3
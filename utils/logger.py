@@ -1,22 +1,195 @@
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+from datetime import datetime, timezone
+
+# Directory relative log file names are placed in; created on first use.
+LOG_DIR = os.environ.get("GCC_LOG_DIR", "log")
+
+# Listeners of queued loggers, keyed by logger name, stopped (and drained) at exit.
+_LISTENERS = {}
+_LISTENERS_LOCK = threading.Lock()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats each record as one JSON object per line, for log ingestion pipelines.
+
+    Every line carries ``ts`` (UTC, ISO 8601), ``level``, ``logger``, ``thread`` and
+    ``message``, plus ``exc_info`` when an exception was logged.
+    """
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a bounded queue that either drops or blocks when it is full.
+
+    With ``overflow="drop"`` a full queue never stalls the caller: the record is
+    counted and discarded, and a single warning with the number of dropped records
+    is queued as soon as there is room again. With ``overflow="block"`` the caller
+    waits for the writer thread (backpressure) and nothing is lost.
+    """
+    def __init__(self, log_queue, overflow="block"):
+        if overflow not in ("drop", "block"):
+            raise ValueError("overflow must be 'drop' or 'block'.")
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.dropped = 0
+        self._unreported = 0
+
+    def handle(self, record):
+        # The queue is thread-safe already; skip the handler lock every caller would contend on.
+        accepted = self.filter(record)
+        if accepted:
+            self.emit(record)
+        return accepted
+
+    def emit(self, record):
+        if self.overflow == "drop" and self.queue.full():
+            # Cheap early exit: do not even format a record that would be dropped.
+            with self.lock:
+                self.dropped += 1
+                self._unreported += 1
+            return
+        try:
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def prepare(self, record):
+        """
+        Freezes the message on the caller's thread, without the copy QueueHandler makes.
+
+        The queue never leaves the process, so exception info can stay on the record
+        for the writer thread to format.
+        """
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+        try:
+            if self._unreported:
+                with self.lock:
+                    dropped, self._unreported = self._unreported, 0
+                self.queue.put_nowait(self._dropped_record(record.name, dropped))
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+                self._unreported += 1
+
+    @staticmethod
+    def _dropped_record(name, dropped):
+        """Helper building the warning that reports records dropped while the queue was full."""
+        return logging.LogRecord(
+            name, logging.WARNING, __file__, 0, "Log queue full: dropped %d record(s).", (dropped,), None
+        )
+
+
+class _BatchFlushMixin:
+    """Writer-thread handler mixin: flush once per drained burst of records instead of after every record."""
+
+    def flush(self):
+        pass
+
+    def flush_batch(self):
+        super().flush()
+
+
+# Writer-thread variants of the file handlers used in queued mode.
+_BATCHED_HANDLERS = {
+    handler_class: type(f"Batched{handler_class.__name__}", (_BatchFlushMixin, handler_class), {})
+    for handler_class in (
+        logging.FileHandler,
+        logging.handlers.RotatingFileHandler,
+        logging.handlers.TimedRotatingFileHandler,
+    )
+}
+
+
+class _DrainingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that flushes its handlers whenever it has caught up with the queue,
+    and whose stop sentinel waits for room, so shutdown works on a full bounded queue.
+    """
+
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush_batch()
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
 
 class Logger:
     """
     A class to create and manage a logger for an application.
 
-    Logs messages to both a specified file and the console.
+    Logs messages to a file, optionally with size- or time-based rotation and as
+    JSON lines. In queued mode the caller only puts the record on a bounded queue;
+    a background thread owns the file handler and does all formatting and file I/O,
+    so logging threads never contend on the file lock. Queued loggers are drained
+    and their files flushed at interpreter exit (or by :func:`shutdown`).
     It supports different log levels (DEBUG, INFO, WARNING, ERROR, CRITICAL).
     """
 
-    def __init__(self, name: str, log_file: str, log_level=logging.INFO):
+    def __init__(
+        self,
+        name: str,
+        log_file: str,
+        log_level=logging.INFO,
+        queued: bool = False,
+        max_bytes: int = 0,
+        backup_count: int = 5,
+        when: str = None,
+        json_lines: bool = False,
+        queue_size: int = 10000,
+        overflow: str = "block"
+    ):
         """
         Initializes the Logger instance.
 
+        Handlers are only attached the first time a given logger name is configured;
+        later instances for the same name reuse them.
+
         Args:
             name (str): The name of the logger, typically the module or application name.
-            log_file (str): The path to the log file where messages will be saved.
+            log_file (str): The path to the log file where messages will be saved. A bare
+                file name is placed in ``LOG_DIR`` (``log/`` unless ``GCC_LOG_DIR`` is set).
             log_level (int): The minimum logging level to output. Defaults to logging.INFO.
+            queued (bool): Hand records to a background writer thread. Defaults to False.
+            max_bytes (int): Rotate once the file reaches this size; 0 disables size rotation.
+            backup_count (int): Number of rotated files kept. Defaults to 5.
+            when (str, optional): Rotate on a schedule instead (``"midnight"``, ``"H"``, ...;
+                see ``TimedRotatingFileHandler``). Takes precedence over ``max_bytes``.
+            json_lines (bool): Write JSON lines instead of plain text. Defaults to False.
+            queue_size (int): Maximum records waiting for the writer thread. Defaults to 10000.
+            overflow (str): What a full queue does to callers: ``"block"`` (wait for the writer,
+                the default) or ``"drop"`` (count and discard).
         """
         # Create a custom logger with the specified name
         self.logger = logging.getLogger(name)
@@ -24,15 +197,42 @@ class Logger:
 
         # Check if handlers already exist to prevent duplicate log entries
         if not self.logger.handlers:
+            if not os.path.dirname(log_file):
+                log_file = os.path.join(LOG_DIR, log_file)
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+
             # Create a file handler to save logs to a file
-            file_handler = logging.FileHandler(log_file)
+            if when:
+                handler_class = logging.handlers.TimedRotatingFileHandler
+                options = {"when": when, "backupCount": backup_count}
+            elif max_bytes:
+                handler_class = logging.handlers.RotatingFileHandler
+                options = {"maxBytes": max_bytes, "backupCount": backup_count}
+            else:
+                handler_class = logging.FileHandler
+                options = {}
+            if queued:
+                handler_class = _BATCHED_HANDLERS[handler_class]
+            file_handler = handler_class(log_file, delay=True, **options)
             file_handler.setLevel(log_level)
 
             # Define the log format
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            if json_lines:
+                formatter = JsonLinesFormatter()
+            else:
+                formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             file_handler.setFormatter(formatter)
 
-            self.logger.addHandler(file_handler)
+            if queued:
+                log_queue = queue.Queue(maxsize=queue_size)
+                queue_handler = BoundedQueueHandler(log_queue, overflow=overflow)
+                listener = _DrainingQueueListener(log_queue, file_handler, respect_handler_level=True)
+                listener.start()
+                with _LISTENERS_LOCK:
+                    _LISTENERS[name] = (listener, queue_handler)
+                self.logger.addHandler(queue_handler)
+            else:
+                self.logger.addHandler(file_handler)
 
     def get_logger(self):
         """
@@ -43,6 +243,42 @@ class Logger:
         """
         return self.logger
 
+    def stats(self):
+        """
+        Returns the queue counters of a queued logger.
+
+        Returns:
+            dict or None: ``pending`` (records waiting for the writer) and ``dropped``,
+            or None if the logger is not queued.
+        """
+        with _LISTENERS_LOCK:
+            entry = _LISTENERS.get(self.logger.name)
+        if entry is None:
+            return None
+        listener, queue_handler = entry
+        return {"pending": listener.queue.qsize(), "dropped": queue_handler.dropped}
+
+
+def shutdown():
+    """
+    Stops every queued logger's writer thread after it has written all pending records.
+
+    Registered with ``atexit``; call it explicitly before ``os._exit`` or when a
+    forked worker is about to exit.
+    """
+    with _LISTENERS_LOCK:
+        entries = list(_LISTENERS.items())
+        _LISTENERS.clear()
+    for name, (listener, queue_handler) in entries:
+        logging.getLogger(name).removeHandler(queue_handler)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown)
+
+
 if __name__ == "__main__":
     # Define the log file path
     LOG_FILE_PATH = "log"